@@ -2,11 +2,25 @@
 
 import logging
 
+from .batch import SearchBatch, SearchSpec, search_many
+from .parser import ParseExecutor
+from .records import Transaction
 from .search import League, Search, TransactionType
+from .sharding import ShardedSearch
 
 # Library best practice: add NullHandler so log messages don't go to
 # stderr if the consuming application hasn't configured logging.
 # See https://docs.python.org/3/howto/logging.html#configuring-logging-for-a-library
 logging.getLogger(__name__).addHandler(logging.NullHandler())
 
-__all__ = ["League", "Search", "TransactionType"]
+__all__ = [
+    "League",
+    "ParseExecutor",
+    "Search",
+    "SearchBatch",
+    "SearchSpec",
+    "ShardedSearch",
+    "Transaction",
+    "TransactionType",
+    "search_many",
+]
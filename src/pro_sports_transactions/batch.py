@@ -0,0 +1,232 @@
+"""Batch execution of many searches.
+
+Runs many search specifications (e.g. every league and team) concurrently over
+one shared request handler, with a global cap on in-flight requests and an
+optional per-host cap.
+"""
+
+import asyncio
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from datetime import date
+from typing import TYPE_CHECKING, Dict, Iterable, Optional, Tuple, TypeVar
+from urllib import parse
+
+from .handlers import (
+    DirectConfig,
+    DirectRequestHandler,
+    HandlerResponse,
+    RequestHandler,
+)
+from .handlers.base_handler import Parse
+from .parser import ParseExecutor
+from .search import League, Search, TransactionType, UrlBuilder
+
+if TYPE_CHECKING:
+    from pandas import DataFrame
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class SearchSpec:
+    """Hashable description of one search, used to key batch results."""
+
+    league: League = League.NBA
+    transaction_types: Tuple[TransactionType, ...] = ()
+    start_date: Optional[date] = None
+    end_date: Optional[date] = None
+    player: Optional[str] = None
+    team: Optional[str] = None
+    starting_row: int = 0
+
+    def __post_init__(self):
+        # Accept any iterable of transaction types but store a tuple so the
+        # spec stays hashable
+        object.__setattr__(self, "transaction_types", tuple(self.transaction_types))
+
+    @property
+    def url(self) -> str:
+        """The search URL for this spec."""
+        return UrlBuilder.build(
+            league=self.league,
+            transaction_types=self.transaction_types,
+            start_date=self.start_date,
+            end_date=self.end_date,
+            player=self.player,
+            team=self.team,
+            starting_row=self.starting_row,
+        )
+
+    def search(
+        self,
+        request_handler: Optional[RequestHandler] = None,
+        parse_executor: Optional[ParseExecutor] = None,
+    ) -> Search:
+        """Create the Search for this spec."""
+        return Search(
+            league=self.league,
+            transaction_types=self.transaction_types,
+            start_date=self.start_date,
+            end_date=self.end_date,
+            player=self.player,
+            team=self.team,
+            starting_row=self.starting_row,
+            request_handler=request_handler,
+            parse_executor=parse_executor,
+        )
+
+
+@dataclass
+class BatchResult:
+    """Results of a batch, keyed by spec.
+
+    ``results`` holds a DataFrame for every spec that completed (including
+    specs whose pages reported errors). ``errors`` holds the error messages
+    for every spec that raised or whose result carries ``attrs['errors']``.
+    """
+
+    results: Dict[SearchSpec, "DataFrame"] = field(default_factory=dict)
+    errors: Dict[SearchSpec, Tuple[str, ...]] = field(default_factory=dict)
+
+
+class _LimitedRequestHandler(RequestHandler):
+    """Applies the batch's global and per-host limits to every request.
+
+    ``get_parsed()`` and ``fetch()`` are forwarded too, so wrappers of parsed
+    results (coalescing, caching, revalidation) in the shared handler still
+    apply.
+    """
+
+    def __init__(
+        self,
+        handler: RequestHandler,
+        max_concurrency: int,
+        per_host_limit: Optional[int],
+    ):
+        self._handler = handler
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._per_host_limit = per_host_limit
+        self._host_semaphores: Dict[str, asyncio.Semaphore] = {}
+
+    async def get(self, url: str, headers: Dict[str, str]) -> Optional[str]:
+        async with self._limit(url):
+            return await self._handler.get(url, headers)
+
+    async def fetch(self, url: str, headers: Dict[str, str]) -> HandlerResponse:
+        async with self._limit(url):
+            return await self._handler.fetch(url, headers)
+
+    async def get_parsed(self, url: str, headers: Dict[str, str], parse: Parse) -> T:
+        async with self._limit(url):
+            return await self._handler.get_parsed(url, headers, parse)
+
+    @asynccontextmanager
+    async def _limit(self, url: str):
+        """Hold the global and (if configured) per-host slots for ``url``."""
+        async with self._semaphore:
+            if self._per_host_limit is None:
+                yield
+                return
+            host = parse.urlparse(url).netloc
+            if host not in self._host_semaphores:
+                self._host_semaphores[host] = asyncio.Semaphore(self._per_host_limit)
+            async with self._host_semaphores[host]:
+                yield
+
+    async def aclose(self):
+        """Close the shared handler."""
+        await self._handler.aclose()
+
+
+class SearchBatch:
+    """Run many searches concurrently over one shared request handler.
+
+    Args:
+        specs: Searches to run; duplicates are run once
+        request_handler: Handler shared by every search. Defaults to a pooled
+            ``DirectRequestHandler`` owned (and closed) by the batch
+        max_concurrency: Maximum number of requests in flight across the batch
+        per_host_limit: Maximum number of requests in flight per host
+        all_pages: Fetch every page of each search instead of only its first
+        parse_executor: Pool to parse pages in, off the event loop. Defaults to
+            parsing on the event loop
+    """
+
+    def __init__(
+        self,
+        specs: Iterable[SearchSpec],
+        request_handler: Optional[RequestHandler] = None,
+        max_concurrency: int = 10,
+        per_host_limit: Optional[int] = None,
+        all_pages: bool = False,
+        parse_executor: Optional[ParseExecutor] = None,
+    ):
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        if per_host_limit is not None and per_host_limit < 1:
+            raise ValueError("per_host_limit must be at least 1")
+
+        self.specs = tuple(dict.fromkeys(specs))
+        self._request_handler = request_handler
+        self._max_concurrency = max_concurrency
+        self._per_host_limit = per_host_limit
+        self._all_pages = all_pages
+        self._parse_executor = parse_executor
+
+    async def run(self) -> BatchResult:
+        """Run every search and collect results and errors by spec."""
+        owned = self._request_handler is None
+        handler = self._request_handler or DirectRequestHandler(
+            DirectConfig(
+                limit=self._max_concurrency, limit_per_host=self._per_host_limit or 0
+            )
+        )
+        limited = _LimitedRequestHandler(
+            handler, self._max_concurrency, self._per_host_limit
+        )
+
+        async def run_spec(spec: SearchSpec) -> "DataFrame":
+            search = spec.search(limited, self._parse_executor)
+            if self._all_pages:
+                return await search.get_all_dataframe(self._max_concurrency)
+            return await search.get_dataframe()
+
+        try:
+            outcomes = await asyncio.gather(
+                *(run_spec(spec) for spec in self.specs), return_exceptions=True
+            )
+        finally:
+            if owned:
+                await handler.aclose()
+
+        batch = BatchResult()
+        for spec, outcome in zip(self.specs, outcomes, strict=True):
+            if isinstance(outcome, BaseException):
+                if not isinstance(outcome, Exception):
+                    raise outcome
+                batch.errors[spec] = (repr(outcome),)
+                continue
+            batch.results[spec] = outcome
+            if "errors" in outcome.attrs:
+                batch.errors[spec] = outcome.attrs["errors"]
+        return batch
+
+
+async def search_many(
+    specs: Iterable[SearchSpec],
+    request_handler: Optional[RequestHandler] = None,
+    max_concurrency: int = 10,
+    per_host_limit: Optional[int] = None,
+    all_pages: bool = False,
+    parse_executor: Optional[ParseExecutor] = None,
+) -> BatchResult:
+    """Run many searches concurrently; see ``SearchBatch`` for arguments."""
+    return await SearchBatch(
+        specs,
+        request_handler=request_handler,
+        max_concurrency=max_concurrency,
+        per_host_limit=per_host_limit,
+        all_pages=all_pages,
+        parse_executor=parse_executor,
+    ).run()
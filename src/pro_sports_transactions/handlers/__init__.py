@@ -6,14 +6,66 @@ allowing different strategies for bypassing Cloudflare protection and
 other network challenges.
 """
 
-from .base_handler import RequestConfig, RequestHandler
-from .direct_handler import DirectRequestHandler
+from .base_handler import HandlerResponse, RequestConfig, RequestHandler
+from .coalescing_handler import CoalescingRequestHandler
+from .credential_store import (
+    Credentials,
+    CredentialStore,
+    FileCredentialStore,
+    SQLiteCredentialStore,
+)
+from .direct_handler import DirectConfig, DirectRequestHandler
+from .disk_cache_handler import DiskCacheConfig, DiskCacheRequestHandler
+from .fallback_handler import (
+    CircuitState,
+    FallbackConfig,
+    FallbackRequestHandler,
+    HandlerHealth,
+)
+from .hedging_handler import HedgingConfig, HedgingRequestHandler, LatencyTracker
+from .memory_cache_handler import MemoryCacheConfig, MemoryCacheRequestHandler
+from .rate_limit_handler import RateLimitConfig, RateLimitedRequestHandler
+from .retry import RetryPolicy
+from .revalidating_handler import RevalidatingRequestHandler, RevalidationConfig
 from .unflare_handler import UnflareConfig, UnflareRequestHandler
+from .unflare_pool import (
+    EndpointHealth,
+    UnflareEndpoint,
+    UnflarePoolConfig,
+    UnflarePoolRequestHandler,
+)
 
 __all__ = [
     "RequestHandler",
     "RequestConfig",
+    "HandlerResponse",
     "DirectRequestHandler",
+    "DirectConfig",
     "UnflareRequestHandler",
     "UnflareConfig",
+    "RateLimitedRequestHandler",
+    "RateLimitConfig",
+    "RetryPolicy",
+    "CoalescingRequestHandler",
+    "CredentialStore",
+    "Credentials",
+    "FileCredentialStore",
+    "SQLiteCredentialStore",
+    "UnflarePoolRequestHandler",
+    "UnflarePoolConfig",
+    "UnflareEndpoint",
+    "EndpointHealth",
+    "DiskCacheRequestHandler",
+    "DiskCacheConfig",
+    "MemoryCacheRequestHandler",
+    "MemoryCacheConfig",
+    "RevalidatingRequestHandler",
+    "RevalidationConfig",
+    "FallbackRequestHandler",
+    "FallbackConfig",
+    "HandlerHealth",
+    "CircuitState",
+    "HedgingRequestHandler",
+    "HedgingConfig",
+    "LatencyTracker",
 ]
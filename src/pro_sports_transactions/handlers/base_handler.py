@@ -1,8 +1,35 @@
 """Base classes for HTTP request handling."""
 
+import inspect
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
-from typing import Dict, Optional
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, Dict, Optional, TypeVar, Union
+
+T = TypeVar("T")
+
+#: Parses a response text (None when the request failed). It may be a coroutine
+#: function, e.g. one that parses in a worker pool off the event loop.
+Parse = Callable[[Optional[str]], Union[T, Awaitable[T]]]
+
+
+async def apply_parse(parse: Parse, text: Optional[str]) -> T:
+    """Apply ``parse`` to ``text``, awaiting the result if it is awaitable."""
+    result = parse(text)
+    if inspect.isawaitable(result):
+        result = await result
+    return result
+
+
+def has_errors(result) -> bool:
+    """Check if a parsed result reports errors, so it should not be reused.
+
+    Results report errors in an ``errors`` attribute or, for DataFrames, in
+    ``attrs["errors"]``.
+    """
+    attrs = getattr(result, "attrs", None)
+    if isinstance(attrs, dict):
+        return bool(attrs.get("errors"))
+    return bool(getattr(result, "errors", None))
 
 
 @dataclass
@@ -10,9 +37,72 @@ class RequestConfig:
     """Base configuration for request handling"""
 
 
+@dataclass
+class HandlerResponse:
+    """Outcome of a request made by a handler.
+
+    ``status`` is the HTTP status of the final response, or 0 when no response
+    was received (connection error, service error, unknown status). ``text`` is
+    only set for successful responses.
+    """
+
+    status: int
+    text: Optional[str] = None
+    headers: Dict[str, str] = field(default_factory=dict)
+
+    @property
+    def ok(self) -> bool:
+        """True when the request succeeded and returned a body."""
+        return self.status == 200 and self.text is not None
+
+    @property
+    def not_modified(self) -> bool:
+        """True for a 304 answer to a conditional request (no body is sent)."""
+        return self.status == 304
+
+
 class RequestHandler(ABC):
     """Abstract base class for handling HTTP requests"""
 
     @abstractmethod
     async def get(self, url: str, headers: Dict[str, str]) -> Optional[str]:
         """Make a GET request and return the response text"""
+
+    async def fetch(self, url: str, headers: Dict[str, str]) -> HandlerResponse:
+        """Make a GET request and return the response with its status.
+
+        Handlers that only implement ``get()`` report status 200 when text is
+        returned and 0 otherwise. Handlers that know the real HTTP status
+        override this (and derive ``get()`` from it) so wrappers can react to
+        specific statuses such as 429 or 503.
+        """
+        text = await self.get(url, headers)
+        return HandlerResponse(status=200 if text is not None else 0, text=text)
+
+    async def get_parsed(self, url: str, headers: Dict[str, str], parse: Parse) -> T:
+        """Make a GET request and return ``parse`` applied to the response text.
+
+        ``Search`` requests pages through this method so wrappers can share or
+        reuse parsed results (coalescing, caching) rather than only raw text.
+        ``parse`` may be a coroutine function; use ``apply_parse()`` to call it.
+
+        Wrappers that only handle ``fetch()`` (rate limiting, disk cache,
+        hedging, fallback, the Unflare pool) inherit this method, which parses
+        the text they fetch. Wrappers of parsed results (coalescing, in-memory
+        cache, revalidation) therefore go outermost: wrapped by a request-level
+        handler, they are never reached.
+        """
+        return await apply_parse(parse, await self.get(url, headers))
+
+    async def aclose(self):
+        """Release any resources (sessions, connections) held by the handler.
+
+        Handlers without long-lived resources inherit this no-op.
+        """
+        return None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
@@ -0,0 +1,46 @@
+"""Request coalescing: concurrent identical requests share one fetch."""
+
+import copy
+from typing import Dict, Optional, TypeVar
+
+from .base_handler import HandlerResponse, Parse, RequestHandler
+from .single_flight import SingleFlight
+
+T = TypeVar("T")
+
+
+class CoalescingRequestHandler(RequestHandler):
+    """Wraps a request handler so concurrent requests for one URL share a fetch.
+
+    While a request for a URL is in flight, further requests for the same URL
+    wait for it instead of hitting the network. ``get_parsed()`` coalesces the
+    parse as well, so concurrent ``Search`` calls for the same URL share one
+    fetch and one parse; each waiter receives its own copy of the parsed
+    result. Requests are keyed by URL only, so callers must send the same
+    headers for a URL (as ``Search`` does). Place this outermost when combining
+    wrappers so coalesced requests also skip the inner wrappers.
+    """
+
+    def __init__(self, handler: RequestHandler):
+        self.handler = handler
+        self._flights = SingleFlight()
+
+    async def get(self, url: str, headers: Dict[str, str]) -> Optional[str]:
+        return (await self.fetch(url, headers)).text
+
+    async def fetch(self, url: str, headers: Dict[str, str]) -> HandlerResponse:
+        response, _ = await self._flights.do(
+            ("fetch", url), lambda: self.handler.fetch(url, headers)
+        )
+        return response
+
+    async def get_parsed(self, url: str, headers: Dict[str, str], parse: Parse) -> T:
+        result, shared = await self._flights.do(
+            ("parse", url, parse),
+            lambda: self.handler.get_parsed(url, headers, parse),
+        )
+        return copy.copy(result) if shared else result
+
+    async def aclose(self):
+        """Close the wrapped handler."""
+        await self.handler.aclose()
@@ -0,0 +1,160 @@
+"""Durable storage for Unflare credentials shared across processes."""
+
+import json
+import logging
+import os
+import sqlite3
+import tempfile
+from abc import ABC, abstractmethod
+from contextlib import closing, contextmanager
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class Credentials:
+    """Cookies and headers from an Unflare solve, valid until ``expiry``.
+
+    ``expiry`` is the Unix timestamp after which the handler stops using them
+    (already including the handler's safety buffer).
+    """
+
+    cookies: List[Dict] = field(default_factory=list)
+    headers: Dict[str, str] = field(default_factory=dict)
+    expiry: float = 0
+
+
+class CredentialStore(ABC):
+    """Abstract base class for persisting Unflare credentials.
+
+    Stores act as a cache: a store that cannot be read or written logs a
+    warning and behaves as if it were empty, so requests fall back to a fresh
+    Unflare solve.
+    """
+
+    @abstractmethod
+    def load(self) -> Optional[Credentials]:
+        """Return the stored credentials, or None if there are none"""
+
+    @abstractmethod
+    def save(self, credentials: Credentials):
+        """Replace the stored credentials"""
+
+    @abstractmethod
+    def clear(self):
+        """Remove the stored credentials"""
+
+
+class FileCredentialStore(CredentialStore):
+    """Stores credentials as a JSON file.
+
+    Writes go to a temporary file in the same directory that is then renamed
+    over the target, so readers in other processes always see either the old
+    or the new credentials, never a partial file.
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path).expanduser()
+
+    def load(self) -> Optional[Credentials]:
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+            return Credentials(**data)
+        except FileNotFoundError:
+            return None
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning("Could not read credentials from %s: %s", self.path, e)
+            return None
+
+    def save(self, credentials: Credentials):
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(
+                dir=self.path.parent, prefix=f".{self.path.name}.", suffix=".tmp"
+            )
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as temp_file:
+                    json.dump(asdict(credentials), temp_file)
+                os.replace(temp_path, self.path)
+            except BaseException:
+                os.unlink(temp_path)
+                raise
+        except OSError as e:
+            logger.warning("Could not save credentials to %s: %s", self.path, e)
+
+    def clear(self):
+        try:
+            self.path.unlink(missing_ok=True)
+        except OSError as e:
+            logger.warning("Could not clear credentials at %s: %s", self.path, e)
+
+
+class SQLiteCredentialStore(CredentialStore):
+    """Stores credentials in a SQLite database, one row per ``key``.
+
+    SQLite's file locking makes the store safe to share between processes on
+    one host; use different keys to keep credentials for several Unflare
+    setups in one database.
+    """
+
+    def __init__(self, path: Union[str, Path], key: str = "default"):
+        self.path = Path(path).expanduser()
+        self.key = key
+
+    def load(self) -> Optional[Credentials]:
+        try:
+            with self._connect() as connection:
+                row = connection.execute(
+                    "SELECT cookies, headers, expiry FROM credentials WHERE key = ?",
+                    (self.key,),
+                ).fetchone()
+            if row is None:
+                return None
+            return Credentials(
+                cookies=json.loads(row[0]), headers=json.loads(row[1]), expiry=row[2]
+            )
+        except (OSError, sqlite3.Error, ValueError) as e:
+            logger.warning("Could not read credentials from %s: %s", self.path, e)
+            return None
+
+    def save(self, credentials: Credentials):
+        try:
+            with self._connect() as connection:
+                connection.execute(
+                    "INSERT OR REPLACE INTO credentials (key, cookies, headers, expiry)"
+                    " VALUES (?, ?, ?, ?)",
+                    (
+                        self.key,
+                        json.dumps(credentials.cookies),
+                        json.dumps(credentials.headers),
+                        credentials.expiry,
+                    ),
+                )
+        except (OSError, sqlite3.Error) as e:
+            logger.warning("Could not save credentials to %s: %s", self.path, e)
+
+    def clear(self):
+        try:
+            with self._connect() as connection:
+                connection.execute("DELETE FROM credentials WHERE key = ?", (self.key,))
+        except (OSError, sqlite3.Error) as e:
+            logger.warning("Could not clear credentials at %s: %s", self.path, e)
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Open a connection for one transaction, creating the table if needed.
+
+        A connection per operation keeps the store usable from forked
+        processes and threads.
+        """
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with closing(sqlite3.connect(self.path, timeout=30)) as connection:
+            with connection:
+                connection.execute(
+                    "CREATE TABLE IF NOT EXISTS credentials ("
+                    "key TEXT PRIMARY KEY, cookies TEXT, headers TEXT, expiry REAL)"
+                )
+                yield connection
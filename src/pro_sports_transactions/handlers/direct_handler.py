@@ -1,20 +1,98 @@
 """Direct HTTP request handler implementation."""
 
+import asyncio
+from dataclasses import dataclass
 from typing import Dict, Optional
 
 import aiohttp
 
-from .base_handler import RequestHandler
+from .base_handler import HandlerResponse, RequestConfig, RequestHandler
+from .retry import RetryPolicy
+
+
+@dataclass
+class DirectConfig(RequestConfig):
+    """Connection pool and retry configuration for direct requests.
+
+    Pool defaults mirror aiohttp's own ``TCPConnector`` defaults. Without a
+    ``retry_policy`` each request is attempted once with aiohttp's default
+    timeout.
+    """
+
+    limit: int = 100
+    limit_per_host: int = 0
+    keepalive_timeout: float = 15.0
+    ttl_dns_cache: Optional[int] = 10
+    retry_policy: Optional[RetryPolicy] = None
 
 
 class DirectRequestHandler(RequestHandler):
-    """Direct HTTP request handler - no proxy or special handling"""
+    """Direct HTTP request handler - no proxy or special handling
+
+    The handler owns one pooled ``aiohttp.ClientSession`` that is created on
+    first use and reused for every request, so consecutive pages share
+    keep-alive connections instead of paying a new TCP+TLS handshake each time.
+    Call ``aclose()`` (or use the handler as an async context manager) when done.
+    """
+
+    def __init__(self, config: Optional[DirectConfig] = None):
+        self.config = config or DirectConfig()
+        self._session = None
+        self._session_loop = None
 
     async def get(self, url: str, headers: Dict[str, str]) -> Optional[str]:
-        async with aiohttp.ClientSession(headers=headers) as session:
-            async with session.get(url) as response:
-                return (
+        return (await self.fetch(url, headers)).text
+
+    async def fetch(self, url: str, headers: Dict[str, str]) -> HandlerResponse:
+        if self.config.retry_policy is None:
+            return await self._fetch_once(url, headers)
+        return await self.config.retry_policy.run(
+            lambda: self._fetch_once(url, headers)
+        )
+
+    async def _fetch_once(self, url: str, headers: Dict[str, str]) -> HandlerResponse:
+        """Make a single request attempt."""
+        session = self._get_session()
+        async with session.get(url, headers=headers) as response:
+            return HandlerResponse(
+                status=response.status,
+                text=(
                     None
                     if response.status != 200
                     else await response.text(encoding="utf-8")
-                )
+                ),
+                headers=dict(response.headers),
+            )
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Return the pooled session, creating it for the running event loop."""
+        loop = asyncio.get_running_loop()
+        if (
+            self._session is None
+            or self._session.closed
+            or self._session_loop is not loop
+        ):
+            connector = aiohttp.TCPConnector(
+                limit=self.config.limit,
+                limit_per_host=self.config.limit_per_host,
+                keepalive_timeout=self.config.keepalive_timeout,
+                ttl_dns_cache=self.config.ttl_dns_cache,
+            )
+            session_options = {"connector": connector}
+            if self.config.retry_policy is not None:
+                session_options["timeout"] = self.config.retry_policy.timeout()
+            self._session = aiohttp.ClientSession(**session_options)
+            self._session_loop = loop
+        return self._session
+
+    @property
+    def has_open_session(self) -> bool:
+        """Check if a pooled session is currently open (read-only)."""
+        return self._session is not None and not self._session.closed
+
+    async def aclose(self):
+        """Close the pooled session and its connections."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        self._session_loop = None
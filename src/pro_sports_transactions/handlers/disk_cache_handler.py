@@ -0,0 +1,185 @@
+"""Persistent on-disk cache of search result pages."""
+
+import asyncio
+import logging
+import sqlite3
+import time
+import zlib
+from contextlib import closing, contextmanager
+from dataclasses import dataclass
+from datetime import date, datetime
+from pathlib import Path
+from typing import Dict, Iterator, Optional, Union
+from urllib import parse
+
+from .base_handler import HandlerResponse, RequestConfig, RequestHandler
+
+logger = logging.getLogger(__name__)
+
+DAY = 24 * 60 * 60
+
+
+@dataclass
+class DiskCacheConfig(RequestConfig):
+    """Configuration for the on-disk response cache.
+
+    Pages for searches whose ``EndDate`` is more than ``recent_days`` days in
+    the past are historical and kept for ``historical_ttl`` seconds (None keeps
+    them until evicted). Pages for searches ending later, or without an end
+    date, can still change and are kept for ``recent_ttl`` seconds. Once the
+    compressed bodies exceed ``max_bytes``, the least recently used pages are
+    evicted.
+    """
+
+    path: Union[str, Path] = "~/.cache/pro_sports_transactions/responses.db"
+    max_bytes: int = 256 * 1024 * 1024
+    historical_ttl: Optional[float] = 30 * DAY
+    recent_ttl: float = 60 * 60
+    recent_days: int = 7
+    compression_level: int = 6
+
+
+class DiskCacheRequestHandler(RequestHandler):
+    """Wraps a request handler with a persistent cache of successful pages
+
+    Pages are stored zlib-compressed in a SQLite database keyed by URL, so
+    re-running a search (or a backfill) reads finished date ranges from disk
+    instead of the network. Database work runs in a worker thread to keep the
+    event loop free.
+    """
+
+    def __init__(
+        self, handler: RequestHandler, config: Optional[DiskCacheConfig] = None
+    ):
+        self.handler = handler
+        self.config = config or DiskCacheConfig()
+        self.path = Path(self.config.path).expanduser()
+        self.hits = 0
+        self.misses = 0
+
+    async def get(self, url: str, headers: Dict[str, str]) -> Optional[str]:
+        return (await self.fetch(url, headers)).text
+
+    async def fetch(self, url: str, headers: Dict[str, str]) -> HandlerResponse:
+        text = await asyncio.to_thread(self._load, url)
+        if text is not None:
+            self.hits += 1
+            return HandlerResponse(status=200, text=text)
+
+        self.misses += 1
+        response = await self.handler.fetch(url, headers)
+        if response.ok:
+            await asyncio.to_thread(self._store, url, response.text)
+        return response
+
+    def ttl(self, url: str, today: Optional[date] = None) -> Optional[float]:
+        """Seconds a page for ``url`` stays fresh; None means no expiry."""
+        today = today or date.today()
+        end_date = self._end_date(url)
+        if end_date is not None and (today - end_date).days > self.config.recent_days:
+            return self.config.historical_ttl
+        return self.config.recent_ttl
+
+    @staticmethod
+    def _end_date(url: str) -> Optional[date]:
+        """The search's ``EndDate``, or None if absent or unparseable."""
+        values = parse.parse_qs(parse.urlsplit(url).query).get("EndDate")
+        try:
+            return datetime.strptime(values[0], "%Y-%m-%d").date()
+        except (TypeError, ValueError):
+            return None
+
+    def clear(self):
+        """Remove every cached page."""
+        with self._connect() as connection:
+            connection.execute("DELETE FROM responses")
+
+    @property
+    def size(self) -> int:
+        """Total bytes of compressed pages in the cache (read-only)."""
+        with self._connect() as connection:
+            return connection.execute(
+                "SELECT COALESCE(SUM(size), 0) FROM responses"
+            ).fetchone()[0]
+
+    def _load(self, url: str) -> Optional[str]:
+        """Return the fresh cached page for ``url`` and mark it recently used."""
+        now = time.time()
+        try:
+            with self._connect() as connection:
+                row = connection.execute(
+                    "SELECT body FROM responses WHERE url = ? "
+                    "AND (expires_at IS NULL OR expires_at > ?)",
+                    (url, now),
+                ).fetchone()
+                if row is None:
+                    return None
+                connection.execute(
+                    "UPDATE responses SET accessed_at = ? WHERE url = ?", (now, url)
+                )
+            return zlib.decompress(row[0]).decode("utf-8")
+        except (OSError, sqlite3.Error, zlib.error) as e:
+            logger.warning("Could not read %s from the response cache: %s", url, e)
+            return None
+
+    def _store(self, url: str, text: str):
+        """Cache ``text`` for ``url`` and evict pages beyond the byte budget."""
+        now = time.time()
+        ttl = self.ttl(url)
+        body = zlib.compress(text.encode("utf-8"), self.config.compression_level)
+        if len(body) > self.config.max_bytes:
+            return
+        try:
+            with self._connect() as connection:
+                connection.execute(
+                    "INSERT OR REPLACE INTO responses "
+                    "(url, body, size, expires_at, accessed_at) VALUES (?, ?, ?, ?, ?)",
+                    (url, body, len(body), None if ttl is None else now + ttl, now),
+                )
+                self._evict(connection)
+        except (OSError, sqlite3.Error) as e:
+            logger.warning("Could not cache %s: %s", url, e)
+
+    def _evict(self, connection: sqlite3.Connection):
+        """Delete expired pages, then least recently used ones over budget."""
+        connection.execute(
+            "DELETE FROM responses WHERE expires_at <= ?", (time.time(),)
+        )
+        excess = (
+            connection.execute(
+                "SELECT COALESCE(SUM(size), 0) FROM responses"
+            ).fetchone()[0]
+            - self.config.max_bytes
+        )
+        if excess <= 0:
+            return
+        evicted = []
+        for url, size in connection.execute(
+            "SELECT url, size FROM responses ORDER BY accessed_at"
+        ):
+            evicted.append((url,))
+            excess -= size
+            if excess <= 0:
+                break
+        connection.executemany("DELETE FROM responses WHERE url = ?", evicted)
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Open a connection for one transaction, creating the table if needed."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with closing(sqlite3.connect(self.path, timeout=30)) as connection:
+            with connection:
+                connection.execute(
+                    "CREATE TABLE IF NOT EXISTS responses ("
+                    "url TEXT PRIMARY KEY, body BLOB, size INTEGER, "
+                    "expires_at REAL, accessed_at REAL)"
+                )
+                connection.execute(
+                    "CREATE INDEX IF NOT EXISTS responses_accessed_at "
+                    "ON responses (accessed_at)"
+                )
+                yield connection
+
+    async def aclose(self):
+        """Close the wrapped handler."""
+        await self.handler.aclose()
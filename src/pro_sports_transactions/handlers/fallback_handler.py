@@ -0,0 +1,183 @@
+"""Fallback chain of request handlers guarded by circuit breakers."""
+
+import logging
+import time
+from dataclasses import dataclass
+from enum import StrEnum
+from typing import Dict, List, Optional, Sequence
+
+from .base_handler import HandlerResponse, RequestConfig, RequestHandler
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitState(StrEnum):
+    """State of a handler's circuit breaker"""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+@dataclass
+class FallbackConfig(RequestConfig):
+    """Configuration for a fallback chain of request handlers.
+
+    A handler's circuit opens after ``failure_threshold`` consecutive failed
+    requests and stays open for ``reset_timeout`` seconds; it then lets one
+    probe request through, closing again if the probe succeeds. Latency is an
+    exponentially weighted average of successful requests (``smoothing`` is
+    the weight of each new request).
+    """
+
+    failure_threshold: int = 3
+    reset_timeout: float = 30.0
+    smoothing: float = 0.3
+
+    def __post_init__(self):
+        if self.failure_threshold < 1:
+            raise ValueError("failure_threshold must be at least 1")
+
+
+@dataclass
+class HandlerHealth:
+    """Circuit breaker and latency of one handler in the chain"""
+
+    name: str
+    consecutive_failures: int = 0
+    latency_samples: int = 0
+    latency: float = 0.0
+    open_until: Optional[float] = None
+    probing: bool = False
+
+    @property
+    def state(self) -> CircuitState:
+        """The circuit state, moving from open to half-open once it is due."""
+        if self.open_until is None:
+            return CircuitState.CLOSED
+        if time.monotonic() < self.open_until:
+            return CircuitState.OPEN
+        return CircuitState.HALF_OPEN
+
+
+class FallbackRequestHandler(RequestHandler):
+    """Tries an ordered list of request handlers until one succeeds
+
+    A request that fails (no body, an error status, or an exception) moves on
+    to the next handler. Each handler has a circuit breaker: after repeated
+    failures it is skipped until its reset timeout passes, then a single probe
+    request decides whether it rejoins the chain. Handlers are tried in their
+    configured order, except that handlers with measured latency are reordered
+    among themselves, fastest first, so a slower handler earlier in the list
+    gives way to a faster one. If every circuit is open, the handler due to
+    reopen first is tried.
+    """
+
+    def __init__(
+        self,
+        handlers: Sequence[RequestHandler],
+        config: Optional[FallbackConfig] = None,
+    ):
+        if not handlers:
+            raise ValueError("handlers must list at least one request handler")
+        self.handlers = list(handlers)
+        self.config = config or FallbackConfig()
+        self.health: List[HandlerHealth] = [
+            HandlerHealth(f"{i}:{type(handler).__name__}")
+            for i, handler in enumerate(self.handlers)
+        ]
+
+    async def get(self, url: str, headers: Dict[str, str]) -> Optional[str]:
+        return (await self.fetch(url, headers)).text
+
+    async def fetch(self, url: str, headers: Dict[str, str]) -> HandlerResponse:
+        response = None
+        error = None
+        for index in self._order():
+            health = self.health[index]
+            probe = health.state == CircuitState.HALF_OPEN and not health.probing
+            if probe:
+                health.probing = True
+            start_time = time.monotonic()
+            try:
+                response = await self.handlers[index].fetch(url, headers)
+            except Exception as e:
+                logger.warning("Handler %s failed: %r", health.name, e)
+                error = e
+                self._record(health, None)
+                continue
+            finally:
+                if probe:
+                    health.probing = False
+            if response.ok or response.not_modified:
+                self._record(health, time.monotonic() - start_time)
+                return response
+            logger.warning(
+                "Handler %s failed with status %d", health.name, response.status
+            )
+            self._record(health, None)
+
+        if response is None:
+            raise error
+        return response
+
+    def _order(self) -> List[int]:
+        """Indexes of the handlers to try for the next request, in order."""
+        usable = [
+            index
+            for index, health in enumerate(self.health)
+            if health.state == CircuitState.CLOSED
+            or (health.state == CircuitState.HALF_OPEN and not health.probing)
+        ]
+        if not usable:
+            return [
+                min(
+                    range(len(self.health)),
+                    key=lambda i: self.health[i].open_until,
+                )
+            ]
+
+        # Probe recovering handlers first; a failed probe falls through
+        probes = [i for i in usable if self.health[i].state == CircuitState.HALF_OPEN]
+        closed = [i for i in usable if i not in probes]
+        # Measured handlers swap places by latency; the rest keep their place
+        measured = iter(
+            sorted(
+                (i for i in closed if self.health[i].latency_samples),
+                key=lambda i: self.health[i].latency,
+            )
+        )
+        return probes + [
+            next(measured) if self.health[i].latency_samples else i for i in closed
+        ]
+
+    def _record(self, health: HandlerHealth, latency: Optional[float]):
+        """Fold one request into the handler's health; None means it failed."""
+        if latency is None:
+            health.consecutive_failures += 1
+            if (
+                health.state != CircuitState.CLOSED
+                or health.consecutive_failures >= self.config.failure_threshold
+            ):
+                logger.warning(
+                    "Opening circuit for handler %s for %.0fs "
+                    "after %d consecutive failures",
+                    health.name,
+                    self.config.reset_timeout,
+                    health.consecutive_failures,
+                )
+                health.open_until = time.monotonic() + self.config.reset_timeout
+            return
+
+        if health.open_until is not None:
+            logger.info("Closing circuit for handler %s", health.name)
+        health.open_until = None
+        health.consecutive_failures = 0
+        weight = 1.0 if health.latency_samples == 0 else self.config.smoothing
+        health.latency += weight * (latency - health.latency)
+        health.latency_samples += 1
+
+    async def aclose(self):
+        """Close every handler in the chain."""
+        for handler in self.handlers:
+            await handler.aclose()
@@ -0,0 +1,158 @@
+"""Hedged requests: duplicate slow requests to cut tail latency."""
+
+import asyncio
+import bisect
+import logging
+import math
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+from .base_handler import HandlerResponse, RequestConfig, RequestHandler
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class HedgingConfig(RequestConfig):
+    """Configuration for hedged requests.
+
+    A request still running after the ``percentile`` latency of the last
+    ``window`` successful requests is duplicated. No request is hedged until
+    ``min_samples`` latencies are known, and at most ``max_hedge_rate`` of the
+    last ``window`` requests are hedged, which bounds the extra upstream load.
+    """
+
+    percentile: float = 0.95
+    max_hedge_rate: float = 0.05
+    window: int = 200
+    min_samples: int = 20
+
+    def __post_init__(self):
+        if not 0 < self.percentile < 1:
+            raise ValueError("percentile must be between 0 and 1")
+        if not 0 <= self.max_hedge_rate <= 1:
+            raise ValueError("max_hedge_rate must be between 0 and 1")
+        if not 1 <= self.min_samples <= self.window:
+            raise ValueError("min_samples must be between 1 and window")
+
+
+class LatencyTracker:
+    """Latencies of the most recent requests, kept sorted for percentiles"""
+
+    def __init__(self, size: int):
+        self.size = size
+        self._recent = deque()
+        self._sorted: List[float] = []
+
+    @property
+    def count(self) -> int:
+        """Number of latencies currently tracked."""
+        return len(self._recent)
+
+    def add(self, latency: float):
+        """Track ``latency``, dropping the oldest once ``size`` are tracked."""
+        if len(self._recent) == self.size:
+            oldest = self._recent.popleft()
+            del self._sorted[bisect.bisect_left(self._sorted, oldest)]
+        self._recent.append(latency)
+        bisect.insort(self._sorted, latency)
+
+    def percentile(self, q: float) -> Optional[float]:
+        """The nearest-rank ``q`` percentile (0-1), or None with no samples."""
+        if not self._sorted:
+            return None
+        rank = max(math.ceil(q * len(self._sorted)), 1)
+        return self._sorted[rank - 1]
+
+
+class HedgingRequestHandler(RequestHandler):
+    """Wraps a request handler with hedged requests
+
+    When a request takes longer than the configured latency percentile, the
+    same request is sent again and whichever succeeds first is returned; the
+    other is cancelled. A failed response or exception from one request waits
+    for the other. ``requests``, ``hedges``, and ``hedge_wins`` (hedges that
+    answered first) count hedging activity.
+    """
+
+    def __init__(self, handler: RequestHandler, config: Optional[HedgingConfig] = None):
+        self.handler = handler
+        self.config = config or HedgingConfig()
+        self.latencies = LatencyTracker(self.config.window)
+        # Whether each of the last ``window`` requests was hedged
+        self._hedged = deque(maxlen=self.config.window)
+        self.requests = 0
+        self.hedges = 0
+        self.hedge_wins = 0
+
+    async def get(self, url: str, headers: Dict[str, str]) -> Optional[str]:
+        return (await self.fetch(url, headers)).text
+
+    async def fetch(self, url: str, headers: Dict[str, str]) -> HandlerResponse:
+        self.requests += 1
+        delay = self.hedge_delay()
+        start_time = time.monotonic()
+        tasks = [self._start(url, headers)]
+        try:
+            if delay is not None:
+                done, _ = await asyncio.wait(tasks, timeout=delay)
+                if not done and self._can_hedge():
+                    logger.debug("Hedging %s after %.3fs", url, delay)
+                    self.hedges += 1
+                    tasks.append(self._start(url, headers))
+            self._hedged.append(len(tasks) > 1)
+            response = await self._first_success(tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+
+        if response.ok or response.not_modified:
+            self.latencies.add(time.monotonic() - start_time)
+        return response
+
+    def hedge_delay(self) -> Optional[float]:
+        """Seconds after which a request is hedged, or None while warming up."""
+        if self.latencies.count < self.config.min_samples:
+            return None
+        return self.latencies.percentile(self.config.percentile)
+
+    def _can_hedge(self) -> bool:
+        """Check if one more hedge stays within the hedge rate."""
+        return sum(self._hedged) + 1 <= self.config.max_hedge_rate * (
+            len(self._hedged) + 1
+        )
+
+    def _start(self, url: str, headers: Dict[str, str]) -> asyncio.Task:
+        task = asyncio.ensure_future(self.handler.fetch(url, headers))
+        # Mark the exception retrieved even if the task loses the race
+        task.add_done_callback(lambda done: done.cancelled() or done.exception())
+        return task
+
+    async def _first_success(self, tasks: List[asyncio.Task]) -> HandlerResponse:
+        """The first successful response, else the first failure."""
+        failure = None
+        error = None
+        pending = set(tasks)
+        while pending:
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in sorted(done, key=tasks.index):
+                if task.exception() is not None:
+                    error = error or task.exception()
+                    continue
+                response = task.result()
+                if response.ok or response.not_modified:
+                    if task is not tasks[0]:
+                        self.hedge_wins += 1
+                    return response
+                failure = failure or response
+        if failure is None:
+            raise error
+        return failure
+
+    async def aclose(self):
+        """Close the wrapped handler."""
+        await self.handler.aclose()
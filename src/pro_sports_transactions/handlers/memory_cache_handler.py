@@ -0,0 +1,138 @@
+"""In-memory LRU cache of parsed search results."""
+
+import copy
+import sys
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Hashable, Optional, TypeVar
+
+from .base_handler import (
+    HandlerResponse,
+    Parse,
+    RequestConfig,
+    RequestHandler,
+    has_errors,
+)
+from .single_flight import SingleFlight
+
+T = TypeVar("T")
+
+
+@dataclass
+class MemoryCacheConfig(RequestConfig):
+    """Configuration for the in-memory result cache.
+
+    Results are kept for ``ttl`` seconds (None keeps them until evicted); once
+    their estimated size exceeds ``max_bytes`` the least recently used are
+    evicted.
+    """
+
+    max_bytes: int = 64 * 1024 * 1024
+    ttl: Optional[float] = 60.0
+
+
+@dataclass
+class _Entry:
+    value: Any
+    size: int
+    expires_at: Optional[float]
+
+
+class MemoryCacheRequestHandler(RequestHandler):
+    """Wraps a request handler with an in-process cache of parsed results
+
+    ``Search`` loads pages through ``get_parsed()``, so a cache hit skips both
+    the request and the HTML parse. Every caller receives its own copy of the
+    cached result, so callers can't corrupt the shared entry. Concurrent
+    misses for one URL share a single load. Results carrying errors (the
+    ``errors`` of a results page, or a DataFrame's ``attrs["errors"]``) are
+    returned but not cached. Raw
+    ``get()``/``fetch()`` calls pass straight through.
+    """
+
+    def __init__(
+        self, handler: RequestHandler, config: Optional[MemoryCacheConfig] = None
+    ):
+        self.handler = handler
+        self.config = config or MemoryCacheConfig()
+        self._entries: "OrderedDict[Hashable, _Entry]" = OrderedDict()
+        self._flights = SingleFlight()
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    async def get(self, url: str, headers: Dict[str, str]) -> Optional[str]:
+        return await self.handler.get(url, headers)
+
+    async def fetch(self, url: str, headers: Dict[str, str]) -> HandlerResponse:
+        return await self.handler.fetch(url, headers)
+
+    async def get_parsed(self, url: str, headers: Dict[str, str], parse: Parse) -> T:
+        key = (url, parse)
+        entry = self._entries.get(key)
+        if entry is not None:
+            if entry.expires_at is None or time.monotonic() < entry.expires_at:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return copy.copy(entry.value)
+            self._remove(key)
+
+        self.misses += 1
+        result, _ = await self._flights.do(
+            key, lambda: self._load(key, url, headers, parse)
+        )
+        return copy.copy(result)
+
+    async def _load(
+        self,
+        key: Hashable,
+        url: str,
+        headers: Dict[str, str],
+        parse: Parse,
+    ) -> T:
+        """Load and parse ``url`` through the wrapped handler and cache it."""
+        result = await self.handler.get_parsed(url, headers, parse)
+        if not has_errors(result):
+            self._store(key, result)
+        return result
+
+    def _store(self, key: Hashable, value: Any):
+        """Cache ``value`` and evict least recently used entries over budget."""
+        size = self._sizeof(value)
+        if size > self.config.max_bytes:
+            return
+        if key in self._entries:
+            self._remove(key)
+        expires_at = (
+            None if self.config.ttl is None else time.monotonic() + self.config.ttl
+        )
+        self._entries[key] = _Entry(value, size, expires_at)
+        self.size += size
+        while self.size > self.config.max_bytes:
+            self._remove(next(iter(self._entries)))
+            self.evictions += 1
+
+    def _remove(self, key: Hashable):
+        self.size -= self._entries.pop(key).size
+
+    @staticmethod
+    def _sizeof(value: Any) -> int:
+        """Estimated memory held by ``value`` in bytes."""
+        if hasattr(value, "memory_usage"):
+            # pandas DataFrame, including object (string) columns
+            return int(value.memory_usage(deep=True, index=True).sum())
+        if hasattr(value, "nbytes"):
+            # Parsed results pages
+            return value.nbytes
+        return sys.getsizeof(value)
+
+    def clear(self):
+        """Remove every cached result."""
+        self._entries.clear()
+        self.size = 0
+
+    async def aclose(self):
+        """Close the wrapped handler."""
+        await self.handler.aclose()
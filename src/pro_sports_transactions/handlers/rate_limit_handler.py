@@ -0,0 +1,140 @@
+"""Adaptive per-host rate limiting for any request handler."""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+from urllib import parse
+
+from .base_handler import HandlerResponse, RequestConfig, RequestHandler
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class RateLimitConfig(RequestConfig):
+    """Configuration for adaptive rate limiting.
+
+    ``requests_per_second`` is the ceiling. Throttling responses cut the rate
+    by ``backoff_factor`` (down to ``min_requests_per_second``); each success
+    raises it by ``recovery_step`` until the ceiling is reached again.
+    """
+
+    requests_per_second: float = 2.0
+    burst: int = 5
+    min_requests_per_second: float = 0.1
+    backoff_factor: float = 0.5
+    recovery_step: float = 0.1
+    throttle_statuses: Tuple[int, ...] = (403, 429, 503)
+
+
+class TokenBucket:
+    """Token bucket whose refill rate can be adjusted while in use"""
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        """Wait until a token is available and take it."""
+        # Waiters queue on the lock so tokens are handed out in arrival order
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._refill(now)
+                if now >= self._paused_until and self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = max(
+                    self._paused_until - now, (1 - self._tokens) / self.rate, 0.0
+                )
+                await asyncio.sleep(wait)
+
+    def pause(self, seconds: float):
+        """Hand out no tokens for ``seconds`` and drop any saved-up burst."""
+        self._refill(time.monotonic())
+        self._tokens = 0.0
+        self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+    def _refill(self, now: float):
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+
+class RateLimitedRequestHandler(RequestHandler):
+    """Wraps a request handler with an adaptive per-host token bucket.
+
+    Requests to each host are limited to the configured rate and burst. When
+    the wrapped handler reports a throttling status (429, 503 or a Cloudflare
+    403 by default) the host's rate is cut and its burst is dropped, honouring
+    ``Retry-After`` when present; successful responses gradually restore the
+    rate. Works with any handler; statuses are read from ``fetch()``.
+    """
+
+    def __init__(
+        self, handler: RequestHandler, config: Optional[RateLimitConfig] = None
+    ):
+        self.handler = handler
+        self.config = config or RateLimitConfig()
+        self._buckets: Dict[str, TokenBucket] = {}
+
+    async def get(self, url: str, headers: Dict[str, str]) -> Optional[str]:
+        return (await self.fetch(url, headers)).text
+
+    async def fetch(self, url: str, headers: Dict[str, str]) -> HandlerResponse:
+        bucket = self._bucket(parse.urlparse(url).netloc)
+        await bucket.acquire()
+        response = await self.handler.fetch(url, headers)
+        self._adjust(bucket, response)
+        return response
+
+    def current_rate(self, host: str) -> float:
+        """Current requests/sec allowed for ``host``."""
+        bucket = self._buckets.get(host)
+        return bucket.rate if bucket else self.config.requests_per_second
+
+    async def aclose(self):
+        """Close the wrapped handler."""
+        await self.handler.aclose()
+
+    def _bucket(self, host: str) -> TokenBucket:
+        if host not in self._buckets:
+            self._buckets[host] = TokenBucket(
+                self.config.requests_per_second, self.config.burst
+            )
+        return self._buckets[host]
+
+    def _adjust(self, bucket: TokenBucket, response: HandlerResponse):
+        """Slow down on throttling responses, speed back up on success."""
+        if response.status in self.config.throttle_statuses:
+            bucket.rate = max(
+                self.config.min_requests_per_second,
+                bucket.rate * self.config.backoff_factor,
+            )
+            bucket.pause(self._retry_after(response) or 1 / bucket.rate)
+            logger.warning(
+                "Throttled with status %d, slowing to %.2f requests/sec",
+                response.status,
+                bucket.rate,
+            )
+        elif response.ok or response.not_modified:
+            bucket.rate = min(
+                self.config.requests_per_second,
+                bucket.rate + self.config.recovery_step,
+            )
+
+    @staticmethod
+    def _retry_after(response: HandlerResponse) -> Optional[float]:
+        """Seconds requested by a ``Retry-After`` header, if given as seconds."""
+        for name, value in response.headers.items():
+            if name.lower() == "retry-after":
+                try:
+                    return max(float(value), 0.0)
+                except ValueError:
+                    return None
+        return None
@@ -0,0 +1,107 @@
+"""Retry policy with jittered exponential backoff and per-attempt timeouts."""
+
+import asyncio
+import logging
+import random
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Optional, Tuple, Type
+
+import aiohttp
+
+from .base_handler import HandlerResponse
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class RetryPolicy:
+    """How a handler retries failed requests.
+
+    Attributes:
+        max_attempts: Total attempts, including the first
+        backoff_base: Delay before the first retry, in seconds; doubles per retry
+        backoff_cap: Upper bound on any single delay, in seconds
+        jitter: Randomize each delay between 0 and its backoff ("full jitter")
+            so concurrent clients don't retry in lockstep
+        retryable_statuses: Response statuses worth retrying (0 = no response)
+        retryable_exceptions: Exceptions worth retrying
+        connect_timeout: Per-attempt limit for establishing a connection
+        read_timeout: Per-attempt limit between reads of the response
+        deadline: Overall limit across every attempt and delay, in seconds
+    """
+
+    max_attempts: int = 3
+    backoff_base: float = 0.5
+    backoff_cap: float = 10.0
+    jitter: bool = True
+    retryable_statuses: Tuple[int, ...] = (0, 429, 500, 502, 503, 504)
+    retryable_exceptions: Tuple[Type[BaseException], ...] = (
+        aiohttp.ClientError,
+        asyncio.TimeoutError,
+    )
+    connect_timeout: Optional[float] = 10.0
+    read_timeout: Optional[float] = 30.0
+    deadline: Optional[float] = None
+
+    def __post_init__(self):
+        if self.max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+
+    def timeout(self) -> aiohttp.ClientTimeout:
+        """Per-attempt timeout for aiohttp sessions."""
+        return aiohttp.ClientTimeout(
+            total=None,
+            sock_connect=self.connect_timeout,
+            sock_read=self.read_timeout,
+        )
+
+    def backoff(self, retry: int) -> float:
+        """Delay before retry number ``retry`` (1 for the first retry)."""
+        delay = min(self.backoff_cap, self.backoff_base * 2 ** (retry - 1))
+        return random.uniform(0, delay) if self.jitter else delay
+
+    async def run(
+        self, attempt: Callable[[], Awaitable[HandlerResponse]]
+    ) -> HandlerResponse:
+        """Call ``attempt`` until it succeeds or the policy gives up.
+
+        Returns the last response once attempts (or the deadline) run out with
+        a retryable status; re-raises the last exception if attempts run out
+        on a retryable exception. Non-retryable outcomes return immediately.
+        Raises ``TimeoutError`` if the deadline expires during an attempt.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = None if self.deadline is None else loop.time() + self.deadline
+
+        for number in range(1, self.max_attempts + 1):
+            try:
+                async with asyncio.timeout_at(deadline):
+                    response = await attempt()
+                if response.status not in self.retryable_statuses:
+                    return response
+                reason = f"status {response.status}"
+            except self.retryable_exceptions as e:
+                if deadline is not None and loop.time() >= deadline:
+                    raise
+                if number == self.max_attempts:
+                    raise
+                response = None
+                reason = repr(e)
+
+            if number == self.max_attempts:
+                break
+            delay = self.backoff(number)
+            if deadline is not None and loop.time() + delay >= deadline:
+                break
+            logger.warning(
+                "Attempt %d/%d failed (%s), retrying in %.2fs",
+                number,
+                self.max_attempts,
+                reason,
+                delay,
+            )
+            await asyncio.sleep(delay)
+
+        if response is None:
+            raise TimeoutError("Retry deadline exceeded")
+        return response
@@ -0,0 +1,152 @@
+"""Conditional requests that revalidate previously fetched pages."""
+
+import copy
+import hashlib
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Optional, Tuple, TypeVar
+
+from .base_handler import (
+    HandlerResponse,
+    Parse,
+    RequestConfig,
+    RequestHandler,
+    apply_parse,
+    has_errors,
+)
+
+T = TypeVar("T")
+
+
+@dataclass
+class RevalidationConfig(RequestConfig):
+    """Configuration for conditional-request revalidation.
+
+    The validators, body, and parsed results of the last response are kept for
+    up to ``max_entries`` URLs; beyond that the least recently used are
+    forgotten.
+    """
+
+    max_entries: int = 1024
+
+    def __post_init__(self):
+        if self.max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+
+
+@dataclass
+class _Entry:
+    text: str
+    digest: bytes
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    parsed: Dict[Callable, Any] = field(default_factory=dict)
+
+
+class RevalidatingRequestHandler(RequestHandler):
+    """Wraps a request handler with ETag / Last-Modified revalidation
+
+    Each URL's ``ETag`` and ``Last-Modified`` validators are remembered and
+    sent back as ``If-None-Match`` / ``If-Modified-Since``. A 304 Not Modified
+    answer reuses the previous body, and ``get_parsed()`` reuses the previous
+    parsed result without parsing again. When the server sends no validators
+    (or ignores them), a full body whose hash matches the previous one is
+    treated the same way. Every caller receives its own copy of a reused
+    parsed result; results carrying errors are never reused.
+    """
+
+    def __init__(
+        self, handler: RequestHandler, config: Optional[RevalidationConfig] = None
+    ):
+        self.handler = handler
+        self.config = config or RevalidationConfig()
+        self._entries: "OrderedDict[str, _Entry]" = OrderedDict()
+        self.not_modified = 0
+        self.unchanged = 0
+
+    async def get(self, url: str, headers: Dict[str, str]) -> Optional[str]:
+        return (await self.fetch(url, headers)).text
+
+    async def fetch(self, url: str, headers: Dict[str, str]) -> HandlerResponse:
+        response, _ = await self._revalidate(url, headers)
+        return response
+
+    async def get_parsed(self, url: str, headers: Dict[str, str], parse: Parse) -> T:
+        response, entry = await self._revalidate(url, headers)
+        if entry is None:
+            return await apply_parse(parse, response.text)
+        if parse in entry.parsed:
+            return copy.copy(entry.parsed[parse])
+
+        result = await apply_parse(parse, entry.text)
+        if has_errors(result):
+            return result
+        entry.parsed[parse] = result
+        return copy.copy(result)
+
+    async def _revalidate(
+        self, url: str, headers: Dict[str, str]
+    ) -> Tuple[HandlerResponse, Optional[_Entry]]:
+        """Request ``url`` conditionally.
+
+        Returns:
+            The response (a 304 is answered with the remembered body), and the
+            entry now describing ``url``, or None when the request failed
+        """
+        entry = self._entries.get(url)
+        response = await self.handler.fetch(
+            url, self._conditional_headers(entry, headers)
+        )
+
+        if response.not_modified and entry is not None:
+            self.not_modified += 1
+            self._update_validators(entry, response.headers)
+            self._remember(url, entry)
+            return HandlerResponse(200, entry.text, response.headers), entry
+        if not response.ok:
+            return response, None
+
+        digest = hashlib.sha256(response.text.encode("utf-8")).digest()
+        if entry is not None and entry.digest == digest:
+            self.unchanged += 1
+        else:
+            entry = _Entry(response.text, digest)
+        self._update_validators(entry, response.headers)
+        self._remember(url, entry)
+        return response, entry
+
+    @staticmethod
+    def _conditional_headers(
+        entry: Optional[_Entry], headers: Dict[str, str]
+    ) -> Dict[str, str]:
+        """``headers`` plus the validators remembered for the URL, if any."""
+        if entry is None:
+            return headers
+        conditional = dict(headers)
+        if entry.etag is not None:
+            conditional["If-None-Match"] = entry.etag
+        if entry.last_modified is not None:
+            conditional["If-Modified-Since"] = entry.last_modified
+        return conditional
+
+    @staticmethod
+    def _update_validators(entry: _Entry, headers: Dict[str, str]):
+        """Remember the validators sent with a response (header names vary)."""
+        lowered = {name.lower(): value for name, value in headers.items()}
+        entry.etag = lowered.get("etag", entry.etag)
+        entry.last_modified = lowered.get("last-modified", entry.last_modified)
+
+    def _remember(self, url: str, entry: _Entry):
+        """Store ``entry`` as most recently used, forgetting the oldest."""
+        self._entries[url] = entry
+        self._entries.move_to_end(url)
+        while len(self._entries) > self.config.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        """Forget every remembered page."""
+        self._entries.clear()
+
+    async def aclose(self):
+        """Close the wrapped handler."""
+        await self.handler.aclose()
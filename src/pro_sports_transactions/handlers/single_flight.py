@@ -0,0 +1,50 @@
+"""Single-flight execution: concurrent calls for one key share one call."""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable, Tuple
+
+
+class SingleFlight:
+    """Deduplicates concurrent calls that share a key.
+
+    The first caller for a key starts the call; callers arriving while it is in
+    flight wait for the same result (or exception) instead of starting their
+    own. Once it completes, the next caller for that key starts a new call.
+    The call runs as its own task, so a cancelled caller does not cancel it
+    for the others.
+    """
+
+    def __init__(self):
+        self._calls: Dict[Hashable, asyncio.Task] = {}
+
+    async def do(
+        self, key: Hashable, call: Callable[[], Awaitable[Any]]
+    ) -> Tuple[Any, bool]:
+        """Run ``call`` for ``key``, or join the call already in flight.
+
+        Returns:
+            The result, and whether it was shared from another caller's call
+        """
+        task = self._calls.get(key)
+        shared = task is not None
+        if task is None:
+            task = asyncio.ensure_future(call())
+            self._calls[key] = task
+            task.add_done_callback(lambda done: self._forget(key, done))
+        return await asyncio.shield(task), shared
+
+    def in_flight(self, key: Hashable) -> bool:
+        """Check if a call for ``key`` is currently in flight."""
+        return key in self._calls
+
+    def cancel(self):
+        """Cancel every call in flight; their callers see CancelledError."""
+        for task in list(self._calls.values()):
+            task.cancel()
+
+    def _forget(self, key: Hashable, task: asyncio.Task):
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        # Mark the exception retrieved even if every caller was cancelled
+        if not task.cancelled():
+            task.exception()
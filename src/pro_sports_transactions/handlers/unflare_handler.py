@@ -1,17 +1,28 @@
 """Unflare proxy request handler for bypassing Cloudflare protection."""
 
+import asyncio
 import logging
 import time
+from collections import Counter
+from contextlib import asynccontextmanager, suppress
 from dataclasses import dataclass
-from typing import Dict, Optional
+from http.cookies import SimpleCookie
+from typing import AsyncIterator, Dict, Optional
 
 import aiohttp
 
-from .base_handler import RequestConfig, RequestHandler
+from .base_handler import HandlerResponse, RequestConfig, RequestHandler
+from .credential_store import Credentials, CredentialStore
+from .retry import RetryPolicy
+from .single_flight import SingleFlight
 
 logger = logging.getLogger(__name__)
 
 
+# Seconds allowed on top of UnflareConfig.timeout for a solve to be returned
+SERVICE_TIMEOUT_MARGIN = 60.0
+
+
 @dataclass
 class UnflareConfig(RequestConfig):
     """Configuration for Unflare proxy requests"""
@@ -19,24 +30,88 @@ class UnflareConfig(RequestConfig):
     url: str = "http://localhost:5002/scrape"
     timeout: int = 60000
     proxy: Optional[Dict[str, any]] = None
+    # Without a retry policy each site request is attempted once with a 120s
+    # timeout; solves are always limited to ``timeout`` plus a margin
+    retry_policy: Optional[RetryPolicy] = None
+    # Persists credentials across restarts and shares them between processes
+    credential_store: Optional[CredentialStore] = None
+    # Fraction of the credential lifetime after which a background task
+    # re-solves them (e.g. 0.8); None refreshes only on expiry or a 403
+    refresh_at: Optional[float] = None
+    # Field of the Unflare response holding the page it loaded; when present,
+    # a solve returns that page instead of requesting it again. None disables
+    body_field: Optional[str] = "html"
+
+    def __post_init__(self):
+        if self.refresh_at is not None and not 0 < self.refresh_at < 1:
+            raise ValueError("refresh_at must be between 0 and 1")
 
 
 class UnflareRequestHandler(RequestHandler):
-    """Unflare proxy request handler for bypassing Cloudflare"""
+    """Unflare proxy request handler for bypassing Cloudflare
+
+    Requests to the target site go through one long-lived session whose cookie
+    jar and default headers hold the credentials from Unflare, so cached
+    requests reuse keep-alive connections. The session is rebuilt only when
+    the credentials rotate. Calls to the Unflare service use a separate pooled
+    session. Call ``aclose()`` (or use the handler as an async context manager)
+    when done.
+    """
 
     def __init__(self, config: UnflareConfig):
         self.config = config
         self._cached_cookies = None
+        self._cached_cookie_list = []
         self._cached_headers = None
         self._cache_expiry = 0
+        # Bumped whenever credentials are replaced, so requests that started
+        # with older credentials can tell they have since been refreshed
+        self._generation = 0
+        self._refreshes = SingleFlight()
+        self._service_session = None
+        self._site_session = None
+        self._site_session_generation = None
+        self._sessions_loop = None
+        # Requests in flight per site session; a session retired by a
+        # credential rotation is closed once its last request finishes
+        self._site_session_users: Dict[aiohttp.ClientSession, int] = {}
+        self._cache_issued = 0
+        self._background_refresh: Optional[asyncio.Task] = None
+        self._background_generation = None
+        self._paths = Counter()
+        self._restore_credentials()
 
     async def get(self, url: str, headers: Dict[str, str]) -> Optional[str]:
+        return (await self.fetch(url, headers)).text
+
+    async def fetch(self, url: str, headers: Dict[str, str]) -> HandlerResponse:
+        if self.config.retry_policy is None:
+            response = await self._fetch_once(url, headers)
+        else:
+            response = await self.config.retry_policy.run(
+                lambda: self._fetch_once(url, headers)
+            )
+        self._schedule_background_refresh(url)
+        return response
+
+    async def _fetch_once(self, url: str, headers: Dict[str, str]) -> HandlerResponse:
+        """Make a single request attempt, refreshing credentials if needed."""
+        generation = self._generation
         # Check if we have valid cached cookies
         if self.is_cache_valid():
+            self._paths["cached"] += 1
             result = await self._try_cached_request(url, headers)
-            if result is not None:
+            if result.status != 403:
+                # Only a challenge means the credentials failed; throttling
+                # and server errors go back to the caller (and any rate
+                # limiter or retry policy) instead of paying for a solve
                 return result
 
+        if self._generation != generation and self.is_cache_valid():
+            # Another request refreshed the credentials meanwhile - use them
+            self._paths["cached"] += 1
+            return await self._try_cached_request(url, headers)
+
         # Cache miss or expired - get fresh cookies from Unflare
         return await self._refresh_cache_and_request(url, headers)
 
@@ -54,100 +129,256 @@ class UnflareRequestHandler(RequestHandler):
 
     async def _try_cached_request(
         self, url: str, headers: Dict[str, str]
-    ) -> Optional[str]:
+    ) -> HandlerResponse:
         """Try to make request using cached cookies"""
+        generation = self._generation
         try:
             logger.info("Requesting with cached credentials")
-            final_headers = {**headers, **self._cached_headers}
-            final_headers["Accept-Encoding"] = "gzip, deflate, br"
-            if self._cached_cookies:
-                final_headers["Cookie"] = self._cached_cookies
-
-            timeout = aiohttp.ClientTimeout(total=120)
-            async with aiohttp.ClientSession(
-                headers=final_headers, timeout=timeout
-            ) as session:
-                async with session.get(url) as response:
+            async with self._using_site_session() as session:
+                async with session.get(
+                    url, headers=self._request_headers(session, headers)
+                ) as response:
                     if response.status == 200:
-                        return await response.text(encoding="utf-8")
+                        return HandlerResponse(
+                            status=200,
+                            text=await response.text(encoding="utf-8"),
+                            headers=dict(response.headers),
+                        )
                     if response.status == 403:
-                        # Cloudflare challenge - cookies expired
+                        # Cloudflare challenge - cookies expired, unless another
+                        # request has already replaced them
                         logger.warning("Cached cookies expired, refreshing...")
-                        self.clear_cache()
-                        return None
+                        if self._generation == generation:
+                            await self._expire_credentials(generation)
+                        return HandlerResponse(status=403)
+                    if response.status == 304:
+                        return HandlerResponse(
+                            status=304, headers=dict(response.headers)
+                        )
                     logger.warning(
                         "Cached request failed with status %d: %s",
                         response.status,
                         await response.text(),
                     )
-                    return None
+                    return HandlerResponse(
+                        status=response.status, headers=dict(response.headers)
+                    )
         except (aiohttp.ClientError, OSError) as e:
             logger.error("Cached request failed: %s", e)
-            return None
+            return HandlerResponse(status=0)
 
     async def _refresh_cache_and_request(
         self, url: str, headers: Dict[str, str]
-    ) -> Optional[str]:
-        """Get fresh cookies from Unflare and cache them"""
+    ) -> HandlerResponse:
+        """Get fresh cookies from Unflare and cache them, then make the request.
+
+        Concurrent callers share a single Unflare solve. The caller that
+        started it gets the page Unflare loaded, when the response includes
+        one; everyone else makes their own request with the new credentials.
+        """
+        refresh, shared = await self._refreshes.do(
+            "credentials", lambda: self._refresh_credentials(url)
+        )
+        if refresh.status != 200:
+            return refresh
+        if refresh.text is not None and not shared:
+            self._paths["unflare_body"] += 1
+            return refresh
+        self._paths["refetch"] += 1
+        return await self._try_cached_request(url, headers)
+
+    async def _refresh_credentials(self, url: str) -> HandlerResponse:
+        """Solve the challenge for ``url`` through Unflare and cache the result.
+
+        Credentials another process has saved to the credential store are
+        used instead of a new solve.
+
+        Returns:
+            Status 200 once credentials are cached, with the page Unflare
+            loaded for ``url`` as the text if it returned one, otherwise the
+            failure
+        """
+        if await self._restore_stored_credentials():
+            return HandlerResponse(status=200)
+
         logger.info("Requesting fresh credentials from Unflare")
         request_data = {"url": url, "timeout": self.config.timeout, "method": "GET"}
 
         if self.config.proxy:
             request_data["proxy"] = self.config.proxy
 
-        timeout = aiohttp.ClientTimeout(total=120)
         try:
-            async with aiohttp.ClientSession(timeout=timeout) as session:
-                async with session.post(
-                    self.config.url,
-                    json=request_data,
-                    headers={"Content-Type": "application/json"},
-                ) as response:
-                    if response.status != 200:
-                        logger.warning(
-                            "Unflare service returned status %d: %s",
-                            response.status,
-                            await response.text(),
-                        )
-                        return None
-
-                    result = await response.json()
+            async with self._get_service_session().post(
+                self.config.url,
+                json=request_data,
+                headers={"Content-Type": "application/json"},
+            ) as response:
+                if response.status != 200:
+                    logger.warning(
+                        "Unflare service returned status %d: %s",
+                        response.status,
+                        await response.text(),
+                    )
+                    return HandlerResponse(status=response.status)
 
-                    if "code" in result and result["code"] == "error":
-                        logger.error(
-                            "Unflare error: %s",
-                            result.get("message", "Unknown error"),
-                        )
-                        return None
-
-                    cookies = result.get("cookies", [])
-                    unflare_headers = result.get("headers", {})
-
-                    # Cache the cookies and headers
-                    self.cache_credentials(cookies, unflare_headers)
-
-                    # Build final headers
-                    final_headers = {**headers, **unflare_headers}
-                    final_headers["Accept-Encoding"] = "gzip, deflate, br"
-                    if self._cached_cookies:
-                        final_headers["Cookie"] = self._cached_cookies
-
-                    # Make the actual request
-                    async with aiohttp.ClientSession(
-                        headers=final_headers, timeout=timeout
-                    ) as final_session:
-                        async with final_session.get(url) as final_response:
-                            if final_response.status != 200:
-                                logger.warning(
-                                    "Final request failed with status %d: %s",
-                                    final_response.status,
-                                    await final_response.text(),
-                                )
-                                return None
-                            return await final_response.text(encoding="utf-8")
+                result = await response.json()
         except (aiohttp.ClientError, OSError) as e:
             logger.error("Unflare request failed: %s", e)
-            return None
+            return HandlerResponse(status=0)
+
+        if "code" in result and result["code"] == "error":
+            logger.error(
+                "Unflare error: %s",
+                result.get("message", "Unknown error"),
+            )
+            return HandlerResponse(status=0)
+
+        # Cache the cookies and headers, saving them off the event loop
+        credentials = self._cache_in_memory(
+            result.get("cookies", []), result.get("headers", {})
+        )
+        if self.config.credential_store is not None:
+            await asyncio.to_thread(self.config.credential_store.save, credentials)
+        body = result.get(self.config.body_field) if self.config.body_field else None
+        return HandlerResponse(status=200, text=body if body else None)
+
+    def _schedule_background_refresh(self, url: str):
+        """Start the background refresh for the current credentials, if enabled.
+
+        Each credential generation gets one background refresh; it is replaced
+        when the credentials change before it runs, and not retried if it fails
+        (expiry or a 403 then refreshes on the request path as usual).
+        """
+        if self.config.refresh_at is None or not self.is_cache_valid():
+            return
+        task = self._background_refresh
+        if task is not None and task.get_loop() is not asyncio.get_running_loop():
+            task = None
+        if task is not None and self._background_generation == self._generation:
+            return
+        if task is not None and not task.done():
+            task.cancel()
+
+        issued = self._cache_issued
+        refresh_time = issued + self.config.refresh_at * (
+            self.cache_expiry_time - issued
+        )
+        self._background_generation = self._generation
+        self._background_refresh = asyncio.create_task(
+            self._refresh_in_background(url, max(0.0, refresh_time - time.time()))
+        )
+
+    async def _refresh_in_background(self, url: str, delay: float):
+        """Re-solve the credentials for ``url`` after ``delay`` seconds.
+
+        The current credentials stay in use until the new ones replace them.
+        """
+        await asyncio.sleep(delay)
+        logger.info("Refreshing credentials before they expire")
+        refresh, _ = await self._refreshes.do(
+            "credentials", lambda: self._refresh_credentials(url)
+        )
+        if refresh.status != 200:
+            logger.warning(
+                "Background credential refresh failed with status %d", refresh.status
+            )
+
+    def _get_service_session(self) -> aiohttp.ClientSession:
+        """Return the pooled session for the Unflare service."""
+        self._check_sessions_loop()
+        if self._service_session is None or self._service_session.closed:
+            self._service_session = aiohttp.ClientSession(
+                timeout=self._service_timeout()
+            )
+        return self._service_session
+
+    @asynccontextmanager
+    async def _using_site_session(self) -> AsyncIterator[aiohttp.ClientSession]:
+        """Borrow the site session for one request."""
+        session = await self._get_site_session()
+        users = self._site_session_users
+        users[session] = users.get(session, 0) + 1
+        try:
+            yield session
+        finally:
+            remaining = users.pop(session, 1) - 1
+            if remaining:
+                users[session] = remaining
+            elif session is not self._site_session and not session.closed:
+                await session.close()
+
+    async def _get_site_session(self) -> aiohttp.ClientSession:
+        """Return the site session, rebuilding it if the credentials rotated."""
+        self._check_sessions_loop()
+        session = self._site_session
+        if session is not None and (
+            session.closed or self._site_session_generation != self._generation
+        ):
+            self._site_session = None
+            if session not in self._site_session_users:
+                await session.close()
+
+        if self._site_session is None:
+            self._site_session = aiohttp.ClientSession(
+                headers={
+                    **(self._cached_headers or {}),
+                    "Accept-Encoding": "gzip, deflate, br",
+                },
+                cookie_jar=self._cookie_jar(),
+                timeout=self._site_timeout(),
+            )
+            self._site_session_generation = self._generation
+        return self._site_session
+
+    def _check_sessions_loop(self):
+        """Forget sessions created on an event loop that is no longer running."""
+        loop = asyncio.get_running_loop()
+        if self._sessions_loop is not loop:
+            self._service_session = None
+            self._site_session = None
+            self._site_session_users.clear()
+            self._sessions_loop = loop
+
+    def _cookie_jar(self) -> aiohttp.CookieJar:
+        """Cookie jar holding the cached Unflare cookies."""
+        jar = aiohttp.CookieJar()
+        for cookie in self._cached_cookie_list:
+            morsel = SimpleCookie()
+            morsel[cookie["name"]] = cookie["value"]
+            # Without a domain the cookie is sent to every host
+            for attribute in ("domain", "path"):
+                if cookie.get(attribute):
+                    morsel[cookie["name"]][attribute] = cookie[attribute]
+            jar.update_cookies(morsel)
+        return jar
+
+    @staticmethod
+    def _request_headers(
+        session: aiohttp.ClientSession, headers: Dict[str, str]
+    ) -> Dict[str, str]:
+        """Caller headers that don't clash with the Unflare session headers."""
+        return {
+            name: value
+            for name, value in headers.items()
+            if name not in session.headers
+        }
+
+    def _site_timeout(self) -> aiohttp.ClientTimeout:
+        """Timeout for site requests, from the retry policy when configured."""
+        if self.config.retry_policy is None:
+            return aiohttp.ClientTimeout(total=120)
+        return self.config.retry_policy.timeout()
+
+    def _service_timeout(self) -> aiohttp.ClientTimeout:
+        """Timeout for Unflare solves: the solve's own limit plus a margin.
+
+        A solve sends nothing until the browser finishes, so the retry
+        policy's read timeout would cut solves short and retry them from
+        scratch.
+        """
+        return aiohttp.ClientTimeout(
+            total=self.config.timeout / 1000 + SERVICE_TIMEOUT_MARGIN
+        )
 
     def cache_credentials(self, cookies: list, unflare_headers: dict):
         """Cache cookies and headers with expiration.
@@ -158,15 +389,16 @@ class UnflareRequestHandler(RequestHandler):
 
         Useful for manually managing cache or pre-warming credentials.
         """
-        # Build cookie header
-        self._cached_cookies = (
-            "; ".join([f"{cookie['name']}={cookie['value']}" for cookie in cookies])
-            if cookies
-            else None
-        )
+        credentials = self._cache_in_memory(cookies, unflare_headers)
+        if self.config.credential_store is not None:
+            self.config.credential_store.save(credentials)
 
-        self._cached_headers = unflare_headers
+    def _cache_in_memory(self, cookies: list, unflare_headers: dict) -> Credentials:
+        """Make the credentials from an Unflare response the cached ones.
 
+        Returns:
+            The cached credentials, for saving to the credential store
+        """
         # Set cache expiry (use earliest cookie expiry or default to 1 hour)
         min_expiry = time.time() + 3600  # Default 1 hour
         for cookie in cookies:
@@ -174,17 +406,118 @@ class UnflareRequestHandler(RequestHandler):
                 min_expiry = min(min_expiry, cookie["expires"])
 
         # Add some buffer (5 minutes before actual expiry)
-        self._cache_expiry = min_expiry - 300
+        credentials = Credentials(
+            list(cookies), dict(unflare_headers), min_expiry - 300
+        )
+        self._set_credentials(credentials)
+        return credentials
 
     def clear_cache(self):
         """Clear cached credentials and force fresh requests.
 
+        Stored credentials are removed too, unless another process has already
+        replaced them.
+
         Useful for forcing fresh authentication or freeing memory.
         """
+        self._clear_stored(self._cached_cookie_list)
+        self._forget_credentials()
+
+    async def _expire_credentials(self, generation: int):
+        """Clear credentials a site rejected, touching the store off the loop.
+
+        The in-memory credentials are kept if another request replaced them
+        while the store was being cleared.
+        """
+        if self.config.credential_store is not None:
+            await asyncio.to_thread(self._clear_stored, self._cached_cookie_list)
+        if self._generation == generation:
+            self._forget_credentials()
+
+    def _clear_stored(self, cookies: list):
+        """Remove the stored credentials if they hold ``cookies``."""
+        store = self.config.credential_store
+        if store is not None:
+            stored = store.load()
+            if stored is not None and stored.cookies == cookies:
+                store.clear()
+
+    def _forget_credentials(self):
+        """Drop the in-memory credentials."""
         self._cached_cookies = None
+        self._cached_cookie_list = []
         self._cached_headers = None
         self._cache_expiry = 0
 
+    def _set_credentials(self, credentials: Credentials):
+        """Make ``credentials`` the cached credentials."""
+        # Build cookie header
+        self._cached_cookies = (
+            "; ".join(
+                [
+                    f"{cookie['name']}={cookie['value']}"
+                    for cookie in credentials.cookies
+                ]
+            )
+            if credentials.cookies
+            else None
+        )
+        self._cached_cookie_list = credentials.cookies
+        self._cached_headers = credentials.headers
+        self._cache_expiry = credentials.expiry
+        self._cache_issued = time.time()
+        self._generation += 1
+
+    def _restore_credentials(self) -> bool:
+        """Adopt unexpired credentials from the store that differ from ours.
+
+        Returns:
+            True if stored credentials were adopted, False otherwise
+        """
+        if self.config.credential_store is None:
+            return False
+        return self._adopt_stored(self.config.credential_store.load())
+
+    async def _restore_stored_credentials(self) -> bool:
+        """Like ``_restore_credentials``, loading the store in a worker thread."""
+        if self.config.credential_store is None:
+            return False
+        stored = await asyncio.to_thread(self.config.credential_store.load)
+        return self._adopt_stored(stored)
+
+    def _adopt_stored(self, stored: Optional[Credentials]) -> bool:
+        """Adopt ``stored`` if it is unexpired and differs from our credentials.
+
+        Returns:
+            True if the stored credentials were adopted, False otherwise
+        """
+        if (
+            stored is None
+            or stored.expiry <= time.time()
+            or (
+                stored.cookies == self._cached_cookie_list
+                and stored.expiry == self._cache_expiry
+            )
+        ):
+            return False
+        logger.info("Using stored credentials")
+        self._set_credentials(stored)
+        return True
+
+    @property
+    def path_counts(self) -> Dict[str, int]:
+        """Count of request attempts by path (read-only).
+
+        ``cached`` requests used cached credentials, ``unflare_body`` requests
+        were answered with the page from an Unflare solve, and ``refetch``
+        requests were made again after a solve.
+
+        Useful for monitoring how often requests pay for a solve.
+        """
+        return {
+            path: self._paths[path] for path in ("cached", "unflare_body", "refetch")
+        }
+
     @property
     def has_cached_cookies(self) -> bool:
         """Check if cookies are currently cached (read-only).
@@ -203,3 +536,32 @@ class UnflareRequestHandler(RequestHandler):
         Useful for debugging and monitoring cache lifetime.
         """
         return self._cache_expiry
+
+    @property
+    def credential_generation(self) -> int:
+        """Count of times credentials have been cached (read-only).
+
+        Changes whenever new credentials replace the cached ones, whether
+        solved, restored from the store, or set by ``cache_credentials``.
+
+        Useful for telling whether a request waited for new credentials.
+        """
+        return self._generation
+
+    async def aclose(self):
+        """Cancel any background refresh and close the Unflare and site sessions."""
+        task, self._background_refresh = self._background_refresh, None
+        if task is not None and task.get_loop() is asyncio.get_running_loop():
+            task.cancel()
+            with suppress(asyncio.CancelledError):
+                await task
+        self._refreshes.cancel()
+        sessions = {self._service_session, self._site_session}
+        sessions.update(self._site_session_users)
+        for session in sessions:
+            if session is not None and not session.closed:
+                await session.close()
+        self._service_session = None
+        self._site_session = None
+        self._site_session_users.clear()
+        self._sessions_loop = None
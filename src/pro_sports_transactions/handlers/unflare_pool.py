@@ -0,0 +1,199 @@
+"""Pool of Unflare endpoints with load balancing and health-based ejection."""
+
+import logging
+import time
+from dataclasses import dataclass, field, replace
+from typing import Dict, List, Optional, Union
+
+from .base_handler import HandlerResponse, RequestConfig, RequestHandler
+from .retry import RetryPolicy
+from .unflare_handler import UnflareConfig, UnflareRequestHandler
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class UnflareEndpoint:
+    """One Unflare service, optionally solving through its own proxy"""
+
+    url: str
+    proxy: Optional[Dict[str, any]] = None
+
+
+@dataclass
+class UnflarePoolConfig(RequestConfig):
+    """Configuration for a pool of Unflare endpoints.
+
+    Endpoint health is tracked as exponentially weighted averages of request
+    latency and error rate (``smoothing`` is the weight of each new request).
+    Requests that waited for an Unflare solve count toward the error rate but
+    not the latency.
+    Once an endpoint has ``min_requests`` requests, it is ejected for
+    ``ejection_time`` seconds when its error rate exceeds ``max_error_rate`` or
+    its latency exceeds ``max_latency``. A ``retry_policy`` applies to the pool,
+    so a retried request can move to another endpoint; its connect and read
+    timeouts also limit each endpoint's site requests.
+    """
+
+    endpoints: List[Union[str, UnflareEndpoint]] = field(default_factory=list)
+    timeout: int = 60000
+    retry_policy: Optional[RetryPolicy] = None
+    refresh_at: Optional[float] = None
+    smoothing: float = 0.3
+    min_requests: int = 5
+    max_error_rate: float = 0.5
+    max_latency: Optional[float] = None
+    ejection_time: float = 30.0
+
+    def __post_init__(self):
+        if not self.endpoints:
+            raise ValueError("endpoints must list at least one Unflare endpoint")
+
+
+@dataclass
+class EndpointHealth:
+    """Load and health of one endpoint in the pool"""
+
+    url: str
+    in_flight: int = 0
+    requests: int = 0
+    latency_samples: int = 0
+    latency: float = 0.0
+    error_rate: float = 0.0
+    ejected_until: float = 0.0
+
+    @property
+    def ejected(self) -> bool:
+        """True while the endpoint is ejected from the pool."""
+        return time.monotonic() < self.ejected_until
+
+
+class UnflarePoolRequestHandler(RequestHandler):
+    """Spreads requests across several Unflare endpoints
+
+    Each endpoint gets its own ``UnflareRequestHandler``, so credential caches
+    (and sessions) are independent per browser identity. Requests go to the
+    healthy endpoint with the fewest requests in flight, preferring lower
+    error rates and latency on ties. Endpoints whose errors or latency rise
+    past the configured limits are ejected for a while and then readmitted
+    with a clean record. If every endpoint is ejected, the one due back first
+    keeps serving.
+    """
+
+    def __init__(self, config: UnflarePoolConfig):
+        self.config = config
+        self.members: List[UnflareRequestHandler] = []
+        self.health: List[EndpointHealth] = []
+        # Members make one attempt with the policy's timeouts; the pool retries
+        member_policy = (
+            None
+            if config.retry_policy is None
+            else replace(config.retry_policy, max_attempts=1, deadline=None)
+        )
+        for endpoint in config.endpoints:
+            if isinstance(endpoint, str):
+                endpoint = UnflareEndpoint(endpoint)
+            self.members.append(
+                UnflareRequestHandler(
+                    UnflareConfig(
+                        url=endpoint.url,
+                        timeout=config.timeout,
+                        proxy=endpoint.proxy,
+                        retry_policy=member_policy,
+                        refresh_at=config.refresh_at,
+                    )
+                )
+            )
+            self.health.append(EndpointHealth(endpoint.url))
+
+    async def get(self, url: str, headers: Dict[str, str]) -> Optional[str]:
+        return (await self.fetch(url, headers)).text
+
+    async def fetch(self, url: str, headers: Dict[str, str]) -> HandlerResponse:
+        if self.config.retry_policy is None:
+            return await self._fetch_once(url, headers)
+        return await self.config.retry_policy.run(
+            lambda: self._fetch_once(url, headers)
+        )
+
+    async def _fetch_once(self, url: str, headers: Dict[str, str]) -> HandlerResponse:
+        """Make a single request attempt through the best endpoint."""
+        index = self._choose()
+        health = self.health[index]
+        member = self.members[index]
+        generation = member.credential_generation
+        health.in_flight += 1
+        start_time = time.monotonic()
+        try:
+            response = await member.fetch(url, headers)
+        except Exception:
+            self._record(health, None, failed=True)
+            raise
+        finally:
+            health.in_flight -= 1
+        # A request that waited for new credentials measures the solve, which
+        # is slow on every endpoint, rather than the endpoint's request latency
+        latency = (
+            time.monotonic() - start_time
+            if member.credential_generation == generation
+            else None
+        )
+        self._record(health, latency, failed=not (response.ok or response.not_modified))
+        return response
+
+    def _choose(self) -> int:
+        """Index of the endpoint to send the next request to."""
+        candidates = [
+            index for index, health in enumerate(self.health) if not health.ejected
+        ]
+        if not candidates:
+            return min(
+                range(len(self.health)), key=lambda i: self.health[i].ejected_until
+            )
+        return min(
+            candidates,
+            key=lambda i: (
+                self.health[i].in_flight,
+                self.health[i].error_rate,
+                self.health[i].latency,
+            ),
+        )
+
+    def _record(self, health: EndpointHealth, latency: Optional[float], failed: bool):
+        """Fold one request into the endpoint's health; eject it if unhealthy."""
+        if health.ejected:
+            return
+        weight = 1.0 if health.requests == 0 else self.config.smoothing
+        health.error_rate += weight * (float(failed) - health.error_rate)
+        if latency is not None:
+            weight = 1.0 if health.latency_samples == 0 else self.config.smoothing
+            health.latency += weight * (latency - health.latency)
+            health.latency_samples += 1
+        health.requests += 1
+
+        if health.requests < self.config.min_requests:
+            return
+        too_slow = (
+            self.config.max_latency is not None
+            and health.latency > self.config.max_latency
+        )
+        if health.error_rate > self.config.max_error_rate or too_slow:
+            logger.warning(
+                "Ejecting Unflare endpoint %s for %.0fs "
+                "(error rate %.2f, latency %.2fs)",
+                health.url,
+                self.config.ejection_time,
+                health.error_rate,
+                health.latency,
+            )
+            health.ejected_until = time.monotonic() + self.config.ejection_time
+            # Readmit with a clean record once the ejection ends
+            health.requests = 0
+            health.latency_samples = 0
+            health.latency = 0.0
+            health.error_rate = 0.0
+
+    async def aclose(self):
+        """Close every endpoint's handler."""
+        for member in self.members:
+            await member.aclose()
@@ -0,0 +1,53 @@
+"""Player-level normalization of search results.
+
+The Acquired and Relinquished cells list every player (or pick) a transaction
+moved, each preceded by a bullet, e.g. "• Kevin Durant • Kyrie Irving", and
+sometimes with an alias in parentheses. ``player_rows`` turns a results
+DataFrame into one row per transaction, player, and direction using pandas'
+vectorized string operations, with no per-row Python.
+"""
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from pandas import DataFrame
+
+PLAYER_COLUMNS = ("Transaction", "Date", "Team", "Player", "Direction", "Notes")
+DIRECTIONS = ("Acquired", "Relinquished")
+
+# A bullet, then the player's name (trimmed) and any parenthetical aliases
+# after it, e.g. "• Nene (Nene Hilario)"
+_PLAYER = r"•\s*([^•(]*[^•(\s])(?:\s*\([^)]*\))*"
+
+
+def player_rows(df: "DataFrame") -> "DataFrame":
+    """Explode a results DataFrame into one row per transaction and player.
+
+    Returns:
+        DataFrame with columns: Transaction (the row of the transaction in
+        ``df``), Date, Team, Player, Direction ("Acquired" or "Relinquished"),
+        Notes. Rows follow the transactions' order, acquired players first,
+        each cell's players in listed order. Bullets and parenthetical aliases
+        are stripped from player names. ``df.attrs`` are carried over.
+    """
+    moves = (
+        df.rename_axis("Transaction")
+        .reset_index()
+        .melt(
+            id_vars=["Transaction", "Date", "Team", "Notes"],
+            value_vars=list(DIRECTIONS),
+            var_name="Direction",
+            value_name="Player",
+        )
+    )
+    # Most transactions move players one way: skip the empty cells up front
+    moves = moves[moves["Player"] != ""]
+    # One regex pass finds every name, already free of bullets and aliases
+    players = moves["Player"].str.findall(_PLAYER).explode().dropna()
+
+    # Repeat each move once per player it lists (explode keeps the move's label)
+    rows = moves.loc[players.index].assign(Player=players.to_numpy())
+    rows = rows.sort_values("Transaction", kind="stable", ignore_index=True)
+    rows = rows[list(PLAYER_COLUMNS)]
+    rows.attrs = dict(df.attrs)
+    return rows
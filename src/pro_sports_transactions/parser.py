@@ -0,0 +1,184 @@
+"""Parser for Pro Sports Transactions search results pages.
+
+Locates the results table and the pager that follows it with lxml and reads
+the transaction rows and page count in one pass, instead of parsing every
+table on the page into DataFrames. lxml is imported on the first parse, so
+importing the package stays fast for code that never parses a page.
+"""
+
+import asyncio
+import functools
+import re
+import sys
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from types import ModuleType
+from typing import TYPE_CHECKING, Callable, List, NamedTuple, Optional, Tuple
+
+from .records import COLUMNS
+
+if TYPE_CHECKING:
+    from lxml import etree
+
+# Same whitespace normalisation as pandas.read_html, so cell text is unchanged
+_WHITESPACE = re.compile(r"[\r\n]+|\s{2,}")
+_CELL_TAGS = ("td", "th")
+
+
+@dataclass(frozen=True)
+class ResultsPage:
+    """Transactions and page count read from one or more search results pages.
+
+    ``rows`` hold one ``(Date, Team, Acquired, Relinquished, Notes)`` tuple of
+    strings per transaction. ``errors`` describe pages that failed to load.
+    """
+
+    rows: Tuple[Tuple[str, ...], ...]
+    pages: int
+    errors: Tuple[str, ...] = ()
+
+    @property
+    def nbytes(self) -> int:
+        """Estimated memory held by the page in bytes."""
+        return (
+            sys.getsizeof(self.rows)
+            + sum(sys.getsizeof(row) for row in self.rows)
+            + sum(sys.getsizeof(cell) for row in self.rows for cell in row)
+        )
+
+
+def parse_results(page: str) -> ResultsPage:
+    """Parse a search results page.
+
+    Raises:
+        ValueError: When the page holds no results table ("No tables found",
+            as for pages reporting no matching transactions) or the pager's
+            page count is not a number
+        IndexError: When the pager is missing or malformed
+    """
+    lxml = _lxml()
+    table = _results_table(page, lxml)
+    rows = lxml.rows(table)
+    if not rows:
+        raise ValueError("No tables found")
+
+    # The first row labels the columns; find ours by name
+    header = _cells(rows[0])
+    positions = [header.index(name) if name in header else None for name in COLUMNS]
+    transactions = []
+    for row in rows[1:]:
+        cells = _cells(row)
+        transactions.append(
+            tuple(
+                cells[i] if i is not None and i < len(cells) else "" for i in positions
+            )
+        )
+
+    return ResultsPage(tuple(transactions), _page_count(table, lxml))
+
+
+class ParseExecutor:
+    """Runs ``parse_results`` in a worker pool, off the event loop.
+
+    Workers receive the raw HTML and return a compact ``ResultsPage`` of row
+    tuples, so only strings cross a process boundary. A thread pool (the
+    default) keeps the event loop free to handle network I/O while pages
+    parse; a process pool (``processes=True``) also spreads parsing across
+    cores. An existing ``executor`` can be given instead; it is then left
+    running by ``shutdown()``.
+
+    Share one ``ParseExecutor`` between searches, e.g.
+    ``Search(parse_executor=...)``, and shut it down when done (or use it as a
+    context manager).
+    """
+
+    def __init__(
+        self,
+        executor: Optional[Executor] = None,
+        processes: bool = False,
+        max_workers: Optional[int] = None,
+    ):
+        self._owned = executor is None
+        if executor is None:
+            pool = ProcessPoolExecutor if processes else ThreadPoolExecutor
+            executor = pool(max_workers=max_workers)
+        self.executor = executor
+
+    async def parse_results(self, page: str) -> ResultsPage:
+        """Parse a search results page in the pool (see ``parse_results``)."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, parse_results, page)
+
+    def shutdown(self, wait: bool = True):
+        """Shut down the pool, unless it was given by the caller."""
+        if self._owned:
+            self.executor.shutdown(wait=wait)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.shutdown()
+
+
+class _Lxml(NamedTuple):
+    """lxml's etree module and the compiled queries the parser runs."""
+
+    etree: ModuleType
+    results_table: Callable
+    rows: Callable
+    pager: Callable
+
+
+@functools.cache
+def _lxml() -> _Lxml:
+    """Import lxml and compile the parser's queries, once."""
+    from lxml import etree
+
+    return _Lxml(
+        etree=etree,
+        results_table=etree.XPath(
+            "//table[contains(concat(' ', normalize-space(@class), ' '),"
+            " ' datatable ')]"
+        ),
+        rows=etree.XPath("./tr | ./thead/tr | ./tbody/tr | ./tfoot/tr"),
+        pager=etree.XPath("following::table[1]"),
+    )
+
+
+def _results_table(page: str, lxml: _Lxml) -> "etree.ElementBase":
+    """The results table element of ``page``."""
+    # Plain etree elements: lxml.html's element classes cost a lookup per node
+    document = lxml.etree.fromstring(page, lxml.etree.HTMLParser())
+    tables = [] if document is None else lxml.results_table(document)
+    if not tables:
+        raise ValueError("No tables found")
+    return tables[0]
+
+
+def _page_count(table: "etree.ElementBase", lxml: _Lxml) -> int:
+    """Read the page count from the pager following the results table.
+
+    The pager's third cell lists the page links ("1 2 3 ... 12"); the last
+    one is the page count.
+    """
+    pager: Optional["etree.ElementBase"] = next(iter(lxml.pager(table)), None)
+    if pager is None:
+        raise IndexError("list index out of range")
+    return int(_cells(lxml.rows(pager)[0])[2].split(" ")[-1])
+
+
+def _cells(row: "etree.ElementBase") -> List[str]:
+    """Text of each cell in ``row``, with whitespace normalised like read_html."""
+    cells = []
+    for cell in row:
+        if cell.tag not in _CELL_TAGS:
+            continue
+        # Most cells hold plain text: skip itertext() when there are no children
+        text = "".join(cell.itertext()) if len(cell) else (cell.text or "")
+        text = text.strip()
+        # Only regular, single spaces: the normalisation would change nothing
+        if not text.isprintable() or "  " in text:
+            text = _WHITESPACE.sub(" ", text)
+        cells.append(text)
+    return cells
@@ -0,0 +1,49 @@
+"""Record type for search results, for callers that don't need a DataFrame."""
+
+from dataclasses import dataclass
+from datetime import date
+from typing import Dict, Sequence
+
+COLUMNS = ("Date", "Team", "Acquired", "Relinquished", "Notes")
+
+
+@dataclass(frozen=True, slots=True)
+class Transaction:
+    """One transaction from a search results page.
+
+    ``acquired`` and ``relinquished`` hold the player (or pick) names as listed
+    on the page, e.g. "• LeBron James", and are empty when not applicable.
+    """
+
+    date: date
+    team: str
+    acquired: str
+    relinquished: str
+    notes: str
+
+    @classmethod
+    def from_row(cls, row: Sequence[str]) -> "Transaction":
+        """Create a transaction from a row of strings read from a results page.
+
+        Raises:
+            ValueError: When the date is not in ISO format (YYYY-MM-DD)
+        """
+        day, team, acquired, relinquished, notes = row
+        return cls(date.fromisoformat(day), team, acquired, relinquished, notes)
+
+    def to_dict(self) -> Dict[str, str]:
+        """The transaction as a dictionary keyed by column name."""
+        return row_dict(
+            (
+                self.date.isoformat(),
+                self.team,
+                self.acquired,
+                self.relinquished,
+                self.notes,
+            )
+        )
+
+
+def row_dict(row: Sequence[str]) -> Dict[str, str]:
+    """A results page row as a dictionary keyed by column name."""
+    return dict(zip(COLUMNS, row, strict=True))
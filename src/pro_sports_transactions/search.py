@@ -4,18 +4,29 @@ This module provides classes and utilities for searching and retrieving
 professional sports transaction data from prosportstransactions.com.
 """
 
+import asyncio
 import json
+import logging
 import warnings
+from collections import deque
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
 from datetime import date
 from enum import Enum, StrEnum
-from io import StringIO
-from typing import Dict, Optional
+from typing import TYPE_CHECKING, AsyncIterator, Dict, List, Optional, Sequence
 from urllib import parse
 
-import pandas as pd
-from pandas import DataFrame, read_html
-
 from .handlers import DirectRequestHandler, RequestHandler
+from .handlers.base_handler import Parse, apply_parse
+from .handlers.single_flight import SingleFlight
+from .normalize import player_rows
+from .parser import COLUMNS, ParseExecutor, ResultsPage, parse_results
+from .records import Transaction, row_dict
+
+if TYPE_CHECKING:
+    from pandas import DataFrame
+
+logger = logging.getLogger(__name__)
 
 
 class League(StrEnum):
@@ -49,7 +60,16 @@ class TransactionType(Enum):
 
 
 class Search:
-    """Main class for searching professional sports transactions."""
+    """Main class for searching professional sports transactions.
+
+    A search fetches and parses its results once and holds them as rows of
+    strings: the DataFrame, dictionary, JSON, and ``Transaction`` record views
+    are all derived from the held rows, and a DataFrame is only built when one
+    is asked for. Call ``refresh()`` to fetch them again.
+
+    Pages are parsed on the event loop unless a ``parse_executor`` is given, in
+    which case they are parsed in its worker pool while other pages download.
+    """
 
     def __init__(
         self,
@@ -61,6 +81,7 @@ class Search:
         team: str = None,
         starting_row: int = 0,
         request_handler: Optional[RequestHandler] = None,
+        parse_executor: Optional[ParseExecutor] = None,
     ):
         # Resolve date defaults at call time. Using date.today() as an argument
         # default would freeze the value at import time (evaluated once), so a
@@ -69,76 +90,308 @@ class Search:
             start_date = date.today()
         if end_date is None:
             end_date = date.today()
-        self._url = UrlBuilder.build(
-            league=league,
-            transaction_types=transaction_types,
-            start_date=start_date,
-            end_date=end_date,
-            player=player,
-            team=team,
-            starting_row=starting_row,
-        )
-        # Track if custom handler was provided for backward compatibility
-        self._custom_handler = request_handler is not None
-        self._request_handler = request_handler or DirectRequestHandler()
-
-    async def get_dataframe(self) -> DataFrame:
+        # Keep the query (minus pagination) so other pages can be built later
+        self._query = {
+            "league": league,
+            "transaction_types": transaction_types,
+            "start_date": start_date,
+            "end_date": end_date,
+            "player": player,
+            "team": team,
+        }
+        self._starting_row = starting_row
+        self._url = UrlBuilder.build(**self._query, starting_row=starting_row)
+        # Without a custom handler, single pages go through Http.get() for
+        # backward compatibility and multi-page calls open their own handler
+        self._request_handler = request_handler
+        self._parse_executor = parse_executor
+        # Parsed results held for reuse, keyed by "page" or "all"
+        self._results: Dict[str, ResultsPage] = {}
+        self._loads = SingleFlight()
+
+    async def get_dataframe(self) -> "DataFrame":
         """Get search results as a pandas DataFrame.
 
         Returns:
             DataFrame with columns: Date, Team, Acquired, Relinquished, Notes
             Includes attrs['pages'] for pagination info and attrs['errors'] if any
         """
-        # Generic DataFrame to hold results
-        # For backward compatibility, use Http.get() when using default handler
-        if not self._custom_handler:
-            response = await Http.get(self._url)
-        else:
-            response = await self._request_handler.get(self._url, headers)
-
-        df = None
-        try:
-            # Wrap the HTML in StringIO: pandas 3.0 dropped read_html's implicit
-            # acceptance of a literal HTML string (it now treats a bare str as a
-            # path/URL). StringIO is also accepted by pandas 2.2.x, so this works
-            # across the whole supported range.
-            df_list = read_html(StringIO(response), header=0, keep_default_na=False)
-            df = pd.DataFrame(
-                df_list[0],
-                columns=["Date", "Team", "Acquired", "Relinquished", "Notes"],
-            )
-            df.attrs["pages"] = int(df_list[1].columns[2].split(" ")[-1])
-        except (ValueError, IndexError, AttributeError, TypeError) as e:
-            df = pd.DataFrame(
-                columns=["Date", "Team", "Acquired", "Relinquished", "Notes"]
-            )
-            df.attrs["pages"] = 0
-            df.attrs["errors"] = (repr(e),)
-
-        return df
+        return results_frame(await self.first_page())
 
     async def get_dict(self):
         """Get search results as a dictionary."""
-        df = await self.get_dataframe()
-
-        data = {}
-        data["transactions"] = df.to_dict(orient="records")
-        data["pages"] = df.attrs["pages"]
-        if "errors" in df.attrs:
-            data["errors"] = df.attrs["errors"]
-        return data
+        return results_dict(await self.first_page())
 
     async def get_json(self):
         """Get search results as JSON string."""
         return json.dumps(await self.get_dict())
 
+    async def get_records(self) -> List[Transaction]:
+        """Get search results as ``Transaction`` records, without pandas.
+
+        Raises:
+            ValueError: When a transaction's date is not in ISO format
+        """
+        return results_records(await self.first_page())
+
+    async def get_all_dataframe(self, max_concurrency: int = 5) -> "DataFrame":
+        """Get every page of search results as a single pandas DataFrame.
+
+        The first page is fetched to learn the page count, then the remaining
+        pages are fetched concurrently and reassembled in page order.
+
+        Args:
+            max_concurrency: Maximum number of pages fetched at the same time
+
+        Returns:
+            DataFrame with columns: Date, Team, Acquired, Relinquished, Notes
+            Includes attrs['pages'] for pagination info and attrs['errors'] if any
+        """
+        return results_frame(await self._all_pages(max_concurrency))
+
+    async def get_all_dict(self, max_concurrency: int = 5):
+        """Get every page of search results as a dictionary."""
+        return results_dict(await self._all_pages(max_concurrency))
+
+    async def get_all_json(self, max_concurrency: int = 5):
+        """Get every page of search results as JSON string."""
+        return json.dumps(await self.get_all_dict(max_concurrency))
+
+    async def get_all_records(self, max_concurrency: int = 5) -> List[Transaction]:
+        """Get every page of search results as ``Transaction`` records.
+
+        Raises:
+            ValueError: When a transaction's date is not in ISO format
+        """
+        return results_records(await self._all_pages(max_concurrency))
+
+    async def get_player_dataframe(self) -> "DataFrame":
+        """Get search results as one row per transaction, player, and direction.
+
+        Returns:
+            DataFrame with columns: Transaction, Date, Team, Player, Direction,
+            Notes (see ``normalize.player_rows``)
+            Includes attrs['pages'] for pagination info and attrs['errors'] if any
+        """
+        return player_rows(await self.get_dataframe())
+
+    async def get_all_player_dataframe(self, max_concurrency: int = 5) -> "DataFrame":
+        """Get every page of search results as one row per transaction, player,
+        and direction (see ``get_player_dataframe``)."""
+        return player_rows(await self.get_all_dataframe(max_concurrency))
+
+    async def iter_transactions(self, max_pages_in_flight: int = 2):
+        """Iterate over every search result, one transaction at a time.
+
+        Pages are fetched lazily: while the caller consumes one page, up to
+        ``max_pages_in_flight`` following pages are fetched ahead. Memory stays
+        bounded by that window rather than by the size of the whole search.
+        Pages that fail to fetch or parse are logged and skipped, except the
+        first: it carries the page count, so an exception fetching it is
+        raised.
+
+        Args:
+            max_pages_in_flight: Maximum number of pages fetched ahead
+
+        Yields:
+            Dictionaries with keys: Date, Team, Acquired, Relinquished, Notes
+        """
+        if max_pages_in_flight < 1:
+            raise ValueError("max_pages_in_flight must be at least 1")
+
+        async with scoped_handler(self._request_handler) as handler:
+            page = await self.first_page(handler)
+            remaining = iter(self._remaining_rows(page.pages))
+            pending = deque()
+
+            def read_ahead():
+                while len(pending) < max_pages_in_flight:
+                    starting_row = next(remaining, None)
+                    if starting_row is None:
+                        return
+                    pending.append(
+                        asyncio.ensure_future(self._fetch_page(starting_row, handler))
+                    )
+
+            read_ahead()
+            try:
+                while page is not None:
+                    if page.errors:
+                        logger.warning("Skipping page: %s", page.errors)
+                    for row in page.rows:
+                        yield row_dict(row)
+                    if not pending:
+                        break
+                    try:
+                        page = await pending.popleft()
+                    except Exception as e:
+                        page = self._error_page(e)
+                    read_ahead()
+            finally:
+                # Consumer stopped early (break, exception, aclose): drop
+                # read-ahead, collecting its outcomes before the handler closes
+                for task in pending:
+                    task.cancel()
+                await asyncio.gather(*pending, return_exceptions=True)
+
+    async def refresh(self) -> None:
+        """Discard the held results and fetch this search's page again.
+
+        Only the page is fetched; ask for any view of it afterwards, e.g.
+        ``get_dataframe()`` or ``get_json()``.
+        """
+        self._results.clear()
+        await self.first_page()
+
     async def get_url(self):
         """Get the search URL."""
         return self._url
 
+    async def first_page(self, handler: Optional[RequestHandler] = None) -> ResultsPage:
+        """The results of this search's own page, held once loaded.
+
+        Fetched through ``handler`` when given. Together with
+        ``remaining_pages`` this is the page-level API ``ShardedSearch``
+        builds on.
+        """
+        return await self._memoized("page", lambda: self._load(self._url, handler))
+
+    async def _all_pages(self, max_concurrency: int) -> ResultsPage:
+        """The results of every page of this search, in page order.
+
+        The first page is fetched to learn the page count, then the remaining
+        pages are fetched concurrently.
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+
+        async def load_all() -> ResultsPage:
+            async with scoped_handler(self._request_handler) as handler:
+                first = await self.first_page(handler)
+                semaphore = asyncio.Semaphore(max_concurrency)
+                rest = await self.remaining_pages(first, semaphore, handler)
+            return combine_pages([first, *rest], page_count=first.pages)
+
+        return await self._memoized("all", load_all)
+
+    async def _memoized(self, key: str, load) -> ResultsPage:
+        """Return the held results for ``key``, loading them if needed.
+
+        Concurrent first calls share one load. Results carrying errors are
+        returned but not held, so the next call tries again. Held results are
+        immutable; every view of them is built afresh for its caller.
+        """
+        page = self._results.get(key)
+        if page is None:
+            page, _ = await self._loads.do(key, load)
+            if not page.errors:
+                self._results[key] = page
+        return page
+
+    async def _load(
+        self, url: str, handler: Optional[RequestHandler] = None
+    ) -> ResultsPage:
+        """Fetch and parse one page of search results."""
+        handler = handler or self._request_handler
+        # For backward compatibility, single pages without a handler use Http.get()
+        if handler is None:
+            return await apply_parse(self._parser, await Http.get(url))
+        return await handler.get_parsed(url, headers, self._parser)
+
+    @property
+    def _parser(self) -> Parse:
+        """The parse function for this search's pages."""
+        if self._parse_executor is None:
+            return self._parse
+        return _ExecutorParse(self._parse_executor)
+
+    async def _fetch_page(
+        self, starting_row: int, handler: RequestHandler
+    ) -> ResultsPage:
+        """Fetch and parse the page of this search at ``starting_row``."""
+        url = UrlBuilder.build(**self._query, starting_row=starting_row)
+        return await self._load(url, handler)
+
+    async def remaining_pages(
+        self,
+        first: ResultsPage,
+        semaphore: asyncio.Semaphore,
+        handler: RequestHandler,
+    ) -> List[ResultsPage]:
+        """Fetch the pages after ``first`` concurrently, in page order."""
+
+        async def fetch_page(starting_row: int) -> ResultsPage:
+            async with semaphore:
+                return await self._fetch_page(starting_row, handler)
+
+        return await asyncio.gather(
+            *(fetch_page(row) for row in self._remaining_rows(first.pages))
+        )
+
+    def _remaining_rows(self, pages: int) -> range:
+        """Starting rows of the pages after this search's own page."""
+        return range(
+            self._starting_row + ROWS_PER_PAGE, pages * ROWS_PER_PAGE, ROWS_PER_PAGE
+        )
+
+    @staticmethod
+    def _parse(response: Optional[str]) -> ResultsPage:
+        """Parse a search results page."""
+        try:
+            if response is None:
+                raise TypeError("cannot parse from 'NoneType'")
+            return parse_results(response)
+        except PARSE_ERRORS as e:
+            return Search._error_page(e)
+
+    @staticmethod
+    def _error_page(error: Exception) -> ResultsPage:
+        """The results of a page that failed to parse."""
+        return ResultsPage(rows=(), pages=0, errors=(repr(error),))
+
+
+def combine_pages(pages: Sequence[ResultsPage], page_count: int) -> ResultsPage:
+    """Concatenate result pages, carrying page count and any page errors."""
+    return ResultsPage(
+        rows=tuple(row for page in pages for row in page.rows),
+        pages=page_count,
+        errors=tuple(e for page in pages for e in page.errors),
+    )
+
+
+def results_frame(page: ResultsPage) -> "DataFrame":
+    """Build the results DataFrame for parsed results."""
+    # pandas is imported on first use: it dominates the package import time
+    import pandas as pd
+
+    df = pd.DataFrame(list(page.rows), columns=list(COLUMNS))
+    df.attrs["pages"] = page.pages
+    if page.errors:
+        df.attrs["errors"] = page.errors
+    return df
+
+
+def results_dict(page: ResultsPage) -> Dict:
+    """Convert parsed results into the dictionary output format."""
+    data = {}
+    data["transactions"] = [row_dict(row) for row in page.rows]
+    data["pages"] = page.pages
+    if page.errors:
+        data["errors"] = page.errors
+    return data
+
+
+def results_records(page: ResultsPage) -> List[Transaction]:
+    """Convert parsed results into ``Transaction`` records."""
+    return [Transaction.from_row(row) for row in page.rows]
+
 
 NETLOC = "https://www.prosportstransactions.com"
 PATH = "Search/SearchResults.php"
+# Pro Sports Transactions returns 25 rows per results page
+ROWS_PER_PAGE = 25
+# Parse failures reported in a result's errors rather than raised
+PARSE_ERRORS = (ValueError, IndexError, AttributeError, TypeError)
 
 headers = {
     "accept": "*/*",
@@ -155,6 +408,25 @@ headers = {
 }
 
 
+@dataclass(frozen=True)
+class _ExecutorParse:
+    """Parse function that runs ``parse_results`` in a ``ParseExecutor``.
+
+    Instances for the same executor are equal, so caches keyed by parse
+    function (coalescing, in-memory cache) are shared between searches.
+    """
+
+    executor: ParseExecutor
+
+    async def __call__(self, response: Optional[str]) -> ResultsPage:
+        try:
+            if response is None:
+                raise TypeError("cannot parse from 'NoneType'")
+            return await self.executor.parse_results(response)
+        except PARSE_ERRORS as e:
+            return Search._error_page(e)
+
+
 class Parameter:
     """Utility class for creating search parameters."""
 
@@ -236,6 +508,22 @@ class UrlBuilder:
 
 
 # Backward compatibility - deprecated Http class
+@asynccontextmanager
+async def scoped_handler(
+    request_handler: Optional[RequestHandler],
+) -> AsyncIterator[RequestHandler]:
+    """``request_handler``, or a ``DirectRequestHandler`` open for the block.
+
+    Multi-page calls made without a request handler fetch all their pages
+    through one pooled handler, closed when the call ends.
+    """
+    if request_handler is not None:
+        yield request_handler
+        return
+    async with DirectRequestHandler() as handler:
+        yield handler
+
+
 class Http:
     """
     Deprecated: Use DirectRequestHandler from .handlers instead.
@@ -251,5 +539,5 @@ class Http:
             DeprecationWarning,
             stacklevel=2,
         )
-        handler = DirectRequestHandler()
-        return await handler.get(url, headers)
+        async with DirectRequestHandler() as handler:
+            return await handler.get(url, headers)
@@ -0,0 +1,206 @@
+"""Date-range sharding for large searches.
+
+A single search over a long date range is served as many ``starting_row``
+pages. Deep pagination is slow (pages are only discovered one search at a
+time), fragile (a late-page failure means starting over) and inconsistent
+(rows inserted on the site shift later pages). This module splits the date
+range into independent windows, subdivides any window whose first page still
+reports many pages, runs the windows concurrently, and merges the results.
+"""
+
+import asyncio
+import json
+from dataclasses import dataclass, replace
+from datetime import date, timedelta
+from enum import StrEnum
+from typing import TYPE_CHECKING, List, Optional, Tuple
+
+from .handlers import RequestHandler
+from .parser import ParseExecutor, ResultsPage
+from .search import (
+    League,
+    Search,
+    TransactionType,
+    combine_pages,
+    results_dict,
+    results_frame,
+    scoped_handler,
+)
+
+if TYPE_CHECKING:
+    from pandas import DataFrame
+
+
+class Granularity(StrEnum):
+    """Calendar unit used for the initial date windows."""
+
+    MONTH = "month"
+    WEEK = "week"
+
+
+@dataclass(frozen=True)
+class DateWindow:
+    """An inclusive range of dates searched as one shard."""
+
+    start: date
+    end: date
+
+    @property
+    def days(self) -> int:
+        """Number of days covered by the window."""
+        return (self.end - self.start).days + 1
+
+    def split(self) -> Tuple["DateWindow", "DateWindow"]:
+        """Split the window into two halves."""
+        middle = self.start + timedelta(days=self.days // 2 - 1)
+        return (
+            DateWindow(self.start, middle),
+            DateWindow(middle + timedelta(days=1), self.end),
+        )
+
+
+def plan_windows(
+    start_date: date, end_date: date, granularity: Granularity = Granularity.MONTH
+) -> List[DateWindow]:
+    """Split a date range into calendar-aligned windows.
+
+    Windows follow calendar months or ISO weeks (Monday to Sunday); the first
+    and last windows are clipped to the requested range.
+    """
+    if end_date < start_date:
+        raise ValueError("end_date must not be before start_date")
+
+    windows = []
+    start = start_date
+    while start <= end_date:
+        if granularity == Granularity.MONTH:
+            next_start = (start.replace(day=1) + timedelta(days=32)).replace(day=1)
+        else:
+            next_start = start + timedelta(days=7 - start.weekday())
+        end = min(next_start - timedelta(days=1), end_date)
+        windows.append(DateWindow(start, end))
+        start = next_start
+    return windows
+
+
+class ShardedSearch:
+    """Search a long date range as concurrent, independently paged shards.
+
+    The range is planned into calendar windows (see ``plan_windows``). Each
+    window's first page is fetched; windows reporting more than
+    ``max_pages_per_shard`` pages are halved until they fit (or cover a single
+    day), then every shard's remaining pages are fetched. All page fetches
+    share one ``max_concurrency`` limit. Results are merged in date order and
+    duplicate rows (e.g. from rows shifting between pages) are dropped.
+    """
+
+    def __init__(
+        self,
+        league: League = League.NBA,
+        transaction_types: TransactionType = (),
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        player: str = None,
+        team: str = None,
+        request_handler: Optional[RequestHandler] = None,
+        granularity: Granularity = Granularity.MONTH,
+        max_pages_per_shard: int = 4,
+        max_concurrency: int = 5,
+        parse_executor: Optional[ParseExecutor] = None,
+    ):
+        if max_pages_per_shard < 1:
+            raise ValueError("max_pages_per_shard must be at least 1")
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+
+        # Resolve date defaults at call time (see Search.__init__).
+        if start_date is None:
+            start_date = date.today()
+        if end_date is None:
+            end_date = date.today()
+        self._query = {
+            "league": league,
+            "transaction_types": transaction_types,
+            "player": player,
+            "team": team,
+            "request_handler": request_handler,
+            "parse_executor": parse_executor,
+        }
+        self._windows = plan_windows(start_date, end_date, granularity)
+        self._max_pages_per_shard = max_pages_per_shard
+        self._max_concurrency = max_concurrency
+
+    @property
+    def windows(self) -> List[DateWindow]:
+        """The initial calendar windows, before adaptive subdivision."""
+        return list(self._windows)
+
+    async def get_dataframe(self) -> "DataFrame":
+        """Get every result in the date range as a pandas DataFrame.
+
+        Returns:
+            DataFrame with columns: Date, Team, Acquired, Relinquished, Notes
+            Includes attrs['pages'] (pages fetched across all shards),
+            attrs['shards'] (shards searched) and attrs['errors'] if any
+        """
+        results, shards = await self._search()
+        df = results_frame(results)
+        df.attrs["shards"] = shards
+        return df
+
+    async def get_dict(self):
+        """Get every result in the date range as a dictionary."""
+        results, shards = await self._search()
+        data = results_dict(results)
+        data["shards"] = shards
+        return data
+
+    async def get_json(self):
+        """Get every result in the date range as JSON string."""
+        return json.dumps(await self.get_dict())
+
+    async def _search(self) -> Tuple[ResultsPage, int]:
+        """Search every shard; returns the merged results and the shard count."""
+        semaphore = asyncio.Semaphore(self._max_concurrency)
+        async with scoped_handler(self._query["request_handler"]) as handler:
+            planned = await asyncio.gather(
+                *(
+                    self._search_window(window, semaphore, handler)
+                    for window in self._windows
+                )
+            )
+        shards = [shard for window_shards in planned for shard in window_shards]
+
+        results = combine_pages(
+            [page for shard in shards for page in shard],
+            page_count=sum(shard[0].pages for shard in shards),
+        )
+        # Keep the first of any duplicate rows, in date order
+        return replace(results, rows=tuple(dict.fromkeys(results.rows))), len(shards)
+
+    async def _search_window(
+        self, window: DateWindow, semaphore: asyncio.Semaphore, handler: RequestHandler
+    ) -> List[List[ResultsPage]]:
+        """Search one window, subdividing it while it reports too many pages.
+
+        Returns one list of pages per shard the window ended up split into.
+        """
+        search = Search(
+            **{**self._query, "request_handler": handler},
+            start_date=window.start,
+            end_date=window.end,
+        )
+        async with semaphore:
+            first = await search.first_page()
+
+        if first.pages > self._max_pages_per_shard and window.days > 1:
+            halves = await asyncio.gather(
+                *(
+                    self._search_window(half, semaphore, handler)
+                    for half in window.split()
+                )
+            )
+            return [shard for half in halves for shard in half]
+
+        rest = await search.remaining_pages(first, semaphore, handler)
+        return [[first, *rest]]
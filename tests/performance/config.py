@@ -16,6 +16,14 @@ def get_performance_thresholds() -> Dict[str, float]:
         "unflare_cache_hit_speedup": 10.0,
         "direct_request_timeout": 5.0,
         "unflare_first_request_max": 30.0,
+        "direct_pool_min_speedup": 1.5,
+        "parser_min_speedup": 2.0,
+        "parser_max_memory_ratio": 1.0,
+        "parse_executor_max_stall_ratio": 0.5,
+        "records_min_speedup": 2.0,
+        "records_max_memory_ratio": 1.0,
+        "import_max_ratio": 0.7,
+        "players_min_speedup": 3.0,
     }
 
     try:
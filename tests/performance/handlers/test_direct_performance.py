@@ -0,0 +1,82 @@
+"""Performance tests for DirectRequestHandler.
+
+Benchmarks page throughput against a local stub server, comparing the pooled,
+long-lived session against the previous behaviour of opening a fresh
+``aiohttp.ClientSession`` (and therefore a fresh connection) per page.
+
+Performance criteria from pyproject.toml:
+- direct_pool_min_speedup: pooled pages/sec relative to session-per-page
+"""
+
+import time
+from pathlib import Path
+
+import aiohttp
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from pro_sports_transactions.handlers import DirectConfig, DirectRequestHandler
+
+from ..config import get_performance_thresholds
+
+_thresholds = get_performance_thresholds()
+DIRECT_POOL_MIN_SPEEDUP = _thresholds["direct_pool_min_speedup"]
+
+PAGES = 300
+DATA_DIR = Path(__file__).parent.parent.parent / "unit" / "data"
+
+
+async def start_stub_server() -> TestServer:
+    """Start a local server that answers every search with a fixture page."""
+    body = (DATA_DIR / "valid_response.html").read_text(encoding="utf-8")
+
+    async def search_results(_request):
+        return web.Response(text=body, content_type="text/html")
+
+    app = web.Application()
+    app.router.add_get("/{tail:.*}", search_results)
+    server = TestServer(app)
+    await server.start_server()
+    return server
+
+
+async def session_per_page(url: str, pages: int) -> float:
+    """Fetch pages the old way (one session per page); return pages/sec."""
+    start_time = time.perf_counter()
+    for page in range(pages):
+        async with aiohttp.ClientSession() as session:
+            async with session.get(f"{url}?start={page * 25}") as response:
+                await response.text(encoding="utf-8")
+    return pages / (time.perf_counter() - start_time)
+
+
+async def pooled_handler(url: str, pages: int) -> float:
+    """Fetch pages through one pooled DirectRequestHandler; return pages/sec."""
+    async with DirectRequestHandler(DirectConfig(limit_per_host=10)) as handler:
+        start_time = time.perf_counter()
+        for page in range(pages):
+            await handler.get(f"{url}?start={page * 25}", {})
+        return pages / (time.perf_counter() - start_time)
+
+
+@pytest.mark.performance
+@pytest.mark.asyncio
+async def test_pooled_session_throughput():
+    """Test that the pooled session fetches pages faster than session-per-page."""
+    server = await start_stub_server()
+    try:
+        url = str(server.make_url("/basketball/Search/SearchResults.php"))
+
+        before = await session_per_page(url, PAGES)
+        after = await pooled_handler(url, PAGES)
+    finally:
+        await server.close()
+
+    print(f"\nsession-per-page: {before:.1f} pages/sec")
+    print(f"pooled session:   {after:.1f} pages/sec ({after / before:.2f}x)")
+
+    assert after / before >= DIRECT_POOL_MIN_SPEEDUP, (
+        f"Pooled session ran at {after:.1f} pages/sec vs {before:.1f} pages/sec, "
+        f"below the {DIRECT_POOL_MIN_SPEEDUP}x speedup threshold"
+    )
@@ -0,0 +1,63 @@
+"""Performance tests for the package import time.
+
+Imports the package in fresh interpreters and compares the time with the time
+when pandas and lxml are imported up front, as the package used to.
+
+Performance criteria from pyproject.toml:
+- import_max_ratio: package import time relative to importing it together
+  with pandas and lxml
+"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from .config import get_performance_thresholds
+
+_thresholds = get_performance_thresholds()
+IMPORT_MAX_RATIO = _thresholds["import_max_ratio"]
+
+SRC_DIR = Path(__file__).parent.parent.parent / "src"
+RUNS = 5
+
+
+def import_time(modules: str) -> float:
+    """Fastest of ``RUNS`` fresh-interpreter imports of ``modules``, in seconds."""
+    script = (
+        "import time\n"
+        "start = time.perf_counter()\n"
+        f"import {modules}\n"
+        "print(time.perf_counter() - start)\n"
+    )
+    env = {**os.environ, "PYTHONPATH": str(SRC_DIR)}
+    return min(
+        float(
+            subprocess.run(
+                [sys.executable, "-c", script],
+                env=env,
+                capture_output=True,
+                text=True,
+                check=True,
+            ).stdout
+        )
+        for _ in range(RUNS)
+    )
+
+
+@pytest.mark.performance
+def test_package_import_skips_pandas_and_lxml():
+    """Test that importing the package costs a fraction of the eager imports."""
+    eager = import_time("pandas, lxml.etree, pro_sports_transactions")
+    lazy = import_time("pro_sports_transactions")
+
+    print(f"\nImport with pandas and lxml: {eager * 1000:8.1f} ms")
+    print(f"Import of the package:       {lazy * 1000:8.1f} ms ({lazy / eager:.2f}x)")
+
+    assert lazy <= eager * IMPORT_MAX_RATIO, (
+        f"Importing the package took {lazy * 1000:.1f} ms vs "
+        f"{eager * 1000:.1f} ms with pandas and lxml, above the "
+        f"{IMPORT_MAX_RATIO}x threshold"
+    )
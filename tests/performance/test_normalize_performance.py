@@ -0,0 +1,95 @@
+"""Performance tests for player-level normalization.
+
+Compares ``player_rows`` with a per-row Python loop over the results
+DataFrame, the approach it replaces, on a large synthetic search result.
+
+Performance criteria from pyproject.toml:
+- players_min_speedup: player_rows rows/sec relative to the per-row loop
+"""
+
+import re
+import time
+
+import pandas as pd
+import pytest
+
+from pro_sports_transactions.normalize import DIRECTIONS, PLAYER_COLUMNS, player_rows
+
+from .config import get_performance_thresholds
+
+_thresholds = get_performance_thresholds()
+PLAYERS_MIN_SPEEDUP = _thresholds["players_min_speedup"]
+
+ROWS = 5000
+ALIAS = re.compile(r"\s*\([^)]*\)")
+
+
+def synthetic_results(rows: int) -> pd.DataFrame:
+    """Results mixing trades, single moves, and aliased names."""
+    acquired = ["• Mikal Bridges • Cameron Johnson (Cam Johnson)", "", "• Nene"]
+    relinquished = ["• Kevin Durant • T.J. Warren", "• LeBron James", ""]
+    return pd.DataFrame(
+        [
+            (
+                f"2023-02-{row % 28 + 1:02d}",
+                "Nets",
+                acquired[row % 3],
+                relinquished[row % 3],
+                f"transaction {row}",
+            )
+            for row in range(rows)
+        ],
+        columns=["Date", "Team", "Acquired", "Relinquished", "Notes"],
+    )
+
+
+def loop_player_rows(df: pd.DataFrame) -> pd.DataFrame:
+    """Player rows built with a Python loop over every transaction."""
+    rows = []
+    for transaction, row in df.iterrows():
+        for direction in DIRECTIONS:
+            for name in row[direction].split("•"):
+                name = ALIAS.sub("", name).strip()
+                if name:
+                    rows.append(
+                        (
+                            transaction,
+                            row["Date"],
+                            row["Team"],
+                            name,
+                            direction,
+                            row["Notes"],
+                        )
+                    )
+    return pd.DataFrame(rows, columns=list(PLAYER_COLUMNS))
+
+
+def rows_per_sec(normalize, df: pd.DataFrame, repeat: int) -> float:
+    """Transactions normalized per second over ``repeat`` runs."""
+    normalize(df)
+    start_time = time.perf_counter()
+    for _ in range(repeat):
+        normalize(df)
+    return len(df) * repeat / (time.perf_counter() - start_time)
+
+
+@pytest.mark.performance
+def test_player_rows_throughput():
+    """Test that vectorized normalization beats the per-row loop."""
+    df = synthetic_results(ROWS)
+    expected = loop_player_rows(df)
+    assert player_rows(df)[["Transaction", "Player", "Direction"]].equals(
+        expected[["Transaction", "Player", "Direction"]]
+    )
+
+    before = rows_per_sec(loop_player_rows, df, 3)
+    after = rows_per_sec(player_rows, df, 10)
+
+    print(f"\n{ROWS} transactions, {len(expected)} player rows")
+    print(f"Per-row loop: {before:12.0f} rows/sec")
+    print(f"player_rows:  {after:12.0f} rows/sec ({after / before:.2f}x)")
+
+    assert after / before >= PLAYERS_MIN_SPEEDUP, (
+        f"player_rows ran at {after:.0f} rows/sec vs {before:.0f} rows/sec, "
+        f"below the {PLAYERS_MIN_SPEEDUP}x speedup threshold"
+    )
@@ -0,0 +1,86 @@
+"""Performance tests for parsing search results in a worker pool.
+
+Runs a search over many large result pages and measures the longest time the
+event loop went without running a timer task, with pages parsed on the event
+loop and in a ``ParseExecutor`` thread pool.
+
+Performance criteria from pyproject.toml:
+- parse_executor_max_stall_ratio: longest event-loop stall with a thread pool
+  relative to parsing on the event loop
+"""
+
+import asyncio
+import time
+from typing import Dict, Optional
+
+import pytest
+
+from pro_sports_transactions import ParseExecutor
+from pro_sports_transactions.handlers import RequestHandler
+from pro_sports_transactions.search import Search
+
+from .config import get_performance_thresholds
+from .test_parser_performance import synthetic_page
+
+_thresholds = get_performance_thresholds()
+PARSE_EXECUTOR_MAX_STALL_RATIO = _thresholds["parse_executor_max_stall_ratio"]
+
+PAGES = 8
+ROWS = 2000
+
+
+class LargePageHandler(RequestHandler):
+    """Serves the same large results page, with a page count of ``PAGES``."""
+
+    def __init__(self):
+        pager = " ".join(str(page + 1) for page in range(PAGES))
+        self.page = synthetic_page(ROWS).replace(
+            '<p class="bodyCopy"> 1</p>', f'<p class="bodyCopy"> {pager}</p>'
+        )
+
+    async def get(self, url: str, headers: Dict[str, str]) -> Optional[str]:
+        await asyncio.sleep(0.001)
+        return self.page
+
+
+async def longest_stall(parse_executor: Optional[ParseExecutor]) -> float:
+    """Longest gap (seconds) between ticks of a 1 ms timer during a search."""
+    search = Search(request_handler=LargePageHandler(), parse_executor=parse_executor)
+    stall = 0.0
+
+    async def tick():
+        nonlocal stall
+        last = time.perf_counter()
+        while True:
+            await asyncio.sleep(0.001)
+            now = time.perf_counter()
+            stall = max(stall, now - last)
+            last = now
+
+    ticker = asyncio.create_task(tick())
+    await asyncio.sleep(0.01)
+    try:
+        df = await search.get_all_dataframe(max_concurrency=PAGES)
+    finally:
+        ticker.cancel()
+    assert len(df) == PAGES * ROWS
+    return stall
+
+
+@pytest.mark.performance
+@pytest.mark.asyncio
+async def test_thread_pool_keeps_event_loop_responsive():
+    """Test that parsing in a thread pool shortens event-loop stalls."""
+    inline = await longest_stall(None)
+    with ParseExecutor(max_workers=2) as executor:
+        pooled = await longest_stall(executor)
+
+    print(f"\nLongest event-loop stall over {PAGES} pages of {ROWS} rows")
+    print(f"Parsed on the event loop: {inline * 1000:8.1f} ms")
+    print(f"Parsed in a thread pool:  {pooled * 1000:8.1f} ms ({pooled / inline:.2f}x)")
+
+    assert pooled <= inline * PARSE_EXECUTOR_MAX_STALL_RATIO, (
+        f"Longest stall was {pooled * 1000:.1f} ms with a thread pool vs "
+        f"{inline * 1000:.1f} ms on the event loop, above the "
+        f"{PARSE_EXECUTOR_MAX_STALL_RATIO}x threshold"
+    )
@@ -0,0 +1,112 @@
+"""Performance tests for the search results parser.
+
+Benchmarks the lxml results-table parser against the previous
+``pandas.read_html`` path on the fixture pages in ``tests/unit/data`` and on
+large synthetic pages, reporting rows/sec and peak memory.
+
+Performance criteria from pyproject.toml:
+- parser_min_speedup: lxml parser rows/sec relative to read_html
+- parser_max_memory_ratio: lxml parser peak memory relative to read_html
+"""
+
+import time
+import tracemalloc
+from io import StringIO
+from pathlib import Path
+
+import pandas as pd
+import pytest
+from pandas import read_html
+
+from pro_sports_transactions.parser import COLUMNS
+from pro_sports_transactions.search import Search, results_frame
+
+from .config import get_performance_thresholds
+
+_thresholds = get_performance_thresholds()
+PARSER_MIN_SPEEDUP = _thresholds["parser_min_speedup"]
+PARSER_MAX_MEMORY_RATIO = _thresholds["parser_max_memory_ratio"]
+
+DATA_DIR = Path(__file__).parent.parent / "unit" / "data"
+
+ROW = """  <tr align="left">
+  <td nowrap="nowrap">2023-02-{day:02d}</td>
+  <td> Lakers</td>
+  <td> • Player {row}</td>
+  <td> </td>
+  <td> placed on IL with right foot injury (row {row})</td>
+  </tr>
+"""
+
+
+def synthetic_page(rows: int) -> str:
+    """The valid fixture page with its rows replaced by ``rows`` generated rows."""
+    page = (DATA_DIR / "valid_response.html").read_text(encoding="utf-8")
+    start = page.index('  <tr align="left">')
+    end = page.index("  </tbody></table><!-- Paging links -->")
+    body = "".join(ROW.format(day=row % 28 + 1, row=row) for row in range(rows))
+    return page[:start] + body + page[end:]
+
+
+def read_html_parse(response: str) -> pd.DataFrame:
+    """The previous parse path, built on pandas.read_html."""
+    df_list = read_html(StringIO(response), header=0, keep_default_na=False)
+    df = pd.DataFrame(df_list[0], columns=list(COLUMNS))
+    df.attrs["pages"] = int(df_list[1].columns[2].split(" ")[-1])
+    return df
+
+
+def lxml_parse(response: str) -> pd.DataFrame:
+    """The current parse path, up to the DataFrame ``Search`` returns."""
+    return results_frame(Search._parse(response))
+
+
+def measure(parse, page: str, repeat: int):
+    """Rows/sec over ``repeat`` parses, and peak memory (bytes) of one parse."""
+    rows = len(parse(page))
+    start_time = time.perf_counter()
+    for _ in range(repeat):
+        parse(page)
+    rows_per_sec = rows * repeat / (time.perf_counter() - start_time)
+
+    tracemalloc.start()
+    try:
+        parse(page)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return rows_per_sec, peak
+
+
+PAGES = {
+    "fixture": ((DATA_DIR / "valid_response.html").read_text("utf-8"), 200),
+    "synthetic 25 rows": (synthetic_page(25), 100),
+    "synthetic 5000 rows": (synthetic_page(5000), 5),
+}
+
+
+@pytest.mark.performance
+@pytest.mark.parametrize("name", list(PAGES))
+def test_parser_throughput_and_memory(name):
+    """Test that the lxml parser beats read_html on speed and peak memory."""
+    page, repeat = PAGES[name]
+    assert lxml_parse(page).equals(read_html_parse(page))
+
+    before, before_peak = measure(read_html_parse, page, repeat)
+    after, after_peak = measure(lxml_parse, page, repeat)
+
+    print(f"\n{name}")
+    print(f"read_html:   {before:12.0f} rows/sec, peak {before_peak / 1024:8.0f} KiB")
+    print(
+        f"lxml parser: {after:12.0f} rows/sec, peak {after_peak / 1024:8.0f} KiB "
+        f"({after / before:.2f}x)"
+    )
+
+    assert after / before >= PARSER_MIN_SPEEDUP, (
+        f"Parser ran at {after:.0f} rows/sec vs {before:.0f} rows/sec, "
+        f"below the {PARSER_MIN_SPEEDUP}x speedup threshold"
+    )
+    assert after_peak <= before_peak * PARSER_MAX_MEMORY_RATIO, (
+        f"Parser peaked at {after_peak} bytes vs {before_peak} bytes, "
+        f"above the {PARSER_MAX_MEMORY_RATIO}x memory threshold"
+    )
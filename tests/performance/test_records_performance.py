@@ -0,0 +1,64 @@
+"""Performance tests for the pandas-free dictionary output.
+
+Compares building the dictionary output straight from parsed rows with the
+previous path, which built a DataFrame and converted it with
+``to_dict(orient="records")``, on large synthetic pages.
+
+Performance criteria from pyproject.toml:
+- records_min_speedup: dictionary output rows/sec relative to the DataFrame path
+- records_max_memory_ratio: dictionary output peak memory relative to the
+  DataFrame path
+"""
+
+from typing import Dict
+
+import pytest
+
+from pro_sports_transactions.parser import ResultsPage, parse_results
+from pro_sports_transactions.search import results_dict, results_frame
+
+from .config import get_performance_thresholds
+from .test_parser_performance import measure, synthetic_page
+
+_thresholds = get_performance_thresholds()
+RECORDS_MIN_SPEEDUP = _thresholds["records_min_speedup"]
+RECORDS_MAX_MEMORY_RATIO = _thresholds["records_max_memory_ratio"]
+
+
+def dataframe_dict(page: ResultsPage) -> Dict:
+    """The previous dictionary output path, through a DataFrame."""
+    df = results_frame(page)
+    return {"transactions": df.to_dict(orient="records"), "pages": df.attrs["pages"]}
+
+
+@pytest.mark.performance
+@pytest.mark.parametrize("rows", [25, 5000])
+def test_dict_output_throughput_and_memory(rows):
+    """Test that dictionary output skipping pandas is faster and smaller."""
+    page = parse_results(synthetic_page(rows))
+    assert results_dict(page) == dataframe_dict(page)
+
+    def transactions(to_dict):
+        return lambda page: to_dict(page)["transactions"]
+
+    repeat = max(20_000 // rows, 5)
+    before, before_peak = measure(transactions(dataframe_dict), page, repeat)
+    after, after_peak = measure(transactions(results_dict), page, repeat)
+
+    print(f"\n{rows} rows")
+    print(
+        f"DataFrame.to_dict: {before:12.0f} rows/sec, peak {before_peak / 1024:8.0f} KiB"
+    )
+    print(
+        f"rows to dicts:     {after:12.0f} rows/sec, peak {after_peak / 1024:8.0f} KiB "
+        f"({after / before:.2f}x)"
+    )
+
+    assert after / before >= RECORDS_MIN_SPEEDUP, (
+        f"Dictionary output ran at {after:.0f} rows/sec vs {before:.0f} rows/sec, "
+        f"below the {RECORDS_MIN_SPEEDUP}x speedup threshold"
+    )
+    assert after_peak <= before_peak * RECORDS_MAX_MEMORY_RATIO, (
+        f"Dictionary output peaked at {after_peak} bytes vs {before_peak} bytes, "
+        f"above the {RECORDS_MAX_MEMORY_RATIO}x memory threshold"
+    )
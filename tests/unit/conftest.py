@@ -0,0 +1,93 @@
+"""Shared fixtures for unit tests."""
+
+import asyncio
+from typing import Dict, List, Optional, Sequence
+from urllib import parse
+
+import pytest
+
+from pro_sports_transactions.handlers import RequestHandler
+from pro_sports_transactions.search import ROWS_PER_PAGE
+
+RESULTS_PAGE = """<html><body>
+<table class="datatable center">
+  <tr class="DraftTableLabel">
+    <td>&nbsp;Date</td><td>&nbsp;Team</td><td>&nbsp;Acquired</td>
+    <td>&nbsp;Relinquished</td><td>&nbsp;Notes</td>
+  </tr>
+{rows}
+</table>
+<table width="75%" align="center" cellpadding="5">
+  <tr>
+    <td align="center" valign="top">&nbsp;</td>
+    <td width="1%" align="center" valign="top"><p class="bodyCopy">Previous</p></td>
+    <td align="center" valign="top"><p class="bodyCopy">{pager}</p></td>
+    <td width="1%" align="center" valign="top"><p class="bodyCopy">Next</p></td>
+    <td align="center" valign="top">&nbsp;</td>
+  </tr>
+</table>
+</body></html>"""
+
+RESULTS_ROW = """  <tr align="left">
+    <td nowrap="nowrap">{0}</td><td> {1}</td><td> {2}</td><td> {3}</td><td> {4}</td>
+  </tr>"""
+
+
+def build_results_page(rows: Sequence[Sequence[str]], pages: int) -> str:
+    """Build a search results page holding ``rows`` with a ``pages``-long pager."""
+    pager = " ".join(
+        f'<a href="?start={i * ROWS_PER_PAGE}">{i + 1}</a>' for i in range(pages)
+    )
+    return RESULTS_PAGE.format(
+        rows="\n".join(RESULTS_ROW.format(*row) for row in rows), pager=pager
+    )
+
+
+def page_rows(starting_row: int, count: int = ROWS_PER_PAGE) -> List[tuple]:
+    """Rows for the page at ``starting_row``; notes carry the absolute row number."""
+    return [
+        ("2023-02-15", "Lakers", "• LeBron James", "", f"row {starting_row + i}")
+        for i in range(count)
+    ]
+
+
+class PagedRequestHandler(RequestHandler):
+    """Serves a fixed number of synthetic result pages and records requests."""
+
+    def __init__(self, pages: int, last_page_rows: int = ROWS_PER_PAGE, delay=0.0):
+        self.pages = pages
+        self.last_page_rows = last_page_rows
+        self.delay = delay
+        self.urls: List[str] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    @staticmethod
+    def starting_row(url: str) -> int:
+        """Starting row requested by a search URL."""
+        return int(parse.parse_qs(parse.urlparse(url).query)["start"][0])
+
+    async def get(self, url: str, headers: Dict[str, str]) -> Optional[str]:
+        self.urls.append(url)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.in_flight -= 1
+        row = self.starting_row(url)
+        page = row // ROWS_PER_PAGE
+        count = self.last_page_rows if page == self.pages - 1 else ROWS_PER_PAGE
+        return build_results_page(page_rows(row, count), self.pages)
+
+
+@pytest.fixture
+def results_page():
+    """Factory building synthetic search results pages."""
+    return build_results_page
+
+
+@pytest.fixture
+def paged_handler():
+    """Factory creating a request handler serving synthetic result pages."""
+    return PagedRequestHandler
@@ -0,0 +1,199 @@
+"""Shared fixtures for handler tests."""
+
+import asyncio
+import time
+from typing import List, Optional, Set
+from unittest.mock import AsyncMock
+
+import pytest
+import pytest_asyncio
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from pro_sports_transactions.handlers import (
+    HandlerResponse,
+    UnflareConfig,
+    UnflareRequestHandler,
+)
+
+PAGE = "<html>OK</html>"
+
+
+class ScriptedHandlers:
+    """Builds inner handlers whose fetches answer from a script.
+
+    ``OK`` and ``BLOCKED`` are the responses the handler tests share.
+    """
+
+    OK = HandlerResponse(status=200, text=PAGE)
+    BLOCKED = HandlerResponse(status=0)
+
+    def __call__(self, *responses, delay: float = 0.0) -> AsyncMock:
+        """Inner handler whose fetches return ``responses`` in turn.
+
+        The last response repeats once the others are used up (``OK`` when
+        none are given). A string is a 200 page with that text and an
+        exception is raised. Each fetch waits ``delay`` seconds first, or the
+        delay paired with its response as ``(delay, response)``; fetches
+        cancelled while waiting record that delay in ``cancelled``.
+        """
+        remaining = list(responses) or [self.OK]
+        cancelled = []
+
+        async def fetch(_url, _headers):
+            response = remaining.pop(0) if len(remaining) > 1 else remaining[0]
+            wait = delay
+            if isinstance(response, tuple):
+                wait, response = response
+            try:
+                await asyncio.sleep(wait)
+            except asyncio.CancelledError:
+                cancelled.append(wait)
+                raise
+            if isinstance(response, Exception):
+                raise response
+            if isinstance(response, str):
+                return HandlerResponse(status=200, text=response)
+            return response
+
+        handler = AsyncMock()
+        handler.fetch = AsyncMock(side_effect=fetch)
+        handler.cancelled = cancelled
+        return handler
+
+
+class StubUnflare:
+    """Local Unflare service that also serves the Cloudflare-protected site.
+
+    ``POST /scrape`` counts solves, takes ``solve_delay`` seconds, and issues a
+    new ``cf_clearance`` cookie each time. ``GET /site/...`` answers 403 unless
+    the request carries the most recently issued cookie. Setting
+    ``scrape_status`` or ``site_status`` makes the endpoint fail with that
+    status instead. Site requests record their headers and client address,
+    and take ``site_delay`` seconds.
+
+    Setting ``site_etag`` sends it as the page's ``ETag`` and answers a
+    matching ``If-None-Match`` with 304 Not Modified.
+
+    Setting ``scrape_body`` includes it as the ``html`` of the solve response,
+    like an Unflare build that returns the page it loaded.
+
+    Stubs given a shared ``accepted`` set act as several Unflare instances for
+    one site: every cookie any of them issues is added to the set, and the
+    site accepts any cookie in it.
+    """
+
+    page = PAGE
+
+    def __init__(
+        self,
+        solve_delay: float = 0.05,
+        lifetime: float = 3600,
+        accepted: Optional[Set[str]] = None,
+    ):
+        self.solve_delay = solve_delay
+        self.lifetime = lifetime
+        self.scrape_calls = 0
+        self.site_requests = 0
+        self.clearance = None
+        self.accepted = accepted
+        self.scrape_status = 200
+        self.scrape_body = None
+        self.site_status = 200
+        self.site_delay = 0.0
+        self.site_etag = None
+        self.site_headers = []
+        self.site_peers = set()
+        self.server = None
+
+    @property
+    def scrape_url(self) -> str:
+        return str(self.server.make_url("/scrape"))
+
+    def site_url(self, path: str = "page") -> str:
+        return str(self.server.make_url(f"/site/{path}"))
+
+    async def start(self):
+        app = web.Application()
+        app.router.add_post("/scrape", self._scrape)
+        app.router.add_get("/site/{tail:.*}", self._site)
+        self.server = TestServer(app)
+        await self.server.start_server()
+
+    async def close(self):
+        await self.server.close()
+
+    async def _scrape(self, _request):
+        self.scrape_calls += 1
+        await asyncio.sleep(self.solve_delay)
+        if self.scrape_status != 200:
+            return web.Response(status=self.scrape_status, text="Bad Gateway")
+        self.clearance = f"token-{self.server.port}-{self.scrape_calls}"
+        if self.accepted is not None:
+            self.accepted.add(self.clearance)
+        cookie = {
+            "name": "cf_clearance",
+            "value": self.clearance,
+            "expires": time.time() + self.lifetime,
+        }
+        result = {"cookies": [cookie], "headers": {"User-Agent": "stub-browser"}}
+        if self.scrape_body is not None:
+            result["html"] = self.scrape_body
+        return web.json_response(result)
+
+    async def _site(self, request):
+        self.site_requests += 1
+        self.site_headers.append(request.headers)
+        self.site_peers.add(request.transport.get_extra_info("peername"))
+        await asyncio.sleep(self.site_delay)
+        clearance = request.cookies.get("cf_clearance")
+        if (
+            clearance not in self.accepted
+            if self.accepted is not None
+            else clearance != self.clearance
+        ):
+            return web.Response(status=403, text="challenge")
+        if self.site_status != 200:
+            return web.Response(status=self.site_status, text="Unavailable")
+        if self.site_etag is None:
+            return web.Response(text=PAGE, content_type="text/html")
+        if request.headers.get("If-None-Match") == self.site_etag:
+            return web.Response(status=304, headers={"ETag": self.site_etag})
+        return web.Response(
+            text=PAGE, content_type="text/html", headers={"ETag": self.site_etag}
+        )
+
+
+@pytest_asyncio.fixture
+async def stub_unflare():
+    """A running StubUnflare server."""
+    stub = StubUnflare()
+    await stub.start()
+    yield stub
+    await stub.close()
+
+
+@pytest_asyncio.fixture
+async def stub_unflare_pool() -> List[StubUnflare]:
+    """Three running StubUnflare servers fronting one site."""
+    accepted = set()
+    stubs = [StubUnflare(accepted=accepted) for _ in range(3)]
+    for stub in stubs:
+        await stub.start()
+    yield stubs
+    for stub in stubs:
+        await stub.close()
+
+
+@pytest_asyncio.fixture
+async def stub_unflare_handler(stub_unflare):
+    """An UnflareRequestHandler pointed at the stub server, closed afterwards."""
+    handler = UnflareRequestHandler(UnflareConfig(url=stub_unflare.scrape_url))
+    yield handler
+    await handler.aclose()
+
+
+@pytest.fixture
+def scripted():
+    """Factory of scripted inner handlers (see ``ScriptedHandlers``)."""
+    return ScriptedHandlers()
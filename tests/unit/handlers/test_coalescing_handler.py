@@ -0,0 +1,199 @@
+"""Unit tests for request coalescing."""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from pro_sports_transactions.handlers import (
+    CoalescingRequestHandler,
+    HandlerResponse,
+    RequestHandler,
+)
+from pro_sports_transactions.handlers.single_flight import SingleFlight
+from pro_sports_transactions.search import Search
+
+
+class SlowHandler(RequestHandler):
+    """Counts requests and answers after a short delay."""
+
+    def __init__(self, text="<html>OK</html>", error=None):
+        self.text = text
+        self.error = error
+        self.calls = 0
+
+    async def get(self, url, headers):
+        self.calls += 1
+        await asyncio.sleep(0.01)
+        if self.error:
+            raise self.error
+        return self.text
+
+
+class TestSingleFlight:
+    """Test the SingleFlight helper"""
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_one_call(self):
+        """Test that callers for one key share the first caller's call"""
+        flights = SingleFlight()
+        call = AsyncMock(return_value="result")
+
+        async def slow_call():
+            await asyncio.sleep(0.01)
+            return await call()
+
+        outcomes = await asyncio.gather(
+            *(flights.do("key", slow_call) for _ in range(5))
+        )
+
+        assert call.await_count == 1
+        assert [result for result, _ in outcomes] == ["result"] * 5
+        assert [shared for _, shared in outcomes] == [False] + [True] * 4
+        assert not flights.in_flight("key")
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_completed_call_is_not_reused(self):
+        """Test that a new call starts once the previous one finished"""
+        flights = SingleFlight()
+        call = AsyncMock(return_value="result")
+
+        await flights.do("key", call)
+        await flights.do("key", call)
+
+        assert call.await_count == 2
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_does_not_cancel_call(self):
+        """Test that other callers still get the result after one cancels"""
+        flights = SingleFlight()
+
+        async def slow_call():
+            await asyncio.sleep(0.02)
+            return "result"
+
+        first = asyncio.ensure_future(flights.do("key", slow_call))
+        await asyncio.sleep(0)
+        second = asyncio.ensure_future(flights.do("key", slow_call))
+        await asyncio.sleep(0)
+        first.cancel()
+
+        assert await second == ("result", True)
+
+
+class TestCoalescingRequestHandler:
+    """Test the CoalescingRequestHandler"""
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_identical_requests_share_one_fetch(self):
+        """Test that concurrent requests for one URL make one request"""
+        inner = SlowHandler()
+        handler = CoalescingRequestHandler(inner)
+
+        results = await asyncio.gather(
+            *(handler.get("http://example.com/a", {}) for _ in range(10))
+        )
+
+        assert results == ["<html>OK</html>"] * 10
+        assert inner.calls == 1
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_different_urls_are_fetched_separately(self):
+        """Test that only identical URLs are coalesced"""
+        inner = SlowHandler()
+        handler = CoalescingRequestHandler(inner)
+
+        await asyncio.gather(
+            handler.get("http://example.com/a", {}),
+            handler.get("http://example.com/b", {}),
+        )
+
+        assert inner.calls == 2
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_errors_are_shared(self):
+        """Test that every waiter sees the shared request's exception"""
+        handler = CoalescingRequestHandler(SlowHandler(error=ConnectionError("x")))
+
+        results = await asyncio.gather(
+            *(handler.fetch("http://example.com/a", {}) for _ in range(3)),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(result, ConnectionError) for result in results)
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_fetch_keeps_status(self):
+        """Test that coalesced fetches return the wrapped handler's response"""
+        inner = SlowHandler()
+        inner.fetch = AsyncMock(return_value=HandlerResponse(status=429))
+
+        response = await CoalescingRequestHandler(inner).fetch("http://a/", {})
+
+        assert response.status == 429
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_get_parsed_shares_one_parse_with_copies(self):
+        """Test that one parse is shared and each waiter gets its own copy"""
+        inner = SlowHandler()
+        handler = CoalescingRequestHandler(inner)
+        parses = []
+
+        def parse(text):
+            parses.append(text)
+            return [text]
+
+        results = await asyncio.gather(
+            *(handler.get_parsed("http://example.com/a", {}, parse) for _ in range(4))
+        )
+
+        assert inner.calls == 1
+        assert len(parses) == 1
+        assert results == [["<html>OK</html>"]] * 4
+        assert len({id(result) for result in results}) == 4
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_concurrent_searches_share_fetch_and_parse(
+        self, paged_handler, monkeypatch
+    ):
+        """Test that identical Searches share one fetch and one read_html parse"""
+        inner = paged_handler(pages=1, last_page_rows=3, delay=0.01)
+        handler = CoalescingRequestHandler(inner)
+        parse = Search._parse
+        parses = []
+
+        def counting_parse(response):
+            parses.append(response)
+            return parse(response)
+
+        monkeypatch.setattr(Search, "_parse", staticmethod(counting_parse))
+
+        searches = [Search(team="Lakers", request_handler=handler) for _ in range(5)]
+        frames = await asyncio.gather(*(s.get_dataframe() for s in searches))
+
+        assert len(inner.urls) == 1
+        assert len(parses) == 1
+        assert all(len(df) == 3 for df in frames)
+        # Callers can't corrupt each other's results
+        frames[0].loc[0, "Team"] = "Changed"
+        assert frames[1].loc[0, "Team"] == "Lakers"
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_aclose_closes_wrapped_handler(self):
+        """Test that closing the wrapper closes the wrapped handler"""
+        inner = SlowHandler()
+        inner.aclose = AsyncMock()
+
+        await CoalescingRequestHandler(inner).aclose()
+
+        inner.aclose.assert_awaited_once()
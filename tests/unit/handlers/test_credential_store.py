@@ -0,0 +1,209 @@
+"""Unit tests for durable Unflare credential stores."""
+
+import multiprocessing
+import threading
+import time
+
+import pytest
+
+from pro_sports_transactions.handlers import (
+    Credentials,
+    FileCredentialStore,
+    SQLiteCredentialStore,
+    UnflareConfig,
+    UnflareRequestHandler,
+)
+
+STORES = {
+    "file": lambda tmp_path: FileCredentialStore(tmp_path / "credentials.json"),
+    "sqlite": lambda tmp_path: SQLiteCredentialStore(tmp_path / "credentials.db"),
+}
+
+
+def make_credentials(value="abc", lifetime=3600) -> Credentials:
+    """Credentials holding one cookie, valid for ``lifetime`` seconds."""
+    expiry = time.time() + lifetime
+    return Credentials(
+        cookies=[{"name": "cf_clearance", "value": value, "expires": expiry}],
+        headers={"User-Agent": "stub-browser"},
+        expiry=expiry - 300,
+    )
+
+
+def save_repeatedly(store, worker):
+    """Save credentials many times from another process."""
+    for attempt in range(50):
+        store.save(make_credentials(f"{worker}-{attempt}"))
+
+
+class ThreadRecordingStore:
+    """Credential store wrapper recording the thread of each call."""
+
+    def __init__(self, store):
+        self.store = store
+        self.calls = []
+
+    def load(self):
+        self.calls.append(("load", threading.get_ident()))
+        return self.store.load()
+
+    def save(self, credentials):
+        self.calls.append(("save", threading.get_ident()))
+        self.store.save(credentials)
+
+    def clear(self):
+        self.calls.append(("clear", threading.get_ident()))
+        self.store.clear()
+
+
+@pytest.fixture(params=sorted(STORES))
+def store(request, tmp_path):
+    """Each credential store implementation, backed by a temporary path."""
+    return STORES[request.param](tmp_path)
+
+
+class TestCredentialStores:
+    """Test the file and SQLite credential stores"""
+
+    @pytest.mark.unit
+    def test_empty_store_loads_none(self, store):
+        """Test that a store with nothing saved returns None"""
+        assert store.load() is None
+
+    @pytest.mark.unit
+    def test_save_and_load_round_trip(self, store):
+        """Test that saved credentials load back unchanged"""
+        credentials = make_credentials()
+
+        store.save(credentials)
+
+        assert store.load() == credentials
+
+    @pytest.mark.unit
+    def test_save_replaces_and_clear_removes(self, store):
+        """Test that saving replaces earlier credentials and clear removes them"""
+        store.save(make_credentials("old"))
+        store.save(make_credentials("new"))
+
+        assert store.load().cookies[0]["value"] == "new"
+
+        store.clear()
+
+        assert store.load() is None
+
+    @pytest.mark.unit
+    def test_sqlite_keys_are_separate(self, tmp_path):
+        """Test that SQLite keys hold independent credentials"""
+        path = tmp_path / "credentials.db"
+        SQLiteCredentialStore(path, key="a").save(make_credentials("a"))
+
+        assert SQLiteCredentialStore(path, key="b").load() is None
+        assert SQLiteCredentialStore(path, key="a").load().cookies[0]["value"] == "a"
+
+    @pytest.mark.unit
+    def test_unreadable_file_behaves_as_empty(self, tmp_path, caplog):
+        """Test that a corrupt file is treated as a miss and logged"""
+        path = tmp_path / "credentials.json"
+        path.write_text("{not json", encoding="utf-8")
+
+        assert FileCredentialStore(path).load() is None
+        assert "Could not read credentials" in caplog.text
+
+    @pytest.mark.unit
+    def test_concurrent_processes_never_see_partial_writes(self, store):
+        """Test that writers in several processes leave loadable credentials"""
+        # fork avoids re-importing pandas in every worker where it's available
+        methods = multiprocessing.get_all_start_methods()
+        context = multiprocessing.get_context("fork" if "fork" in methods else None)
+        workers = [
+            context.Process(target=save_repeatedly, args=(store, worker))
+            for worker in range(3)
+        ]
+        for worker in workers:
+            worker.start()
+        loads = []
+        while any(worker.is_alive() for worker in workers):
+            loads.append(store.load())
+        for worker in workers:
+            worker.join()
+
+        assert all(worker.exitcode == 0 for worker in workers)
+        assert all(loaded is None or loaded.cookies for loaded in loads)
+        assert store.load().cookies[0]["value"].endswith("-49")
+
+
+class TestHandlerCredentialStore:
+    """Test that UnflareRequestHandler persists and reloads credentials"""
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_restart_reuses_stored_credentials(self, stub_unflare, store):
+        """Test that a new handler starts warm from the store"""
+        config = UnflareConfig(url=stub_unflare.scrape_url, credential_store=store)
+        async with UnflareRequestHandler(config) as first:
+            await first.get(stub_unflare.site_url(), {})
+
+        async with UnflareRequestHandler(config) as restarted:
+            assert restarted.is_cache_valid()
+            result = await restarted.get(stub_unflare.site_url(), {})
+
+        assert result == stub_unflare.page
+        assert stub_unflare.scrape_calls == 1
+
+    @pytest.mark.unit
+    def test_expired_credentials_are_not_restored(self, store):
+        """Test that expired stored credentials are ignored on startup"""
+        store.save(make_credentials(lifetime=100))
+
+        handler = UnflareRequestHandler(UnflareConfig(credential_store=store))
+
+        assert not handler.has_cached_cookies
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_refresh_adopts_credentials_from_other_process(
+        self, stub_unflare, store
+    ):
+        """Test that a refresh uses newer stored credentials instead of solving"""
+        config = UnflareConfig(url=stub_unflare.scrape_url, credential_store=store)
+        async with UnflareRequestHandler(config) as handler:
+            await handler.get(stub_unflare.site_url(), {})
+            # Another process solves again and saves the new credentials
+            stub_unflare.clearance = "from-other-process"
+            store.save(make_credentials("from-other-process"))
+
+            result = await handler.get(stub_unflare.site_url(), {})
+
+        assert result == stub_unflare.page
+        assert stub_unflare.scrape_calls == 1
+
+    @pytest.mark.unit
+    def test_clear_cache_keeps_other_process_credentials(self, store):
+        """Test that clearing only removes stored credentials that are ours"""
+        handler = UnflareRequestHandler(UnflareConfig(credential_store=store))
+        handler.cache_credentials(make_credentials("ours").cookies, {})
+
+        store.save(make_credentials("theirs"))
+        handler.clear_cache()
+        assert store.load().cookies[0]["value"] == "theirs"
+
+        handler.cache_credentials(make_credentials("ours").cookies, {})
+        handler.clear_cache()
+        assert store.load() is None
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_store_io_runs_off_event_loop(self, stub_unflare, store):
+        """Test that requests load, save, and clear the store in worker threads"""
+        recording = ThreadRecordingStore(store)
+        config = UnflareConfig(url=stub_unflare.scrape_url, credential_store=recording)
+        async with UnflareRequestHandler(config) as handler:
+            recording.calls.clear()
+            await handler.get(stub_unflare.site_url(), {})
+            # The site rejects the cached cookie, so it is cleared and re-solved
+            stub_unflare.clearance = "revoked"
+            result = await handler.get(stub_unflare.site_url(), {})
+
+        assert result == stub_unflare.page
+        assert {call for call, _ in recording.calls} == {"load", "save", "clear"}
+        assert threading.get_ident() not in {thread for _, thread in recording.calls}
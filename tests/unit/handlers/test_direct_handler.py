@@ -4,12 +4,40 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from pro_sports_transactions.handlers import DirectRequestHandler
+from pro_sports_transactions.handlers import DirectConfig, DirectRequestHandler
+
+
+def make_mock_session(status=200, text="<html>Test Response</html>"):
+    """Create a mock pooled session whose get() returns a canned response."""
+    mock_response = MagicMock()
+    mock_response.status = status
+    mock_response.text = AsyncMock(return_value=text)
+
+    # Create properly configured async context manager for session.get()
+    mock_get_context = AsyncMock()
+    mock_get_context.__aenter__.return_value = mock_response
+    mock_get_context.__aexit__.return_value = None
+
+    mock_session = MagicMock()
+    mock_session.closed = False
+    mock_session.close = AsyncMock()
+    mock_session.get.return_value = mock_get_context
+    return mock_session
 
 
 class TestDirectRequestHandler:
     """Test the DirectRequestHandler"""
 
+    @pytest.mark.unit
+    def test_config_defaults(self):
+        """Test DirectConfig default values"""
+        config = DirectConfig()
+
+        assert config.limit == 100
+        assert config.limit_per_host == 0
+        assert config.keepalive_timeout == 15.0
+        assert config.ttl_dns_cache == 10
+
     @pytest.mark.unit
     @pytest.mark.asyncio
     async def test_successful_request(self):
@@ -20,24 +48,7 @@ class TestDirectRequestHandler:
         with patch(
             "pro_sports_transactions.handlers.direct_handler.aiohttp"
         ) as mock_aiohttp:
-            # Create mock response
-            mock_response = MagicMock()
-            mock_response.status = 200
-            mock_response.text = AsyncMock(return_value="<html>Test Response</html>")
-
-            # Create properly configured async context manager for session.get()
-            mock_get_context = AsyncMock()
-            mock_get_context.__aenter__.return_value = mock_response
-            mock_get_context.__aexit__.return_value = None
-
-            # Create mock session with properly configured get method
-            mock_session = MagicMock()
-            mock_session.get.return_value = mock_get_context
-
-            # Configure ClientSession mock
-            mock_aiohttp.ClientSession.return_value.__aenter__.return_value = (
-                mock_session
-            )
+            mock_aiohttp.ClientSession.return_value = make_mock_session()
 
             result = await handler.get("http://example.com", {"test": "header"})
 
@@ -52,23 +63,7 @@ class TestDirectRequestHandler:
         with patch(
             "pro_sports_transactions.handlers.direct_handler.aiohttp"
         ) as mock_aiohttp:
-            # Create mock response with 404 status
-            mock_response = MagicMock()
-            mock_response.status = 404
-
-            # Create properly configured async context manager for session.get()
-            mock_get_context = AsyncMock()
-            mock_get_context.__aenter__.return_value = mock_response
-            mock_get_context.__aexit__.return_value = None
-
-            # Create mock session with properly configured get method
-            mock_session = MagicMock()
-            mock_session.get.return_value = mock_get_context
-
-            # Configure ClientSession mock
-            mock_aiohttp.ClientSession.return_value.__aenter__.return_value = (
-                mock_session
-            )
+            mock_aiohttp.ClientSession.return_value = make_mock_session(status=404)
 
             result = await handler.get("http://example.com", {"test": "header"})
 
@@ -77,33 +72,83 @@ class TestDirectRequestHandler:
     @pytest.mark.unit
     @pytest.mark.asyncio
     async def test_headers_passed_correctly(self):
-        """Test that headers are passed to aiohttp session"""
+        """Test that headers are passed with each request"""
         handler = DirectRequestHandler()
         headers = {"User-Agent": "test-agent", "Authorization": "Bearer token"}
 
         with patch(
             "pro_sports_transactions.handlers.direct_handler.aiohttp"
         ) as mock_aiohttp:
-            # Create mock response
-            mock_response = MagicMock()
-            mock_response.status = 200
-            mock_response.text = AsyncMock(return_value="success")
-
-            # Create properly configured async context manager for session.get()
-            mock_get_context = AsyncMock()
-            mock_get_context.__aenter__.return_value = mock_response
-            mock_get_context.__aexit__.return_value = None
-
-            # Create mock session with properly configured get method
-            mock_session = MagicMock()
-            mock_session.get.return_value = mock_get_context
-
-            # Configure ClientSession mock
-            mock_aiohttp.ClientSession.return_value.__aenter__.return_value = (
-                mock_session
-            )
+            mock_session = make_mock_session(text="success")
+            mock_aiohttp.ClientSession.return_value = mock_session
 
             await handler.get("http://example.com", headers)
 
-            # Verify session was created with correct headers
-            mock_aiohttp.ClientSession.assert_called_once_with(headers=headers)
+            mock_session.get.assert_called_once_with(
+                "http://example.com", headers=headers
+            )
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_session_reused_across_requests(self):
+        """Test that one pooled session serves every request"""
+        handler = DirectRequestHandler()
+
+        with patch(
+            "pro_sports_transactions.handlers.direct_handler.aiohttp"
+        ) as mock_aiohttp:
+            mock_session = make_mock_session()
+            mock_aiohttp.ClientSession.return_value = mock_session
+
+            for page in range(3):
+                await handler.get(f"http://example.com/?start={page * 25}", {})
+
+            mock_aiohttp.ClientSession.assert_called_once()
+            assert mock_session.get.call_count == 3
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_connector_uses_config(self):
+        """Test that the connection pool is built from DirectConfig"""
+        config = DirectConfig(
+            limit=10, limit_per_host=4, keepalive_timeout=30.0, ttl_dns_cache=300
+        )
+        handler = DirectRequestHandler(config)
+
+        with patch(
+            "pro_sports_transactions.handlers.direct_handler.aiohttp"
+        ) as mock_aiohttp:
+            mock_aiohttp.ClientSession.return_value = make_mock_session()
+
+            await handler.get("http://example.com", {})
+
+            mock_aiohttp.TCPConnector.assert_called_once_with(
+                limit=10, limit_per_host=4, keepalive_timeout=30.0, ttl_dns_cache=300
+            )
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_context_manager_closes_session(self):
+        """Test that leaving the async context closes the pooled session"""
+        with patch(
+            "pro_sports_transactions.handlers.direct_handler.aiohttp"
+        ) as mock_aiohttp:
+            mock_session = make_mock_session()
+            mock_aiohttp.ClientSession.return_value = mock_session
+
+            async with DirectRequestHandler() as handler:
+                await handler.get("http://example.com", {})
+                assert handler.has_open_session
+
+            mock_session.close.assert_awaited_once()
+            assert not handler.has_open_session
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_aclose_without_session(self):
+        """Test that aclose() is safe before any request was made"""
+        handler = DirectRequestHandler()
+
+        await handler.aclose()
+
+        assert not handler.has_open_session
@@ -0,0 +1,168 @@
+"""Unit tests for the on-disk response cache."""
+
+import os
+from datetime import date, timedelta
+
+import pytest
+
+from pro_sports_transactions.handlers import (
+    DiskCacheConfig,
+    DiskCacheRequestHandler,
+    HandlerResponse,
+)
+from pro_sports_transactions.search import League, Search, UrlBuilder
+
+HISTORICAL_URL = UrlBuilder.build(
+    League.NBA, start_date=date(2022, 10, 18), end_date=date(2023, 4, 9)
+)
+TODAY_URL = UrlBuilder.build(League.NBA, start_date=date(2022, 10, 18))
+
+
+@pytest.fixture
+def cache_config(tmp_path):
+    """Cache configuration backed by a temporary database."""
+    return DiskCacheConfig(path=tmp_path / "responses.db")
+
+
+class TestDiskCacheRequestHandler:
+    """Test the DiskCacheRequestHandler"""
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_second_request_is_served_from_disk(self, scripted, cache_config):
+        """Test that a cached page is returned without a request"""
+        inner = scripted()
+        handler = DiskCacheRequestHandler(inner, cache_config)
+
+        first = await handler.get(HISTORICAL_URL, {})
+        second = await handler.get(HISTORICAL_URL, {})
+
+        assert first == second == scripted.OK.text
+        assert inner.fetch.await_count == 1
+        assert (handler.hits, handler.misses) == (1, 1)
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_cache_survives_restart(self, scripted, cache_config):
+        """Test that a new handler on the same path reads earlier pages"""
+        await DiskCacheRequestHandler(scripted(), cache_config).get(HISTORICAL_URL, {})
+        inner = scripted()
+
+        result = await DiskCacheRequestHandler(inner, cache_config).get(
+            HISTORICAL_URL, {}
+        )
+
+        assert result == scripted.OK.text
+        inner.fetch.assert_not_awaited()
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_failed_responses_are_not_cached(self, scripted, cache_config):
+        """Test that only successful pages are stored"""
+        inner = scripted(HandlerResponse(status=503))
+        handler = DiskCacheRequestHandler(inner, cache_config)
+
+        assert (await handler.fetch(HISTORICAL_URL, {})).status == 503
+        await handler.fetch(HISTORICAL_URL, {})
+
+        assert inner.fetch.await_count == 2
+
+    @pytest.mark.unit
+    def test_ttl_depends_on_end_date(self, scripted, cache_config):
+        """Test long TTLs for historical searches and short ones for recent"""
+        handler = DiskCacheRequestHandler(scripted(), cache_config)
+        recent_end = date.today() - timedelta(days=cache_config.recent_days)
+
+        assert handler.ttl(HISTORICAL_URL) == cache_config.historical_ttl
+        assert handler.ttl(TODAY_URL) == cache_config.recent_ttl
+        assert (
+            handler.ttl(UrlBuilder.build(League.NBA, end_date=recent_end))
+            == cache_config.recent_ttl
+        )
+        assert handler.ttl("https://example.com/?EndDate=") == cache_config.recent_ttl
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_expired_pages_are_refetched(self, scripted, tmp_path):
+        """Test that pages past their TTL are fetched again"""
+        config = DiskCacheConfig(path=tmp_path / "responses.db", recent_ttl=-1)
+        inner = scripted()
+        handler = DiskCacheRequestHandler(inner, config)
+
+        await handler.get(TODAY_URL, {})
+        await handler.get(TODAY_URL, {})
+
+        assert inner.fetch.await_count == 2
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_pages_are_compressed(self, scripted, cache_config):
+        """Test that stored bodies are compressed"""
+        text = "<tr><td>LeBron James</td></tr>" * 1000
+        handler = DiskCacheRequestHandler(scripted(text), cache_config)
+
+        await handler.get(HISTORICAL_URL, {})
+
+        assert 0 < handler.size < len(text) / 10
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_evicts_least_recently_used_over_budget(self, scripted, tmp_path):
+        """Test LRU eviction once the byte budget is exceeded"""
+        config = DiskCacheConfig(
+            path=tmp_path / "responses.db", max_bytes=2500, compression_level=0
+        )
+        handler = DiskCacheRequestHandler(scripted(), config)
+        urls = [f"{HISTORICAL_URL}&start={row}" for row in (0, 25, 50)]
+        # Uncompressed bodies of about 1000 bytes each
+        for url in urls[:2]:
+            handler.handler = scripted(os.urandom(500).hex())
+            await handler.get(url, {})
+        await handler.get(urls[0], {})  # Most recently used
+
+        handler.handler = scripted(os.urandom(500).hex())
+        await handler.get(urls[2], {})
+
+        assert handler.size <= config.max_bytes
+        handler.handler = inner = scripted()
+        await handler.get(urls[0], {})
+        await handler.get(urls[2], {})
+        inner.fetch.assert_not_awaited()
+        await handler.get(urls[1], {})
+        inner.fetch.assert_awaited_once()
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_search_rerun_reads_from_disk(self, cache_config, paged_handler):
+        """Test that re-running a historical search makes no requests"""
+        inner = paged_handler(pages=3, last_page_rows=10)
+        handler = DiskCacheRequestHandler(inner, cache_config)
+
+        def search():
+            return Search(
+                start_date=date(2022, 10, 18),
+                end_date=date(2023, 4, 9),
+                request_handler=handler,
+            )
+
+        first = await search().get_all_dataframe()
+        requests = len(inner.urls)
+        second = await search().get_all_dataframe()
+
+        assert requests == 3
+        assert len(inner.urls) == requests
+        assert second.equals(first)
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_clear_and_aclose(self, scripted, cache_config):
+        """Test clearing the cache and closing the wrapped handler"""
+        inner = scripted()
+        handler = DiskCacheRequestHandler(inner, cache_config)
+        await handler.get(HISTORICAL_URL, {})
+
+        handler.clear()
+        await handler.aclose()
+
+        assert handler.size == 0
+        inner.aclose.assert_awaited_once()
@@ -0,0 +1,150 @@
+"""Unit tests for the fallback chain of request handlers."""
+
+import asyncio
+
+import pytest
+
+from pro_sports_transactions.handlers import (
+    CircuitState,
+    FallbackConfig,
+    FallbackRequestHandler,
+    HandlerResponse,
+)
+
+
+class TestFallbackRequestHandler:
+    """Test the FallbackRequestHandler"""
+
+    @pytest.mark.unit
+    def test_requires_handlers(self):
+        """Test that a chain needs at least one handler"""
+        with pytest.raises(ValueError):
+            FallbackRequestHandler([])
+        with pytest.raises(ValueError):
+            FallbackConfig(failure_threshold=0)
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_falls_back_in_order(self, scripted):
+        """Test that a failed request moves on to the next handler"""
+        direct, unflare = scripted(scripted.BLOCKED), scripted(scripted.OK)
+        handler = FallbackRequestHandler([direct, unflare])
+
+        assert await handler.get("http://site/", {}) == scripted.OK.text
+        assert direct.fetch.await_count == 1
+        assert unflare.fetch.await_count == 1
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_opens_circuit_after_consecutive_failures(self, scripted):
+        """Test that a repeatedly failing handler is skipped"""
+        direct, unflare = scripted(scripted.BLOCKED), scripted(scripted.OK)
+        handler = FallbackRequestHandler(
+            [direct, unflare], FallbackConfig(failure_threshold=2)
+        )
+
+        for _ in range(5):
+            assert (await handler.fetch("http://site/", {})).ok
+
+        assert direct.fetch.await_count == 2
+        assert unflare.fetch.await_count == 5
+        assert handler.health[0].state == CircuitState.OPEN
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_half_open_probe_closes_or_reopens(self, scripted):
+        """Test that one probe decides whether the handler rejoins"""
+        direct = scripted(scripted.BLOCKED, scripted.BLOCKED, scripted.OK)
+        handler = FallbackRequestHandler(
+            [direct, scripted(scripted.OK)],
+            FallbackConfig(failure_threshold=1, reset_timeout=0.02),
+        )
+
+        await handler.fetch("http://site/", {})
+        await asyncio.sleep(0.03)
+        assert handler.health[0].state == CircuitState.HALF_OPEN
+        await handler.fetch("http://site/", {})  # Probe fails
+        assert handler.health[0].state == CircuitState.OPEN
+
+        await asyncio.sleep(0.03)
+        await handler.fetch("http://site/", {})  # Probe succeeds
+        assert handler.health[0].state == CircuitState.CLOSED
+        assert direct.fetch.await_count == 3
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_half_open_allows_a_single_probe(self, scripted):
+        """Test that concurrent requests don't all probe a recovering handler"""
+        direct, unflare = (
+            scripted(scripted.BLOCKED, scripted.OK, delay=0.01),
+            scripted(scripted.OK),
+        )
+        handler = FallbackRequestHandler(
+            [direct, unflare],
+            FallbackConfig(failure_threshold=1, reset_timeout=0.01),
+        )
+        await handler.fetch("http://site/", {})
+        await asyncio.sleep(0.02)
+
+        await asyncio.gather(*(handler.fetch("http://site/", {}) for _ in range(4)))
+
+        assert direct.fetch.await_count == 2
+        assert unflare.fetch.await_count == 1 + 3
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_prefers_lowest_latency(self, scripted):
+        """Test that the faster healthy handler is tried first"""
+        slow = scripted(scripted.BLOCKED, scripted.OK, delay=0.03)
+        fast = scripted(scripted.OK, delay=0.001)
+        handler = FallbackRequestHandler(
+            [slow, fast], FallbackConfig(failure_threshold=2)
+        )
+
+        await handler.fetch("http://site/", {})  # slow fails, fast answers
+        await handler.fetch("http://site/", {})  # slow answers, now measured
+        for _ in range(3):
+            await handler.fetch("http://site/", {})
+
+        assert slow.fetch.await_count == 2
+        assert fast.fetch.await_count == 4
+        assert handler.health[0].latency > handler.health[1].latency
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_exceptions_fall_back_and_last_failure_is_returned(self, scripted):
+        """Test exception handling and the result when every handler fails"""
+        broken = scripted(ConnectionError("down"))
+        handler = FallbackRequestHandler([broken, scripted(HandlerResponse(503))])
+
+        assert (await handler.fetch("http://site/", {})).status == 503
+        assert handler.health[0].consecutive_failures == 1
+
+        with pytest.raises(ConnectionError):
+            await FallbackRequestHandler([broken]).fetch("http://site/", {})
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_serves_when_every_circuit_is_open(self, scripted):
+        """Test that the handler due to reopen first keeps serving"""
+        first, second = scripted(scripted.BLOCKED), scripted(scripted.BLOCKED)
+        handler = FallbackRequestHandler(
+            [first, second], FallbackConfig(failure_threshold=1)
+        )
+
+        await handler.fetch("http://site/", {})
+        await handler.fetch("http://site/", {})
+
+        assert all(h.state == CircuitState.OPEN for h in handler.health)
+        assert (first.fetch.await_count, second.fetch.await_count) == (2, 1)
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_aclose_closes_every_handler(self, scripted):
+        """Test that closing the chain closes each handler"""
+        handlers = [scripted(scripted.OK), scripted(scripted.OK)]
+
+        await FallbackRequestHandler(handlers).aclose()
+
+        for handler in handlers:
+            handler.aclose.assert_awaited_once()
@@ -0,0 +1,138 @@
+"""Unit tests for hedged requests."""
+
+import asyncio
+
+import pytest
+
+from pro_sports_transactions.handlers import (
+    HandlerResponse,
+    HedgingConfig,
+    HedgingRequestHandler,
+    LatencyTracker,
+)
+
+
+def warmed_up(inner, latency=0.01, **config) -> HedgingRequestHandler:
+    """Hedging handler whose tracked latencies all equal ``latency``."""
+    handler = HedgingRequestHandler(
+        inner, HedgingConfig(min_samples=5, window=20, **config)
+    )
+    for _ in range(5):
+        handler.latencies.add(latency)
+    return handler
+
+
+class TestLatencyTracker:
+    """Test the LatencyTracker"""
+
+    @pytest.mark.unit
+    def test_percentiles_over_the_window(self):
+        """Test nearest-rank percentiles of the most recent latencies"""
+        tracker = LatencyTracker(size=100)
+        assert tracker.percentile(0.5) is None
+
+        for latency in range(1, 201):
+            tracker.add(latency / 100)
+
+        assert tracker.count == 100
+        assert tracker.percentile(0.5) == 1.5
+        assert tracker.percentile(0.95) == 1.95
+        assert tracker.percentile(0.01) == 1.01
+
+
+class TestHedgingRequestHandler:
+    """Test the HedgingRequestHandler"""
+
+    @pytest.mark.unit
+    def test_config_validation(self):
+        """Test that out-of-range settings are rejected"""
+        for settings in ({"percentile": 1.0}, {"max_hedge_rate": 2}, {"window": 5}):
+            with pytest.raises(ValueError):
+                HedgingConfig(**settings)
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_no_hedging_while_warming_up(self, scripted):
+        """Test that requests aren't hedged before min_samples latencies"""
+        inner = scripted(*[(0.001, scripted.OK)] * 3)
+        handler = HedgingRequestHandler(inner, HedgingConfig(min_samples=5))
+
+        for _ in range(3):
+            await handler.fetch("http://site/", {})
+
+        assert handler.hedge_delay() is None
+        assert (handler.requests, handler.hedges) == (3, 0)
+        assert handler.latencies.count == 3
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_slow_request_is_hedged_and_loser_cancelled(self, scripted):
+        """Test that the hedge answers first and the primary is cancelled"""
+        hedge_response = HandlerResponse(status=200, text="<html>Hedge</html>")
+        inner = scripted((1.0, scripted.OK), (0.001, hedge_response))
+        handler = warmed_up(inner, max_hedge_rate=1.0)
+
+        response = await handler.fetch("http://site/", {})
+        await asyncio.sleep(0)
+
+        assert response is hedge_response
+        assert (handler.hedges, handler.hedge_wins) == (1, 1)
+        assert inner.cancelled == [1.0]
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_fast_request_is_not_hedged(self, scripted):
+        """Test that requests within the percentile run alone"""
+        inner = scripted((0.001, scripted.OK))
+        handler = warmed_up(inner, latency=0.5, max_hedge_rate=1.0)
+
+        assert await handler.get("http://site/", {}) == scripted.OK.text
+        assert inner.fetch.await_count == 1
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_hedge_rate_is_capped(self, scripted):
+        """Test that at most max_hedge_rate of recent requests are hedged"""
+        inner = scripted(*[(0.02, scripted.OK)] * 30)
+        handler = warmed_up(inner, latency=0.001, percentile=0.1, max_hedge_rate=0.25)
+
+        for _ in range(12):
+            await handler.fetch("http://site/", {})
+
+        assert handler.hedges == 3
+        assert inner.fetch.await_count == 12 + 3
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_failure_waits_for_the_other_request(self, scripted):
+        """Test that a failed first answer doesn't beat a later success"""
+        inner = scripted((0.03, scripted.OK), (0.001, HandlerResponse(status=503)))
+        handler = warmed_up(inner, max_hedge_rate=1.0)
+
+        assert await handler.fetch("http://site/", {}) is scripted.OK
+        assert handler.hedge_wins == 0
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_all_failures(self, scripted):
+        """Test that a failure is returned, or an exception raised"""
+        failed = warmed_up(
+            scripted((0.03, HandlerResponse(status=503)), (0.001, ConnectionError())),
+            max_hedge_rate=1.0,
+        )
+        broken = warmed_up(scripted((0.001, ConnectionError("down"))))
+
+        assert (await failed.fetch("http://site/", {})).status == 503
+        with pytest.raises(ConnectionError):
+            await broken.fetch("http://site/", {})
+        assert failed.latencies.count == broken.latencies.count == 5
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_aclose_delegates(self, scripted):
+        """Test that closing the wrapper closes the wrapped handler"""
+        inner = scripted()
+
+        await HedgingRequestHandler(inner).aclose()
+
+        inner.aclose.assert_awaited_once()
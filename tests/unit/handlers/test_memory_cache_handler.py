@@ -0,0 +1,157 @@
+"""Unit tests for the in-memory result cache."""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pandas as pd
+import pytest
+
+from pro_sports_transactions.handlers import (
+    MemoryCacheConfig,
+    MemoryCacheRequestHandler,
+)
+from pro_sports_transactions.handlers.base_handler import has_errors
+from pro_sports_transactions.search import Search, results_frame
+
+
+def frame(text):
+    """Parse stand-in returning a small DataFrame for the page text."""
+    return pd.DataFrame({"Notes": [text] * 3})
+
+
+def parse_frame(text):
+    """Parse a results page into the DataFrame ``Search`` returns for it."""
+    return results_frame(Search._parse(text))
+
+
+class TestMemoryCacheRequestHandler:
+    """Test the MemoryCacheRequestHandler"""
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_hit_skips_request_and_parse(self, paged_handler, monkeypatch):
+        """Test that repeated searches are served without fetching or parsing"""
+        inner = paged_handler(pages=1, last_page_rows=5)
+        handler = MemoryCacheRequestHandler(inner)
+        parse = Search._parse
+        parses = []
+
+        def counting_parse(response):
+            parses.append(response)
+            return parse(response)
+
+        monkeypatch.setattr(Search, "_parse", staticmethod(counting_parse))
+        frames = [
+            await Search(team="Lakers", request_handler=handler).get_dataframe()
+            for _ in range(3)
+        ]
+
+        assert len(inner.urls) == 1
+        assert len(parses) == 1
+        assert all(df.equals(frames[0]) for df in frames)
+        assert (handler.hits, handler.misses) == (2, 1)
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_callers_cannot_corrupt_entries(self, paged_handler):
+        """Test that each caller gets its own copy of the cached DataFrame"""
+        handler = MemoryCacheRequestHandler(paged_handler(pages=1, last_page_rows=5))
+        url = await Search(team="Lakers").get_url()
+
+        first = await handler.get_parsed(url, {}, parse_frame)
+        first.loc[0, "Team"] = "Changed"
+        first.attrs["pages"] = 99
+        second = await handler.get_parsed(url, {}, parse_frame)
+
+        assert second.loc[0, "Team"] == "Lakers"
+        assert second.attrs["pages"] == 1
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_share_one_load(self):
+        """Test that concurrent misses for one URL load once"""
+        inner = AsyncMock()
+
+        async def slow_parsed(_url, _headers, parse):
+            await asyncio.sleep(0.01)
+            return parse("page")
+
+        inner.get_parsed = AsyncMock(side_effect=slow_parsed)
+        handler = MemoryCacheRequestHandler(inner)
+
+        results = await asyncio.gather(
+            *(handler.get_parsed("http://a/", {}, frame) for _ in range(5))
+        )
+
+        assert inner.get_parsed.await_count == 1
+        assert len({id(result) for result in results}) == 5
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("parse", [Search._parse, parse_frame])
+    async def test_results_with_errors_are_not_cached(self, parse):
+        """Test that failed pages are refetched next time"""
+        inner = AsyncMock()
+        inner.get_parsed = AsyncMock(side_effect=lambda url, h, parse: parse(None))
+        handler = MemoryCacheRequestHandler(inner)
+
+        await handler.get_parsed("http://a/", {}, parse)
+        result = await handler.get_parsed("http://a/", {}, parse)
+
+        assert has_errors(result)
+        assert inner.get_parsed.await_count == 2
+        assert handler.size == 0
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_expired_entries_are_reloaded(self):
+        """Test that entries past their TTL count as misses"""
+        inner = AsyncMock()
+        inner.get_parsed = AsyncMock(side_effect=lambda url, h, parse: parse(url))
+        handler = MemoryCacheRequestHandler(inner, MemoryCacheConfig(ttl=0.01))
+
+        await handler.get_parsed("http://a/", {}, frame)
+        await asyncio.sleep(0.02)
+        await handler.get_parsed("http://a/", {}, frame)
+
+        assert inner.get_parsed.await_count == 2
+        assert (handler.hits, handler.misses) == (0, 2)
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_evicts_least_recently_used_over_budget(self):
+        """Test LRU eviction by estimated size"""
+        inner = AsyncMock()
+        inner.get_parsed = AsyncMock(side_effect=lambda url, h, parse: parse(url))
+        entry_size = MemoryCacheRequestHandler._sizeof(frame("http://0/"))
+        handler = MemoryCacheRequestHandler(
+            inner, MemoryCacheConfig(max_bytes=int(entry_size * 2.5))
+        )
+
+        await handler.get_parsed("http://0/", {}, frame)
+        await handler.get_parsed("http://1/", {}, frame)
+        await handler.get_parsed("http://0/", {}, frame)  # Most recently used
+        await handler.get_parsed("http://2/", {}, frame)
+
+        assert handler.evictions == 1
+        assert handler.size <= handler.config.max_bytes
+        await handler.get_parsed("http://0/", {}, frame)
+        await handler.get_parsed("http://2/", {}, frame)
+        assert inner.get_parsed.await_count == 3
+        await handler.get_parsed("http://1/", {}, frame)
+        assert inner.get_parsed.await_count == 4
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_raw_requests_pass_through(self):
+        """Test that get() and fetch() are not cached, and aclose delegates"""
+        inner = AsyncMock()
+        inner.get = AsyncMock(return_value="<html/>")
+        handler = MemoryCacheRequestHandler(inner)
+
+        await handler.get("http://a/", {})
+        await handler.get("http://a/", {})
+        await handler.aclose()
+
+        assert inner.get.await_count == 2
+        inner.aclose.assert_awaited_once()
@@ -0,0 +1,204 @@
+"""Unit tests for RateLimitedRequestHandler."""
+
+import time
+from unittest.mock import AsyncMock
+from urllib.parse import urlparse
+
+import pytest
+
+from pro_sports_transactions.handlers import (
+    HandlerResponse,
+    RateLimitConfig,
+    RateLimitedRequestHandler,
+    RequestHandler,
+    UnflareConfig,
+    UnflareRequestHandler,
+)
+
+
+class ScriptedHandler(RequestHandler):
+    """Returns queued responses (then 200s) and records request times."""
+
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.times = []
+
+    async def get(self, url, headers):
+        return (await self.fetch(url, headers)).text
+
+    async def fetch(self, url, headers):
+        self.times.append(time.monotonic())
+        if self.responses:
+            return self.responses.pop(0)
+        return HandlerResponse(status=200, text="<html>OK</html>")
+
+
+class TextOnlyHandler(RequestHandler):
+    """Handler that only implements get()."""
+
+    def __init__(self, text):
+        self.text = text
+
+    async def get(self, url, headers):
+        return self.text
+
+
+class TestRateLimitedRequestHandler:
+    """Test the RateLimitedRequestHandler"""
+
+    @pytest.mark.unit
+    def test_config_defaults(self):
+        """Test RateLimitConfig default values"""
+        config = RateLimitConfig()
+
+        assert config.requests_per_second == 2.0
+        assert config.burst == 5
+        assert config.throttle_statuses == (403, 429, 503)
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_burst_then_rate(self):
+        """Test that a burst passes immediately and the rest are paced"""
+        inner = ScriptedHandler()
+        handler = RateLimitedRequestHandler(
+            inner, RateLimitConfig(requests_per_second=20, burst=2)
+        )
+
+        start = time.monotonic()
+        for _ in range(6):
+            assert await handler.get("http://example.com/", {}) == "<html>OK</html>"
+        elapsed = time.monotonic() - start
+
+        assert inner.times[1] - start < 0.02
+        # Four requests beyond the burst at 20/sec
+        assert elapsed >= 0.19
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_hosts_are_limited_independently(self):
+        """Test that each host has its own bucket"""
+        inner = ScriptedHandler()
+        handler = RateLimitedRequestHandler(
+            inner, RateLimitConfig(requests_per_second=1, burst=1)
+        )
+
+        start = time.monotonic()
+        await handler.get("http://a.example.com/", {})
+        await handler.get("http://b.example.com/", {})
+
+        assert time.monotonic() - start < 0.1
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_throttle_status_slows_down(self):
+        """Test that a throttling status cuts the host's rate"""
+        inner = ScriptedHandler(HandlerResponse(status=429))
+        handler = RateLimitedRequestHandler(
+            inner,
+            RateLimitConfig(requests_per_second=40, burst=5, backoff_factor=0.5),
+        )
+
+        response = await handler.fetch("http://example.com/", {})
+
+        assert response.status == 429
+        assert handler.current_rate("example.com") == 20
+
+        # The saved-up burst is dropped: the next request waits
+        start = time.monotonic()
+        await handler.get("http://example.com/", {})
+        assert time.monotonic() - start >= 0.04
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_rate_never_drops_below_minimum(self):
+        """Test that repeated throttling stops at the minimum rate"""
+        inner = ScriptedHandler(*(HandlerResponse(status=503) for _ in range(3)))
+        handler = RateLimitedRequestHandler(
+            inner,
+            RateLimitConfig(
+                requests_per_second=100, min_requests_per_second=30, burst=1
+            ),
+        )
+
+        for _ in range(3):
+            await handler.fetch("http://example.com/", {})
+
+        assert handler.current_rate("example.com") == 30
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_retry_after_is_honoured(self):
+        """Test that Retry-After pauses the host for the requested time"""
+        inner = ScriptedHandler(
+            HandlerResponse(status=429, headers={"Retry-After": "0.2"})
+        )
+        handler = RateLimitedRequestHandler(
+            inner, RateLimitConfig(requests_per_second=100, burst=5)
+        )
+
+        # The pause starts when the 429 arrives, so time both requests
+        start = time.monotonic()
+        await handler.fetch("http://example.com/", {})
+        await handler.fetch("http://example.com/", {})
+
+        assert time.monotonic() - start >= 0.2
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_success_recovers_rate(self):
+        """Test that successes raise the rate back to the ceiling"""
+        inner = ScriptedHandler(HandlerResponse(status=403))
+        handler = RateLimitedRequestHandler(
+            inner,
+            RateLimitConfig(
+                requests_per_second=100, burst=10, backoff_factor=0.9, recovery_step=4
+            ),
+        )
+
+        await handler.fetch("http://example.com/", {})
+        assert handler.current_rate("example.com") == 90
+
+        for _ in range(5):
+            await handler.fetch("http://example.com/", {})
+        assert handler.current_rate("example.com") == 100
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_wraps_get_only_handlers(self):
+        """Test that handlers implementing only get() can be wrapped"""
+        handler = RateLimitedRequestHandler(TextOnlyHandler(None))
+
+        response = await handler.fetch("http://example.com/", {})
+
+        assert response.status == 0
+        assert not response.ok
+        assert handler.current_rate("example.com") == 2.0
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_aclose_closes_wrapped_handler(self):
+        """Test that closing the wrapper closes the wrapped handler"""
+        inner = ScriptedHandler()
+        inner.aclose = AsyncMock()
+
+        async with RateLimitedRequestHandler(inner):
+            pass
+
+        inner.aclose.assert_awaited_once()
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_sees_throttling_behind_unflare(self, stub_unflare):
+        """Test that a throttled Unflare request slows down without a new solve"""
+        unflare = UnflareRequestHandler(UnflareConfig(url=stub_unflare.scrape_url))
+        config = RateLimitConfig(requests_per_second=1.0)
+        host = urlparse(stub_unflare.site_url()).netloc
+        async with RateLimitedRequestHandler(unflare, config) as handler:
+            await handler.fetch(stub_unflare.site_url(), {})
+            stub_unflare.site_status = 429
+
+            response = await handler.fetch(stub_unflare.site_url(), {})
+
+            assert response.status == 429
+            assert stub_unflare.scrape_calls == 1
+            assert handler.current_rate(host) < 1.0
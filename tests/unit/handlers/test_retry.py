@@ -0,0 +1,240 @@
+"""Unit tests for RetryPolicy and its use by the handlers."""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import aiohttp
+import pytest
+
+from pro_sports_transactions.handlers import (
+    DirectConfig,
+    DirectRequestHandler,
+    HandlerResponse,
+    RetryPolicy,
+    UnflareConfig,
+    UnflareRequestHandler,
+)
+
+OK = HandlerResponse(status=200, text="<html>OK</html>")
+
+
+def fast_policy(**kwargs) -> RetryPolicy:
+    """Retry policy with negligible delays."""
+    return RetryPolicy(backoff_base=0.001, backoff_cap=0.001, **kwargs)
+
+
+class TestRetryPolicy:
+    """Test the RetryPolicy"""
+
+    @pytest.mark.unit
+    def test_backoff_without_jitter_doubles_up_to_cap(self):
+        """Test exponential backoff bounded by the cap"""
+        policy = RetryPolicy(backoff_base=0.5, backoff_cap=3.0, jitter=False)
+
+        assert [policy.backoff(n) for n in range(1, 6)] == [0.5, 1.0, 2.0, 3.0, 3.0]
+
+    @pytest.mark.unit
+    def test_backoff_with_jitter_stays_within_bound(self):
+        """Test that full jitter stays between zero and the backoff"""
+        policy = RetryPolicy(backoff_base=1.0, backoff_cap=10.0)
+
+        delays = [policy.backoff(3) for _ in range(200)]
+
+        assert all(0 <= delay <= 4.0 for delay in delays)
+        assert len(set(delays)) > 1
+
+    @pytest.mark.unit
+    def test_timeout_is_per_attempt(self):
+        """Test that the aiohttp timeout carries connect/read limits only"""
+        timeout = RetryPolicy(connect_timeout=2.0, read_timeout=7.0).timeout()
+
+        assert timeout.total is None
+        assert timeout.sock_connect == 2.0
+        assert timeout.sock_read == 7.0
+
+    @pytest.mark.unit
+    def test_rejects_zero_attempts(self):
+        """Test that at least one attempt is required"""
+        with pytest.raises(ValueError):
+            RetryPolicy(max_attempts=0)
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_retries_retryable_status(self):
+        """Test that retryable statuses are retried until success"""
+        attempt = AsyncMock(side_effect=[HandlerResponse(status=503), OK])
+
+        response = await fast_policy().run(attempt)
+
+        assert response == OK
+        assert attempt.await_count == 2
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_returns_non_retryable_status_immediately(self):
+        """Test that non-retryable statuses are not retried"""
+        attempt = AsyncMock(return_value=HandlerResponse(status=404))
+
+        response = await fast_policy().run(attempt)
+
+        assert response.status == 404
+        assert attempt.await_count == 1
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_returns_last_response_when_attempts_run_out(self):
+        """Test that the final retryable response is returned"""
+        attempt = AsyncMock(return_value=HandlerResponse(status=502))
+
+        response = await fast_policy(max_attempts=4).run(attempt)
+
+        assert response.status == 502
+        assert attempt.await_count == 4
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_retries_retryable_exceptions(self):
+        """Test that retryable exceptions are retried, then re-raised"""
+        error = aiohttp.ClientConnectionError("reset")
+
+        recovered = AsyncMock(side_effect=[error, OK])
+        assert await fast_policy().run(recovered) == OK
+
+        failing = AsyncMock(side_effect=error)
+        with pytest.raises(aiohttp.ClientConnectionError):
+            await fast_policy(max_attempts=2).run(failing)
+        assert failing.await_count == 2
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_does_not_retry_other_exceptions(self):
+        """Test that exceptions outside the retryable set propagate at once"""
+        attempt = AsyncMock(side_effect=KeyError("boom"))
+
+        with pytest.raises(KeyError):
+            await fast_policy().run(attempt)
+        assert attempt.await_count == 1
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_deadline_cuts_off_slow_attempt(self):
+        """Test that the overall deadline interrupts a stalled attempt"""
+
+        async def stalled():
+            await asyncio.sleep(10)
+
+        with pytest.raises(TimeoutError):
+            await fast_policy(deadline=0.05).run(stalled)
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_deadline_stops_retrying(self):
+        """Test that no retry starts once its delay would pass the deadline"""
+        attempt = AsyncMock(return_value=HandlerResponse(status=503))
+        policy = RetryPolicy(
+            max_attempts=10, backoff_base=0.05, jitter=False, deadline=0.12
+        )
+
+        response = await policy.run(attempt)
+
+        assert response.status == 503
+        assert attempt.await_count < 10
+
+
+class TestHandlerRetries:
+    """Test that the handlers apply their configured retry policy"""
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_direct_handler_retries(self):
+        """Test that DirectRequestHandler retries through its policy"""
+        handler = DirectRequestHandler(DirectConfig(retry_policy=fast_policy()))
+
+        with patch.object(
+            handler,
+            "_fetch_once",
+            new=AsyncMock(side_effect=[HandlerResponse(status=503), OK]),
+        ) as mock_fetch:
+            result = await handler.get("http://example.com", {})
+
+        assert result == "<html>OK</html>"
+        assert mock_fetch.await_count == 2
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_direct_handler_without_policy_tries_once(self):
+        """Test that DirectRequestHandler makes one attempt by default"""
+        handler = DirectRequestHandler()
+
+        with patch.object(
+            handler,
+            "_fetch_once",
+            new=AsyncMock(return_value=HandlerResponse(status=503)),
+        ) as mock_fetch:
+            assert await handler.get("http://example.com", {}) is None
+
+        assert mock_fetch.await_count == 1
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_direct_session_uses_policy_timeout(self):
+        """Test that the pooled session is created with per-attempt timeouts"""
+        policy = RetryPolicy(connect_timeout=3.0, read_timeout=9.0)
+        handler = DirectRequestHandler(DirectConfig(retry_policy=policy))
+
+        with patch(
+            "pro_sports_transactions.handlers.direct_handler.aiohttp"
+        ) as mock_aiohttp:
+            handler._get_session()
+
+        _, kwargs = mock_aiohttp.ClientSession.call_args
+        assert kwargs["timeout"] == policy.timeout()
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_unflare_handler_retries(self):
+        """Test that UnflareRequestHandler retries through its policy"""
+        handler = UnflareRequestHandler(UnflareConfig(retry_policy=fast_policy()))
+
+        with patch.object(
+            handler,
+            "_refresh_cache_and_request",
+            new=AsyncMock(side_effect=[HandlerResponse(status=0), OK]),
+        ) as mock_refresh:
+            result = await handler.get("http://example.com", {})
+
+        assert result == "<html>OK</html>"
+        assert mock_refresh.await_count == 2
+
+    @pytest.mark.unit
+    def test_unflare_timeout_from_policy(self):
+        """Test that site requests use the policy's timeouts and solves don't"""
+        policy = RetryPolicy(connect_timeout=3.0, read_timeout=9.0)
+        plain = UnflareRequestHandler(UnflareConfig())
+        retrying = UnflareRequestHandler(
+            UnflareConfig(timeout=45000, retry_policy=policy)
+        )
+
+        assert plain._site_timeout().total == 120
+        assert retrying._site_timeout() == policy.timeout()
+        assert plain._service_timeout() == aiohttp.ClientTimeout(total=120)
+        assert retrying._service_timeout() == aiohttp.ClientTimeout(total=105)
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_unflare_solve_outlasts_read_timeout(self, stub_unflare):
+        """Test that a solve slower than the read timeout is not cut short"""
+        stub_unflare.solve_delay = 0.3
+        handler = UnflareRequestHandler(
+            UnflareConfig(
+                url=stub_unflare.scrape_url,
+                retry_policy=fast_policy(read_timeout=0.1),
+            )
+        )
+        try:
+            response = await handler.fetch(stub_unflare.site_url(), {})
+        finally:
+            await handler.aclose()
+
+        assert response.ok
+        assert stub_unflare.scrape_calls == 1
@@ -0,0 +1,145 @@
+"""Unit tests for conditional-request revalidation."""
+
+import pandas as pd
+import pytest
+
+from pro_sports_transactions.handlers import (
+    HandlerResponse,
+    RevalidatingRequestHandler,
+    RevalidationConfig,
+    UnflareConfig,
+    UnflareRequestHandler,
+)
+from pro_sports_transactions.search import Search
+
+PAGE = "<html>Page</html>"
+
+
+def counting_parse(calls):
+    """Parse stand-in that records each call in ``calls``."""
+
+    def parse(text):
+        calls.append(text)
+        return pd.DataFrame({"Notes": [text]})
+
+    return parse
+
+
+class TestRevalidatingRequestHandler:
+    """Test the RevalidatingRequestHandler"""
+
+    @pytest.mark.unit
+    def test_requires_positive_max_entries(self):
+        """Test config validation"""
+        with pytest.raises(ValueError):
+            RevalidationConfig(max_entries=0)
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_sends_validators_and_reuses_body_on_304(self, scripted):
+        """Test that 304 Not Modified is answered with the previous page"""
+        validators = {"ETag": '"v1"', "Last-Modified": "Wed, 01 Mar 2023 00:00:00"}
+        inner = scripted(
+            HandlerResponse(200, PAGE, validators),
+            HandlerResponse(304, headers={"ETag": '"v1"'}),
+        )
+        handler = RevalidatingRequestHandler(inner)
+
+        await handler.fetch("http://a/", {"accept": "*/*"})
+        response = await handler.fetch("http://a/", {"accept": "*/*"})
+
+        assert response.ok and response.text == PAGE
+        assert handler.not_modified == 1
+        assert inner.fetch.await_args_list[0].args[1] == {"accept": "*/*"}
+        assert inner.fetch.await_args_list[1].args[1] == {
+            "accept": "*/*",
+            "If-None-Match": '"v1"',
+            "If-Modified-Since": "Wed, 01 Mar 2023 00:00:00",
+        }
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_304_skips_parsing(self, scripted):
+        """Test that a not-modified page reuses a copy of the parsed result"""
+        inner = scripted(
+            HandlerResponse(200, PAGE, {"etag": '"v1"'}),
+            HandlerResponse(304),
+        )
+        handler = RevalidatingRequestHandler(inner)
+        calls = []
+        parse = counting_parse(calls)
+
+        first = await handler.get_parsed("http://a/", {}, parse)
+        first.loc[0, "Notes"] = "changed"
+        second = await handler.get_parsed("http://a/", {}, parse)
+
+        assert calls == [PAGE]
+        assert second.loc[0, "Notes"] == PAGE
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_unchanged_body_without_validators_skips_parsing(self, scripted):
+        """Test the content-hash fallback"""
+        inner = scripted(
+            HandlerResponse(200, PAGE),
+            HandlerResponse(200, PAGE),
+            HandlerResponse(200, "<html>New</html>"),
+        )
+        handler = RevalidatingRequestHandler(inner)
+        calls = []
+        parse = counting_parse(calls)
+
+        for _ in range(3):
+            await handler.get_parsed("http://a/", {}, parse)
+
+        assert calls == [PAGE, "<html>New</html>"]
+        assert handler.unchanged == 1
+        assert "If-None-Match" not in inner.fetch.await_args_list[1].args[1]
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_failures_and_errors_are_not_reused(self, scripted):
+        """Test that failed requests and pages that failed to parse are retried"""
+        inner = scripted(
+            HandlerResponse(503),
+            HandlerResponse(200, "<html>No tables</html>"),
+            HandlerResponse(200, "<html>No tables</html>"),
+        )
+        handler = RevalidatingRequestHandler(inner)
+
+        failed = await handler.get_parsed("http://a/", {}, Search._parse)
+        unparsable = await handler.get_parsed("http://a/", {}, Search._parse)
+        again = await handler.get_parsed("http://a/", {}, Search._parse)
+
+        assert "NoneType" in failed.errors[0]
+        assert "No tables found" in unparsable.errors[0]
+        assert again.errors == unparsable.errors
+        assert handler.unchanged == 1
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_forgets_least_recently_used_urls(self, scripted):
+        """Test the max_entries bound"""
+        inner = scripted(*(HandlerResponse(200, PAGE, {"ETag": "x"}),) * 4)
+        handler = RevalidatingRequestHandler(inner, RevalidationConfig(max_entries=2))
+
+        for url in ("http://a/", "http://b/", "http://a/", "http://c/"):
+            await handler.fetch(url, {})
+
+        assert list(handler._entries) == ["http://a/", "http://c/"]
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_unflare_304_uses_cached_credentials(self, stub_unflare):
+        """Test revalidation through Unflare without another solve"""
+        stub_unflare.site_etag = '"v1"'
+        calls = []
+        parse = counting_parse(calls)
+        unflare = UnflareRequestHandler(UnflareConfig(url=stub_unflare.scrape_url))
+        async with RevalidatingRequestHandler(unflare) as handler:
+            for _ in range(3):
+                await handler.get_parsed(stub_unflare.site_url(), {}, parse)
+
+            assert handler.not_modified == 2
+        assert calls == [stub_unflare.page]
+        assert stub_unflare.scrape_calls == 1
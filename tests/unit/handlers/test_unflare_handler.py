@@ -1,13 +1,18 @@
 """Unit tests for unflare handling."""
 
+import asyncio
 import logging
 import time
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, patch
 
 import aiohttp
 import pytest
 
-from pro_sports_transactions.handlers import UnflareConfig, UnflareRequestHandler
+from pro_sports_transactions.handlers import (
+    HandlerResponse,
+    UnflareConfig,
+    UnflareRequestHandler,
+)
 
 
 class TestUnflareHandler:
@@ -116,6 +121,18 @@ class TestUnflareHandler:
         assert not handler.has_cached_cookies
         assert handler.cache_expiry_time == 0
 
+    @pytest.mark.unit
+    def test_credential_generation(self):
+        """Test that the generation changes only when credentials are cached"""
+        handler = UnflareRequestHandler(UnflareConfig())
+        start = handler.credential_generation
+
+        handler.cache_credentials([{"name": "cf", "value": "1"}], {})
+        handler.cache_credentials([{"name": "cf", "value": "2"}], {})
+        handler.clear_cache()
+
+        assert handler.credential_generation == start + 2
+
     @pytest.mark.unit
     @pytest.mark.asyncio
     async def test_get_with_no_cache(self):
@@ -127,7 +144,9 @@ class TestUnflareHandler:
         with patch.object(
             handler, "_refresh_cache_and_request", new_callable=AsyncMock
         ) as mock_refresh:
-            mock_refresh.return_value = "<html>Fresh Response</html>"
+            mock_refresh.return_value = HandlerResponse(
+                status=200, text="<html>Fresh Response</html>"
+            )
 
             result = await handler.get("http://example.com", {"test": "header"})
 
@@ -153,7 +172,9 @@ class TestUnflareHandler:
         with patch.object(
             handler, "_try_cached_request", new_callable=AsyncMock
         ) as mock_cached:
-            mock_cached.return_value = "<html>Cached Response</html>"
+            mock_cached.return_value = HandlerResponse(
+                status=200, text="<html>Cached Response</html>"
+            )
 
             result = await handler.get("http://example.com", {"test": "header"})
 
@@ -164,182 +185,378 @@ class TestUnflareHandler:
 
     @pytest.mark.unit
     @pytest.mark.asyncio
-    async def test_refresh_logs_non_200_unflare_response(self, caplog):
+    async def test_refresh_logs_non_200_unflare_response(self, stub_unflare, caplog):
         """Test that non-200 from Unflare service is logged"""
-        config = UnflareConfig()
-        handler = UnflareRequestHandler(config)
-
-        mock_response = AsyncMock()
-        mock_response.status = 502
-        mock_response.text = AsyncMock(return_value="Bad Gateway")
-        mock_response.__aenter__ = AsyncMock(return_value=mock_response)
-        mock_response.__aexit__ = AsyncMock(return_value=False)
+        stub_unflare.scrape_status = 502
 
-        mock_session = AsyncMock()
-        mock_session.post = MagicMock(return_value=mock_response)
-        mock_session.__aenter__ = AsyncMock(return_value=mock_session)
-        mock_session.__aexit__ = AsyncMock(return_value=False)
-
-        with patch("aiohttp.ClientSession", return_value=mock_session):
+        async with UnflareRequestHandler(
+            UnflareConfig(url=stub_unflare.scrape_url)
+        ) as handler:
             with caplog.at_level(logging.WARNING):
                 result = await handler._refresh_cache_and_request(
-                    "http://example.com", {}
+                    stub_unflare.site_url(), {}
                 )
 
-        assert result is None
+        assert result.text is None
+        assert result.status == 502
         assert "Unflare service returned status 502" in caplog.text
 
     @pytest.mark.unit
     @pytest.mark.asyncio
-    async def test_refresh_logs_non_200_final_response(self, caplog):
-        """Test that non-200 from the final request is logged"""
-        config = UnflareConfig()
-        handler = UnflareRequestHandler(config)
+    async def test_refresh_logs_non_200_final_response(self, stub_unflare, caplog):
+        """Test that non-200 from the request after a refresh is logged"""
+        stub_unflare.site_status = 503
 
-        # Mock Unflare response (success)
-        unflare_response = AsyncMock()
-        unflare_response.status = 200
-        unflare_response.json = AsyncMock(
-            return_value={
-                "cookies": [
-                    {"name": "cf", "value": "abc", "expires": time.time() + 3600}
-                ],
-                "headers": {"X-CF": "test"},
-            }
-        )
-        unflare_response.__aenter__ = AsyncMock(return_value=unflare_response)
-        unflare_response.__aexit__ = AsyncMock(return_value=False)
-
-        # Mock final response (failure)
-        final_response = AsyncMock()
-        final_response.status = 503
-        final_response.text = AsyncMock(return_value="Service Unavailable")
-        final_response.__aenter__ = AsyncMock(return_value=final_response)
-        final_response.__aexit__ = AsyncMock(return_value=False)
-
-        # First session (Unflare), second session (final request)
-        unflare_session = AsyncMock()
-        unflare_session.post = MagicMock(return_value=unflare_response)
-        unflare_session.__aenter__ = AsyncMock(return_value=unflare_session)
-        unflare_session.__aexit__ = AsyncMock(return_value=False)
-
-        final_session = AsyncMock()
-        final_session.get = MagicMock(return_value=final_response)
-        final_session.__aenter__ = AsyncMock(return_value=final_session)
-        final_session.__aexit__ = AsyncMock(return_value=False)
-
-        sessions = [unflare_session, final_session]
-        with patch("aiohttp.ClientSession", side_effect=sessions):
+        async with UnflareRequestHandler(
+            UnflareConfig(url=stub_unflare.scrape_url)
+        ) as handler:
             with caplog.at_level(logging.WARNING):
                 result = await handler._refresh_cache_and_request(
-                    "http://example.com", {}
+                    stub_unflare.site_url(), {}
                 )
 
-        assert result is None
-        assert "Final request failed with status 503" in caplog.text
+        assert result.text is None
+        assert result.status == 503
+        assert "Cached request failed with status 503" in caplog.text
 
     @pytest.mark.unit
     @pytest.mark.asyncio
-    async def test_cached_request_logs_non_200_response(self, caplog):
+    async def test_cached_request_logs_non_200_response(self, stub_unflare, caplog):
         """Test that non-200 from cached request is logged"""
-        config = UnflareConfig()
-        handler = UnflareRequestHandler(config)
+        async with UnflareRequestHandler(
+            UnflareConfig(url=stub_unflare.scrape_url)
+        ) as handler:
+            await handler.get(stub_unflare.site_url(), {})
+            stub_unflare.site_status = 500
 
-        # Set up valid cache
-        valid_cookies = [
-            {"name": "session", "value": "abc", "expires": time.time() + 1000}
-        ]
-        handler.cache_credentials(valid_cookies, {"X-CF": "test"})
-
-        mock_response = AsyncMock()
-        mock_response.status = 500
-        mock_response.text = AsyncMock(return_value="Internal Server Error")
-        mock_response.__aenter__ = AsyncMock(return_value=mock_response)
-        mock_response.__aexit__ = AsyncMock(return_value=False)
-
-        mock_session = AsyncMock()
-        mock_session.get = MagicMock(return_value=mock_response)
-        mock_session.__aenter__ = AsyncMock(return_value=mock_session)
-        mock_session.__aexit__ = AsyncMock(return_value=False)
-
-        with patch("aiohttp.ClientSession", return_value=mock_session):
             with caplog.at_level(logging.WARNING):
-                result = await handler._try_cached_request("http://example.com", {})
+                result = await handler._try_cached_request(stub_unflare.site_url(), {})
 
-        assert result is None
+        assert result.text is None
+        assert result.status == 500
         assert "Cached request failed with status 500" in caplog.text
 
     @pytest.mark.unit
     @pytest.mark.asyncio
-    async def test_sessions_use_timeout(self):
+    async def test_sessions_use_timeout(self, stub_unflare):
         """Test that aiohttp sessions are configured with a timeout"""
-        config = UnflareConfig()
-        handler = UnflareRequestHandler(config)
+        async with UnflareRequestHandler(
+            UnflareConfig(url=stub_unflare.scrape_url)
+        ) as handler:
+            await handler.get(stub_unflare.site_url(), {})
 
-        mock_response = AsyncMock()
-        mock_response.status = 200
-        mock_response.json = AsyncMock(
-            return_value={
-                "cookies": [
-                    {"name": "cf", "value": "abc", "expires": time.time() + 3600}
-                ],
-                "headers": {"X-CF": "test"},
-            }
-        )
-        mock_response.text = AsyncMock(return_value="<html>OK</html>")
-        mock_response.__aenter__ = AsyncMock(return_value=mock_response)
-        mock_response.__aexit__ = AsyncMock(return_value=False)
+            for session in (handler._service_session, handler._site_session):
+                assert isinstance(session.timeout, aiohttp.ClientTimeout)
+                assert session.timeout.total == 120
 
-        mock_session = AsyncMock()
-        mock_session.post = MagicMock(return_value=mock_response)
-        mock_session.get = MagicMock(return_value=mock_response)
-        mock_session.__aenter__ = AsyncMock(return_value=mock_session)
-        mock_session.__aexit__ = AsyncMock(return_value=False)
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_site_requests_carry_unflare_credentials(self, stub_unflare):
+        """Test that site requests send the Unflare cookies and headers"""
+        async with UnflareRequestHandler(
+            UnflareConfig(url=stub_unflare.scrape_url)
+        ) as handler:
+            await handler.get(
+                stub_unflare.site_url(),
+                {"user-agent": "caller", "referer": "https://example.com/"},
+            )
+
+        sent = stub_unflare.site_headers[-1]
+        assert sent["Accept-Encoding"] == "gzip, deflate, br"
+        # Unflare's headers win over the caller's; other caller headers are kept
+        assert sent.getall("User-Agent") == ["stub-browser"]
+        assert sent["Referer"] == "https://example.com/"
+        assert f"cf_clearance={stub_unflare.clearance}" in sent["Cookie"]
 
-        with patch("aiohttp.ClientSession", return_value=mock_session) as mock_cls:
-            await handler._refresh_cache_and_request("http://example.com", {})
 
-            # All ClientSession calls should include a timeout
-            for call in mock_cls.call_args_list:
-                _, kwargs = call
-                assert "timeout" in kwargs
-                assert isinstance(kwargs["timeout"], aiohttp.ClientTimeout)
-                assert kwargs["timeout"].total == 120
+class TestUnflareSessions:
+    """Test the long-lived Unflare and site sessions"""
 
     @pytest.mark.unit
     @pytest.mark.asyncio
-    async def test_sessions_include_accept_encoding(self):
-        """Test that final request sessions include Accept-Encoding header"""
-        config = UnflareConfig()
-        handler = UnflareRequestHandler(config)
+    async def test_cached_requests_reuse_session_and_connection(self, stub_unflare):
+        """Test that cached requests share one session and keep-alive connection"""
+        async with UnflareRequestHandler(
+            UnflareConfig(url=stub_unflare.scrape_url)
+        ) as handler:
+            await handler.get(stub_unflare.site_url(), {})
+            session = handler._site_session
+
+            for page in range(5):
+                assert await handler.get(stub_unflare.site_url(f"p{page}"), {})
 
-        mock_response = AsyncMock()
-        mock_response.status = 200
-        mock_response.json = AsyncMock(
-            return_value={
-                "cookies": [
-                    {"name": "cf", "value": "abc", "expires": time.time() + 3600}
-                ],
-                "headers": {"X-CF": "test"},
-            }
+            assert handler._site_session is session
+
+        assert stub_unflare.scrape_calls == 1
+        assert len(stub_unflare.site_peers) == 1
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_session_rebuilt_when_credentials_rotate(self, stub_unflare):
+        """Test that a credential rotation replaces and closes the old session"""
+        async with UnflareRequestHandler(
+            UnflareConfig(url=stub_unflare.scrape_url)
+        ) as handler:
+            await handler.get(stub_unflare.site_url(), {})
+            old_session = handler._site_session
+            stub_unflare.clearance = "rotated"
+
+            assert await handler.get(stub_unflare.site_url(), {}) == stub_unflare.page
+
+            assert stub_unflare.scrape_calls == 2
+            assert handler._site_session is not old_session
+            assert old_session.closed
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_retired_session_closes_after_in_flight_requests(self):
+        """Test that a rotated-out session stays open for its in-flight request"""
+        handler = UnflareRequestHandler(UnflareConfig())
+        handler.cache_credentials([{"name": "cf", "value": "1"}], {})
+
+        async with handler._using_site_session() as old_session:
+            handler.cache_credentials([{"name": "cf", "value": "2"}], {})
+            new_session = await handler._get_site_session()
+
+            assert new_session is not old_session
+            assert not old_session.closed
+
+        assert old_session.closed
+        await handler.aclose()
+        assert new_session.closed
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_aclose_closes_sessions(self, stub_unflare):
+        """Test that aclose() closes both sessions"""
+        handler = UnflareRequestHandler(UnflareConfig(url=stub_unflare.scrape_url))
+        await handler.get(stub_unflare.site_url(), {})
+        sessions = (handler._service_session, handler._site_session)
+
+        await handler.aclose()
+
+        assert all(session.closed for session in sessions)
+        assert handler._site_session is None
+
+
+class TestCredentialRefresh:
+    """Test that concurrent requests share one Unflare solve"""
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_cold_cache_solves_once(self, stub_unflare, stub_unflare_handler):
+        """Test that many concurrent requests on a cold cache solve once"""
+        handler = stub_unflare_handler
+
+        results = await asyncio.gather(
+            *(handler.get(stub_unflare.site_url(f"p{i}"), {}) for i in range(50))
         )
-        mock_response.text = AsyncMock(return_value="<html>OK</html>")
-        mock_response.__aenter__ = AsyncMock(return_value=mock_response)
-        mock_response.__aexit__ = AsyncMock(return_value=False)
-
-        mock_session = AsyncMock()
-        mock_session.post = MagicMock(return_value=mock_response)
-        mock_session.get = MagicMock(return_value=mock_response)
-        mock_session.__aenter__ = AsyncMock(return_value=mock_session)
-        mock_session.__aexit__ = AsyncMock(return_value=False)
-
-        with patch("aiohttp.ClientSession", return_value=mock_session) as mock_cls:
-            await handler._refresh_cache_and_request(
-                "http://example.com", {"User-Agent": "test"}
+
+        assert results == [stub_unflare.page] * 50
+        assert stub_unflare.scrape_calls == 1
+        assert stub_unflare.site_requests == 50
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_rejected_credentials_solve_once(
+        self, stub_unflare, stub_unflare_handler
+    ):
+        """Test that concurrent 403s on stale cookies trigger one new solve"""
+        handler = stub_unflare_handler
+        await handler.get(stub_unflare.site_url(), {})
+        stub_unflare.clearance = "rotated"
+
+        results = await asyncio.gather(
+            *(handler.get(stub_unflare.site_url(f"p{i}"), {}) for i in range(20))
+        )
+
+        assert results == [stub_unflare.page] * 20
+        assert stub_unflare.scrape_calls == 2
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_requests_after_refresh_use_cache(
+        self, stub_unflare, stub_unflare_handler
+    ):
+        """Test that requests after a solve take the cached path"""
+        handler = stub_unflare_handler
+
+        await handler.get(stub_unflare.site_url(), {})
+        await handler.get(stub_unflare.site_url(), {})
+
+        assert stub_unflare.scrape_calls == 1
+        assert handler.has_cached_cookies
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_failed_solve_is_shared(self):
+        """Test that waiters share a failed solve instead of queueing more"""
+        handler = UnflareRequestHandler(UnflareConfig())
+
+        async def failed_solve(_url):
+            await asyncio.sleep(0.01)
+            return HandlerResponse(status=502)
+
+        with patch.object(
+            handler, "_refresh_credentials", side_effect=failed_solve
+        ) as mock_refresh:
+            results = await asyncio.gather(
+                *(handler.fetch("http://example.com", {}) for _ in range(10))
+            )
+
+        assert [result.status for result in results] == [502] * 10
+        assert mock_refresh.call_count == 1
+
+
+class TestBackgroundRefresh:
+    """Test proactive credential refresh before expiry"""
+
+    @staticmethod
+    def short_lived(stub_unflare, refresh_at=0.5):
+        """Handler config for credentials that expire about 0.4s after a solve."""
+        # cache_credentials keeps a 300s safety buffer before cookie expiry
+        stub_unflare.lifetime = 300.4
+        return UnflareConfig(url=stub_unflare.scrape_url, refresh_at=refresh_at)
+
+    @pytest.mark.unit
+    def test_refresh_at_must_be_a_fraction(self):
+        """Test that refresh_at is validated"""
+        with pytest.raises(ValueError):
+            UnflareConfig(refresh_at=1.5)
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_refreshes_before_expiry(self, stub_unflare):
+        """Test that credentials are re-solved in the background before expiry"""
+        async with UnflareRequestHandler(self.short_lived(stub_unflare)) as handler:
+            await handler.get(stub_unflare.site_url(), {})
+            first_expiry = handler.cache_expiry_time
+
+            await asyncio.sleep(0.3)
+
+            assert stub_unflare.scrape_calls == 2
+            assert handler.cache_expiry_time > first_expiry
+            assert handler.is_cache_valid()
+            # Requests keep taking the cached path with the new credentials
+            assert await handler.get(stub_unflare.site_url(), {}) == stub_unflare.page
+            assert stub_unflare.scrape_calls == 2
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_old_credentials_serve_requests_during_refresh(self, stub_unflare):
+        """Test that requests during a background solve don't wait for it"""
+        stub_unflare.solve_delay = 0.2
+        async with UnflareRequestHandler(self.short_lived(stub_unflare)) as handler:
+            await handler.get(stub_unflare.site_url(), {})
+            await asyncio.sleep(0.25)
+            assert handler._refreshes.in_flight("credentials")
+
+            start = time.perf_counter()
+            await handler.fetch(stub_unflare.site_url(), {})
+
+            assert time.perf_counter() - start < 0.1
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_failed_background_refresh_is_not_retried(self, stub_unflare):
+        """Test that a failed background solve falls back to normal refreshes"""
+        async with UnflareRequestHandler(self.short_lived(stub_unflare)) as handler:
+            await handler.get(stub_unflare.site_url(), {})
+            stub_unflare.scrape_status = 502
+
+            await asyncio.sleep(0.3)
+            await handler.get(stub_unflare.site_url(), {})
+            await asyncio.sleep(0.05)
+
+            assert stub_unflare.scrape_calls == 2
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_disabled_by_default(self, stub_unflare, stub_unflare_handler):
+        """Test that no background refresh runs without refresh_at"""
+        await stub_unflare_handler.get(stub_unflare.site_url(), {})
+
+        assert stub_unflare_handler._background_refresh is None
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_aclose_cancels_background_refresh(self, stub_unflare):
+        """Test that closing the handler cancels the pending refresh"""
+        handler = UnflareRequestHandler(self.short_lived(stub_unflare, 0.9))
+        await handler.get(stub_unflare.site_url(), {})
+        task = handler._background_refresh
+
+        await handler.aclose()
+        await asyncio.sleep(0.4)
+
+        assert task.cancelled()
+        assert stub_unflare.scrape_calls == 1
+
+
+class TestUnflareBody:
+    """Test answering cache misses with the page Unflare loaded"""
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_uses_unflare_body_when_present(
+        self, stub_unflare, stub_unflare_handler
+    ):
+        """Test that a solve returning the page skips the second request"""
+        stub_unflare.scrape_body = "<html>From Unflare</html>"
+
+        result = await stub_unflare_handler.get(stub_unflare.site_url(), {})
+
+        assert result == "<html>From Unflare</html>"
+        assert stub_unflare.site_requests == 0
+        assert stub_unflare_handler.path_counts == {
+            "cached": 0,
+            "unflare_body": 1,
+            "refetch": 0,
+        }
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_refetches_when_body_absent(self, stub_unflare, stub_unflare_handler):
+        """Test the fallback to a second request, then the cached path"""
+        await stub_unflare_handler.get(stub_unflare.site_url(), {})
+        await stub_unflare_handler.get(stub_unflare.site_url(), {})
+
+        assert stub_unflare.site_requests == 2
+        assert stub_unflare_handler.path_counts == {
+            "cached": 1,
+            "unflare_body": 0,
+            "refetch": 1,
+        }
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_body_field_none_always_refetches(self, stub_unflare):
+        """Test that the Unflare body can be ignored"""
+        stub_unflare.scrape_body = "<html>From Unflare</html>"
+        config = UnflareConfig(url=stub_unflare.scrape_url, body_field=None)
+
+        async with UnflareRequestHandler(config) as handler:
+            result = await handler.get(stub_unflare.site_url(), {})
+
+        assert result == stub_unflare.page
+        assert handler.path_counts["refetch"] == 1
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_only_the_solving_request_uses_the_body(
+        self, stub_unflare, stub_unflare_handler
+    ):
+        """Test that requests sharing a solve fetch their own pages"""
+        stub_unflare.scrape_body = "<html>From Unflare</html>"
+
+        results = await asyncio.gather(
+            *(
+                stub_unflare_handler.get(stub_unflare.site_url(f"p{i}"), {})
+                for i in range(5)
             )
+        )
 
-            # The final session (second call) should have Accept-Encoding in headers
-            final_call = mock_cls.call_args_list[-1]
-            _, kwargs = final_call
-            assert "headers" in kwargs
-            assert kwargs["headers"]["Accept-Encoding"] == "gzip, deflate, br"
+        assert results.count("<html>From Unflare</html>") == 1
+        assert results.count(stub_unflare.page) == 4
+        assert stub_unflare.scrape_calls == 1
+        assert stub_unflare_handler.path_counts["refetch"] == 4
@@ -0,0 +1,200 @@
+"""Unit tests for the Unflare endpoint pool."""
+
+import asyncio
+import time
+from unittest.mock import AsyncMock
+
+import pytest
+
+from pro_sports_transactions.handlers import (
+    HandlerResponse,
+    RetryPolicy,
+    UnflareEndpoint,
+    UnflarePoolConfig,
+    UnflarePoolRequestHandler,
+)
+
+
+def mock_pool(*inners, **config) -> UnflarePoolRequestHandler:
+    """Pool whose endpoints answer through the fetches of the given handlers."""
+    handler = UnflarePoolRequestHandler(
+        UnflarePoolConfig(
+            endpoints=[f"http://unflare-{i}/scrape" for i in range(len(inners))],
+            **config,
+        )
+    )
+    for member, inner in zip(handler.members, inners, strict=True):
+        member.fetch = inner.fetch
+    return handler
+
+
+class TestUnflarePool:
+    """Test the UnflarePoolRequestHandler"""
+
+    @pytest.mark.unit
+    def test_requires_endpoints(self):
+        """Test that a pool needs at least one endpoint"""
+        with pytest.raises(ValueError):
+            UnflarePoolConfig()
+
+    @pytest.mark.unit
+    def test_endpoints_get_their_own_handlers(self):
+        """Test per-endpoint URLs and proxies"""
+        proxy = {"host": "proxy.example.com", "port": 8080}
+        handler = UnflarePoolRequestHandler(
+            UnflarePoolConfig(
+                endpoints=[
+                    "http://a/scrape",
+                    UnflareEndpoint("http://b/scrape", proxy=proxy),
+                ],
+                timeout=1000,
+            )
+        )
+
+        assert [m.config.url for m in handler.members] == [
+            "http://a/scrape",
+            "http://b/scrape",
+        ]
+        assert handler.members[1].config.proxy == proxy
+        assert all(m.config.timeout == 1000 for m in handler.members)
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_balances_across_endpoints_with_independent_credentials(
+        self, stub_unflare_pool
+    ):
+        """Test that concurrent requests spread out and each endpoint solves once"""
+        site = stub_unflare_pool[0]
+        async with UnflarePoolRequestHandler(
+            UnflarePoolConfig(endpoints=[stub.scrape_url for stub in stub_unflare_pool])
+        ) as handler:
+            results = await asyncio.gather(
+                *(handler.get(site.site_url(f"p{i}"), {}) for i in range(30))
+            )
+
+            cookies = {member._cached_cookies for member in handler.members}
+
+        assert results == [site.page] * 30
+        assert [stub.scrape_calls for stub in stub_unflare_pool] == [1, 1, 1]
+        assert [health.requests for health in handler.health] == [10, 10, 10]
+        assert len(cookies) == 3
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_ejects_failing_endpoint(self, stub_unflare_pool):
+        """Test that an endpoint whose solves fail is ejected"""
+        site = stub_unflare_pool[0]
+        stub_unflare_pool[1].scrape_status = 502
+        config = UnflarePoolConfig(
+            endpoints=[stub.scrape_url for stub in stub_unflare_pool],
+            min_requests=1,
+            retry_policy=RetryPolicy(backoff_base=0.001, backoff_cap=0.001),
+        )
+        async with UnflarePoolRequestHandler(config) as handler:
+            for page in range(12):
+                assert await handler.get(site.site_url(f"p{page}"), {}) == site.page
+
+            assert handler.health[1].ejected
+            assert not handler.health[0].ejected
+            assert stub_unflare_pool[1].scrape_calls == 1
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_endpoints_use_policy_timeouts(self, stub_unflare):
+        """Test that the retry policy's read timeout limits endpoint requests"""
+        stub_unflare.site_delay = 1.0
+        config = UnflarePoolConfig(
+            endpoints=[stub_unflare.scrape_url],
+            retry_policy=RetryPolicy(max_attempts=1, read_timeout=0.1),
+        )
+        async with UnflarePoolRequestHandler(config) as handler:
+            start_time = time.monotonic()
+            response = await handler.fetch(stub_unflare.site_url(), {})
+
+        assert response.status == 0
+        assert time.monotonic() - start_time < stub_unflare.site_delay
+        assert handler.members[0].config.retry_policy.max_attempts == 1
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_ejects_slow_endpoint(self, scripted):
+        """Test that an endpoint whose latency exceeds the limit is ejected"""
+        fast, slow = scripted(), scripted(delay=0.05)
+        handler = mock_pool(fast, slow, min_requests=2, max_latency=0.02)
+
+        for _ in range(3):
+            await asyncio.gather(*(handler.get("http://site/", {}) for _ in range(2)))
+
+        assert handler.health[1].ejected
+        assert not handler.health[0].ejected
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_prefers_healthier_endpoint_when_idle(self, scripted):
+        """Test that sequential requests favour the endpoint with fewer errors"""
+        failing = scripted(HandlerResponse(status=503))
+        healthy = scripted()
+        handler = mock_pool(failing, healthy, min_requests=100)
+
+        for _ in range(5):
+            await handler.fetch("http://site/", {})
+
+        assert failing.fetch.await_count == 1
+        assert healthy.fetch.await_count == 4
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_ejected_endpoint_returns_with_clean_record(self, scripted):
+        """Test that an endpoint is readmitted once the ejection expires"""
+        failing = scripted(HandlerResponse(status=503))
+        handler = mock_pool(failing, scripted(), min_requests=1, ejection_time=0.05)
+
+        await handler.fetch("http://site/", {})
+        assert handler.health[0].ejected
+
+        await asyncio.sleep(0.06)
+
+        assert not handler.health[0].ejected
+        assert handler.health[0].error_rate == 0.0
+        assert handler._choose() == 0
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_serves_when_every_endpoint_is_ejected(self, scripted):
+        """Test that the endpoint due back first keeps serving"""
+        handler = mock_pool(
+            scripted(HandlerResponse(status=503)),
+            scripted(HandlerResponse(status=503)),
+            min_requests=1,
+        )
+
+        await asyncio.gather(*(handler.fetch("http://site/", {}) for _ in range(2)))
+
+        assert all(health.ejected for health in handler.health)
+        assert (await handler.fetch("http://site/", {})).status == 503
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_exceptions_count_as_errors(self, scripted):
+        """Test that an exception is recorded against the endpoint and re-raised"""
+        broken = scripted(ConnectionError("down"))
+        handler = mock_pool(broken, min_requests=100)
+
+        with pytest.raises(ConnectionError):
+            await handler.fetch("http://site/", {})
+
+        assert handler.health[0].error_rate == 1.0
+        assert handler.health[0].in_flight == 0
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_aclose_closes_every_endpoint(self, scripted):
+        """Test that closing the pool closes each endpoint's handler"""
+        handler = mock_pool(scripted(), scripted())
+        for member in handler.members:
+            member.aclose = AsyncMock()
+
+        await handler.aclose()
+
+        for member in handler.members:
+            member.aclose.assert_awaited_once()
@@ -0,0 +1,186 @@
+"""Unit tests for batch searches."""
+
+from urllib import parse
+
+import pytest
+
+from pro_sports_transactions.batch import SearchBatch, SearchSpec, search_many
+from pro_sports_transactions.handlers import MemoryCacheRequestHandler
+from pro_sports_transactions.search import League, TransactionType, UrlBuilder
+
+
+@pytest.mark.unit
+def test_search_spec_is_hashable_and_builds_url():
+    """Test that specs key results and build the same URL as UrlBuilder."""
+    spec = SearchSpec(
+        league=League.MLB,
+        transaction_types=[TransactionType.InjuredList],
+        team="Mets",
+    )
+
+    assert spec == SearchSpec(
+        league=League.MLB,
+        transaction_types=(TransactionType.InjuredList,),
+        team="Mets",
+    )
+    assert len({spec, spec}) == 1
+    assert spec.url == UrlBuilder.build(
+        league=League.MLB,
+        transaction_types=(TransactionType.InjuredList,),
+        team="Mets",
+        starting_row=0,
+    )
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_search_many_returns_results_keyed_by_spec(paged_handler):
+    """Test that every spec's result is returned under its own key."""
+    handler = paged_handler(pages=1, last_page_rows=2)
+    specs = [SearchSpec(league=league, team="Team") for league in League]
+
+    batch = await search_many(specs, request_handler=handler)
+
+    assert set(batch.results) == set(specs)
+    assert not batch.errors
+    assert [len(df) for df in batch.results.values()] == [2] * len(specs)
+    requested = {parse.urlparse(url).path.split("/")[1] for url in handler.urls}
+    assert requested == {league.value for league in League}
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_search_many_caps_concurrency(paged_handler):
+    """Test that the global cap bounds requests in flight across searches."""
+    handler = paged_handler(pages=1, delay=0.01)
+    specs = [SearchSpec(team=f"Team {i}") for i in range(20)]
+
+    await search_many(specs, request_handler=handler, max_concurrency=4)
+
+    assert handler.max_in_flight == 4
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_search_many_caps_per_host(paged_handler):
+    """Test that the per-host cap bounds requests to one host."""
+    handler = paged_handler(pages=1, delay=0.01)
+    specs = [SearchSpec(team=f"Team {i}") for i in range(20)]
+
+    await search_many(
+        specs, request_handler=handler, max_concurrency=10, per_host_limit=2
+    )
+
+    assert handler.max_in_flight == 2
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_search_many_uses_parsed_result_wrappers(paged_handler):
+    """Test that a cache in the shared handler serves repeated batches."""
+    inner = paged_handler(pages=1, delay=0.01)
+    handler = MemoryCacheRequestHandler(inner)
+    specs = [SearchSpec(team="Lakers")]
+
+    for _ in range(3):
+        batch = await search_many(
+            specs, request_handler=handler, max_concurrency=1, per_host_limit=1
+        )
+
+    assert len(batch.results[specs[0]]) == 25
+    assert (handler.hits, handler.misses) == (2, 1)
+    assert len(inner.urls) == 1
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_search_many_all_pages(paged_handler):
+    """Test that all_pages fetches every page of each search."""
+    handler = paged_handler(pages=3)
+    specs = [SearchSpec(team="Lakers"), SearchSpec(team="Celtics")]
+
+    batch = await search_many(specs, request_handler=handler, all_pages=True)
+
+    assert [len(batch.results[spec]) for spec in specs] == [75, 75]
+    assert len(handler.urls) == 6
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_search_many_reports_errors_per_spec(paged_handler):
+    """Test that failures are reported against the spec that caused them."""
+
+    class FailingHandler(paged_handler):
+        async def get(self, url, headers):
+            team = parse.parse_qs(parse.urlparse(url).query)["Team"][0]
+            if team == "Raises":
+                raise ConnectionError("connection reset")
+            if team == "Blocked":
+                return None
+            return await super().get(url, headers)
+
+    ok, raises, blocked = (
+        SearchSpec(team="Lakers"),
+        SearchSpec(team="Raises"),
+        SearchSpec(team="Blocked"),
+    )
+
+    batch = await search_many(
+        [ok, raises, blocked], request_handler=FailingHandler(pages=1)
+    )
+
+    assert set(batch.results) == {ok, blocked}
+    assert batch.errors == {
+        raises: ("ConnectionError('connection reset')",),
+        blocked: ("TypeError(\"cannot parse from 'NoneType'\")",),
+    }
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_search_batch_runs_duplicate_specs_once(paged_handler):
+    """Test that a spec listed twice is only searched once."""
+    handler = paged_handler(pages=1)
+    spec = SearchSpec(team="Lakers")
+
+    batch = await SearchBatch([spec, spec], request_handler=handler).run()
+
+    assert list(batch.results) == [spec]
+    assert len(handler.urls) == 1
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_search_batch_closes_its_own_handler(paged_handler, monkeypatch):
+    """Test that a default handler is pooled with the batch limits and closed."""
+    created = []
+
+    class OwnedHandler(paged_handler):
+        def __init__(self, config):
+            super().__init__(pages=1)
+            self.config = config
+            self.closed = False
+            created.append(self)
+
+        async def aclose(self):
+            self.closed = True
+
+    monkeypatch.setattr(
+        "pro_sports_transactions.batch.DirectRequestHandler", OwnedHandler
+    )
+
+    await search_many([SearchSpec()], max_concurrency=8, per_host_limit=3)
+
+    assert len(created) == 1
+    assert created[0].config.limit == 8
+    assert created[0].config.limit_per_host == 3
+    assert created[0].closed
+
+
+@pytest.mark.unit
+def test_search_batch_rejects_invalid_limits():
+    """Test that concurrency limits must be positive."""
+    with pytest.raises(ValueError):
+        SearchBatch([], max_concurrency=0)
+    with pytest.raises(ValueError):
+        SearchBatch([], per_host_limit=0)
@@ -0,0 +1,61 @@
+"""Unit tests for importing pandas and lxml only on the paths that use them."""
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+SRC_DIR = Path(__file__).parent.parent.parent / "src"
+DATA_DIR = Path(__file__).parent / "data"
+HEAVY_MODULES = ("pandas", "numpy", "lxml", "html5lib", "bs4")
+
+SCRIPT = """
+import json, sys
+from pathlib import Path
+
+def loaded():
+    return sorted(m for m in {heavy!r} if m in sys.modules)
+
+steps = {{}}
+import pro_sports_transactions as pst
+from pro_sports_transactions.search import (
+    Search, UrlBuilder, results_dict, results_frame, results_records
+)
+UrlBuilder.build(league=pst.League.NBA)
+steps["import"] = loaded()
+
+page = Search._parse(Path({page!r}).read_text("utf-8"))
+json.dumps(results_dict(page))
+results_records(page)
+steps["json"] = loaded()
+
+results_frame(page)
+steps["dataframe"] = loaded()
+print(json.dumps(steps))
+"""
+
+
+@pytest.mark.unit
+def test_heavy_dependencies_load_on_first_use():
+    """Test that importing loads neither pandas nor lxml, and JSON skips pandas."""
+    script = SCRIPT.format(
+        heavy=HEAVY_MODULES, page=str(DATA_DIR / "valid_response.html")
+    )
+    env = {**os.environ, "PYTHONPATH": str(SRC_DIR)}
+
+    output = subprocess.run(
+        [sys.executable, "-c", script],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+
+    assert json.loads(output) == {
+        "import": [],
+        "json": ["lxml"],
+        "dataframe": ["lxml", "numpy", "pandas"],
+    }
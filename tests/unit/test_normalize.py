@@ -0,0 +1,75 @@
+"""Unit tests for player-level normalization of search results."""
+
+import pandas as pd
+import pytest
+
+from pro_sports_transactions.normalize import PLAYER_COLUMNS, player_rows
+from pro_sports_transactions.search import Search, results_frame
+
+
+def results(*rows):
+    """A results DataFrame holding ``rows``, as Search returns it."""
+    df = pd.DataFrame(
+        list(rows), columns=["Date", "Team", "Acquired", "Relinquished", "Notes"]
+    )
+    df.attrs["pages"] = 1
+    return df
+
+
+@pytest.mark.unit
+def test_one_row_per_transaction_player_and_direction():
+    """Test exploding trades, stripping bullets and aliases, and row order."""
+    df = results(
+        (
+            "2023-02-09",
+            "Nets",
+            "• Mikal Bridges • Cameron Johnson (Cam Johnson)",
+            "• Kevin Durant • T.J. Warren",
+            "trade with Suns",
+        ),
+        ("2023-02-15", "Lakers", "• LeBron James", "", "activated from IL"),
+        ("2023-02-16", "Lakers", "", "", "no players"),
+    )
+
+    rows = player_rows(df)
+
+    assert list(rows.columns) == list(PLAYER_COLUMNS)
+    assert rows[["Transaction", "Player", "Direction"]].values.tolist() == [
+        [0, "Mikal Bridges", "Acquired"],
+        [0, "Cameron Johnson", "Acquired"],
+        [0, "Kevin Durant", "Relinquished"],
+        [0, "T.J. Warren", "Relinquished"],
+        [1, "LeBron James", "Acquired"],
+    ]
+    assert rows.loc[4, ["Date", "Team", "Notes"]].tolist() == [
+        "2023-02-15",
+        "Lakers",
+        "activated from IL",
+    ]
+    assert rows.attrs == {"pages": 1}
+
+
+@pytest.mark.unit
+def test_pages_that_failed_keep_their_errors():
+    """Test that an empty result normalizes to an empty frame with its errors."""
+    rows = player_rows(results_frame(Search._parse(None)))
+
+    assert rows.empty
+    assert list(rows.columns) == list(PLAYER_COLUMNS)
+    assert rows.attrs["errors"]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_search_player_dataframes(paged_handler):
+    """Test the single-page and all-pages player outputs of a Search."""
+    search = Search(request_handler=paged_handler(pages=2, last_page_rows=5))
+
+    page = await search.get_player_dataframe()
+    every_page = await search.get_all_player_dataframe()
+
+    assert len(page) == 25
+    assert len(every_page) == 30
+    assert set(every_page["Player"]) == {"LeBron James"}
+    assert every_page["Transaction"].tolist() == list(range(30))
+    assert every_page.attrs["pages"] == 2
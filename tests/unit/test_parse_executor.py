@@ -0,0 +1,138 @@
+"""Unit tests for parsing search results in a worker pool."""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from pathlib import Path
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from pro_sports_transactions import ParseExecutor, SearchSpec, search_many
+from pro_sports_transactions.handlers import (
+    MemoryCacheConfig,
+    MemoryCacheRequestHandler,
+    RequestHandler,
+)
+from pro_sports_transactions.parser import parse_results
+from pro_sports_transactions.search import Search
+from pro_sports_transactions.sharding import ShardedSearch
+
+DATA_DIR = Path(__file__).parent / "data"
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+@pytest.mark.parametrize("processes", [False, True])
+async def test_pool_results_match_inline_parse(paged_handler, processes):
+    """Test that thread and process pools parse pages like the event loop."""
+    inline = await Search(request_handler=paged_handler(3)).get_all_dataframe()
+
+    with ParseExecutor(processes=processes, max_workers=2) as executor:
+        search = Search(request_handler=paged_handler(3), parse_executor=executor)
+        pooled = await search.get_all_dataframe()
+
+    assert pooled.equals(inline)
+    assert pooled.attrs == inline.attrs
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_parses_off_the_event_loop(paged_handler):
+    """Test that pages are parsed on a worker thread."""
+    threads = set()
+
+    def record_thread(page):
+        threads.add(threading.current_thread())
+        return parse_results(page)
+
+    with ParseExecutor() as executor:
+        with patch("pro_sports_transactions.parser.parse_results", record_thread):
+            search = Search(request_handler=paged_handler(2), parse_executor=executor)
+            await search.get_all_dataframe()
+
+    assert threads and threading.current_thread() not in threads
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "page, error",
+    [
+        (
+            (DATA_DIR / "empty_response.html").read_text("utf-8"),
+            "ValueError('No tables found')",
+        ),
+        (None, "TypeError(\"cannot parse from 'NoneType'\")"),
+    ],
+)
+async def test_parse_errors_are_reported(page, error):
+    """Test that pages failing to parse in the pool report the same errors."""
+    handler = AsyncMock()
+    handler.get_parsed = partial(RequestHandler.get_parsed, handler)
+    handler.get.return_value = page
+
+    with ParseExecutor() as executor:
+        search = Search(request_handler=handler, parse_executor=executor)
+        df = await search.get_dataframe()
+
+    assert df.empty
+    assert df.attrs == {"pages": 0, "errors": (error,)}
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_cache_is_shared_by_searches_using_one_executor(paged_handler):
+    """Test that parsed results cached for one search serve the next."""
+    paged = paged_handler(1, last_page_rows=5)
+    handler = MemoryCacheRequestHandler(paged, MemoryCacheConfig(ttl=60))
+
+    with ParseExecutor() as executor:
+        for _ in range(2):
+            await Search(request_handler=handler, parse_executor=executor).get_dict()
+
+    assert len(paged.urls) == 1
+    assert handler.hits == 1
+
+
+class CountingParseExecutor(ParseExecutor):
+    """ParseExecutor counting the pages it parses."""
+
+    def __init__(self):
+        super().__init__(max_workers=1)
+        self.pages = 0
+
+    async def parse_results(self, page):
+        self.pages += 1
+        return await super().parse_results(page)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_batch_and_shards_parse_in_the_pool(paged_handler):
+    """Test that batches and sharded searches pass the executor to searches."""
+    with CountingParseExecutor() as executor:
+        batch = await search_many(
+            [SearchSpec(team="Lakers"), SearchSpec(team="Celtics")],
+            request_handler=paged_handler(1),
+            parse_executor=executor,
+        )
+        assert executor.pages == 2
+
+        await ShardedSearch(
+            request_handler=paged_handler(1), parse_executor=executor
+        ).get_dataframe()
+        assert executor.pages == 3
+
+    assert not batch.errors
+
+
+@pytest.mark.unit
+def test_shutdown_leaves_given_executor_running():
+    """Test that only pools created by the ParseExecutor are shut down."""
+    pool = ThreadPoolExecutor(max_workers=1)
+    with ParseExecutor(pool) as executor:
+        assert executor.executor is pool
+
+    assert pool.submit(int, "1").result() == 1
+    pool.shutdown()
@@ -0,0 +1,102 @@
+"""Unit tests for the search results parser."""
+
+from pathlib import Path
+
+import pytest
+
+from pro_sports_transactions.parser import ResultsPage, parse_results
+
+DATA_DIR = Path(__file__).parent / "data"
+
+
+@pytest.mark.unit
+def test_parses_fixture_page():
+    """Test rows and page count of a real results page."""
+    page = parse_results((DATA_DIR / "valid_response.html").read_text("utf-8"))
+
+    assert page == ResultsPage(
+        rows=(
+            ("2023-02-15", "Lakers", "• LeBron James", "", "activated from IL"),
+            (
+                "2023-02-27",
+                "Lakers",
+                "",
+                "• LeBron James",
+                "placed on IL with right foot injury",
+            ),
+            ("2023-03-26", "Lakers", "• LeBron James", "", "activated from IL"),
+        ),
+        pages=1,
+    )
+
+
+@pytest.mark.unit
+def test_reads_last_page_from_pager(results_page):
+    """Test the page count of a multi-page search."""
+    page = parse_results(results_page([("2023-02-15", "Lakers", "", "", "")], 12))
+
+    assert page.pages == 12
+
+
+@pytest.mark.unit
+def test_normalises_cell_text_like_read_html():
+    """Test nested markup, line breaks, and runs of whitespace in cells."""
+    page = parse_results(
+        """<table class="datatable"><tr>
+        <td>&nbsp;Date</td><td>Team</td><td>Acquired</td>
+        <td>Relinquished</td><td>Notes</td></tr>
+        <tr><td>2023-02-15</td><td> Lakers </td>
+        <td> • <a href="#">LeBron</a>&nbsp;James</td><td></td>
+        <td>placed on IL\n  with   right foot\tinjury</td></tr>
+        </table>
+        <table><tr><td></td><td></td><td> 1 2</td></tr></table>"""
+    )
+
+    assert page.rows == (
+        (
+            "2023-02-15",
+            "Lakers",
+            "• LeBron\xa0James",
+            "",
+            # read_html replaces the line break and the spaces after it apart
+            "placed on IL  with right foot\tinjury",
+        ),
+    )
+    assert page.pages == 2
+
+
+@pytest.mark.unit
+def test_finds_columns_by_header():
+    """Test that columns are matched by name and missing ones are empty."""
+    page = parse_results(
+        """<table class="datatable center">
+        <tr><th>Team</th><th>Date</th><th>Notes</th></tr>
+        <tr><td>Lakers</td><td>2023-02-15</td><td>activated from IL</td></tr>
+        </table>
+        <table><tr><td></td><td></td><td>1</td></tr></table>"""
+    )
+
+    assert page.rows == (("2023-02-15", "Lakers", "", "", "activated from IL"),)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "html, error",
+    [
+        ("", ValueError("No tables found")),
+        ((DATA_DIR / "empty_response.html").read_text("utf-8"), None),
+        ("<table><tr><td>Layout</td></tr></table>", None),
+        (
+            '<table class="datatable"><tr><td>Date</td></tr></table>',
+            IndexError("list index out of range"),
+        ),
+    ],
+)
+def test_rejects_pages_without_results(html, error):
+    """Test the errors for pages without a results table or pager."""
+    expected = error or ValueError("No tables found")
+
+    with pytest.raises(type(expected)) as raised:
+        parse_results(html)
+
+    assert repr(raised.value) == repr(expected)
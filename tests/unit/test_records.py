@@ -0,0 +1,76 @@
+"""Unit tests for Transaction records and the pandas-free result views."""
+
+import dataclasses
+import json
+from datetime import date
+from unittest.mock import patch
+
+import pytest
+
+from pro_sports_transactions import Transaction
+from pro_sports_transactions.search import Search
+
+ROW = ("2023-02-15", "Lakers", "• LeBron James", "", "activated from IL")
+
+
+@pytest.mark.unit
+def test_transaction_from_row():
+    """Test typed fields, the dictionary format, and slots."""
+    transaction = Transaction.from_row(ROW)
+
+    assert transaction == Transaction(
+        date(2023, 2, 15), "Lakers", "• LeBron James", "", "activated from IL"
+    )
+    assert transaction.to_dict() == {
+        "Date": "2023-02-15",
+        "Team": "Lakers",
+        "Acquired": "• LeBron James",
+        "Relinquished": "",
+        "Notes": "activated from IL",
+    }
+    assert not hasattr(transaction, "__dict__")
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        transaction.team = "Celtics"
+
+
+@pytest.mark.unit
+def test_transaction_rejects_non_iso_dates():
+    """Test that a malformed date is reported rather than kept as text."""
+    with pytest.raises(ValueError):
+        Transaction.from_row(("02/15/2023", *ROW[1:]))
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_records_match_dataframe(paged_handler):
+    """Test that records, dicts, and the DataFrame hold the same results."""
+    search = Search(request_handler=paged_handler(pages=3, last_page_rows=5))
+
+    records = await search.get_all_records()
+    data = await search.get_all_dict()
+    df = await search.get_all_dataframe()
+
+    assert len(records) == 2 * 25 + 5
+    assert [record.to_dict() for record in records] == data["transactions"]
+    assert data["transactions"] == df.to_dict(orient="records")
+    assert [r.to_dict() for r in await search.get_records()] == (
+        data["transactions"][:25]
+    )
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_dict_json_and_records_skip_pandas(paged_handler):
+    """Test that only get_dataframe builds a DataFrame."""
+    search = Search(request_handler=paged_handler(pages=2, last_page_rows=5))
+
+    with patch("pandas.DataFrame") as frame:
+        await search.get_all_records()
+        data = json.loads(await search.get_all_json())
+        await search.get_dict()
+        await search.refresh()
+        await search.get_json()
+        frame.assert_not_called()
+
+    assert data["pages"] == 2
+    assert len(data["transactions"]) == 30
@@ -0,0 +1,149 @@
+"""Unit tests for streaming search results."""
+
+import asyncio
+
+import pytest
+
+from pro_sports_transactions.search import Search
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_iter_transactions_yields_every_row_in_order(paged_handler):
+    """Test that rows from every page are yielded in page order."""
+    handler = paged_handler(pages=4, last_page_rows=7)
+
+    notes = [
+        record["Notes"]
+        async for record in Search(request_handler=handler).iter_transactions()
+    ]
+
+    assert notes == [f"row {i}" for i in range(82)]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_iter_transactions_uses_column_schema(paged_handler):
+    """Test that records carry the search result columns."""
+    search = Search(request_handler=paged_handler(pages=1, last_page_rows=1))
+
+    records = [record async for record in search.iter_transactions()]
+
+    assert records == [
+        {
+            "Date": "2023-02-15",
+            "Team": "Lakers",
+            "Acquired": "• LeBron James",
+            "Relinquished": "",
+            "Notes": "row 0",
+        }
+    ]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_iter_transactions_reads_ahead_within_window(paged_handler):
+    """Test that pages are fetched ahead, but never more than the window."""
+    handler = paged_handler(pages=10, delay=0.01)
+    search = Search(request_handler=handler)
+
+    fetched_while_consuming = []
+    async for record in search.iter_transactions(max_pages_in_flight=3):
+        if record["Notes"].endswith("0"):
+            # Give read-ahead tasks a chance to start before sampling
+            await asyncio.sleep(0)
+            fetched_while_consuming.append(len(handler.urls))
+
+    # First page plus a full read-ahead window is requested before the
+    # consumer has finished the first page...
+    assert fetched_while_consuming[0] == 4
+    # ...and the window is never exceeded
+    assert handler.max_in_flight <= 3
+    assert len(handler.urls) == 10
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_iter_transactions_cancels_read_ahead_on_early_exit(paged_handler):
+    """Test that stopping early does not fetch the rest of the search."""
+    handler = paged_handler(pages=20, delay=0.01)
+    iterator = Search(request_handler=handler).iter_transactions(max_pages_in_flight=2)
+
+    async for _ in iterator:
+        break
+    await iterator.aclose()
+    await asyncio.sleep(0.05)
+
+    assert len(handler.urls) <= 3
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_iter_transactions_skips_failed_pages(paged_handler, caplog):
+    """Test that a failed page is logged and the rest are still yielded."""
+
+    class FlakyHandler(paged_handler):
+        async def get(self, url, headers):
+            if self.starting_row(url) == 25:
+                return None
+            return await super().get(url, headers)
+
+    search = Search(request_handler=FlakyHandler(pages=3))
+
+    records = [record async for record in search.iter_transactions()]
+
+    assert len(records) == 50
+    assert "Skipping page" in caplog.text
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_iter_transactions_skips_pages_that_raise(paged_handler, caplog):
+    """Test that a read-ahead page whose fetch raises is logged and skipped."""
+
+    class FailingHandler(paged_handler):
+        async def get(self, url, headers):
+            if self.starting_row(url) == 25:
+                raise ConnectionError("connection reset")
+            return await super().get(url, headers)
+
+    search = Search(request_handler=FailingHandler(pages=3))
+
+    records = [record async for record in search.iter_transactions()]
+
+    assert len(records) == 50
+    assert "connection reset" in caplog.text
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_iter_transactions_collects_read_ahead_on_early_exit(paged_handler):
+    """Test that cancelled read-ahead has finished once the iterator closes."""
+    tasks = []
+
+    class RecordingHandler(paged_handler):
+        async def get(self, url, headers):
+            if self.starting_row(url):
+                tasks.append(asyncio.current_task())
+                await asyncio.sleep(1)
+            return await super().get(url, headers)
+
+    iterator = Search(request_handler=RecordingHandler(pages=5)).iter_transactions()
+    async for _ in iterator:
+        await asyncio.sleep(0)
+        break
+    await iterator.aclose()
+
+    assert tasks
+    assert all(task.done() for task in tasks)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_iter_transactions_rejects_invalid_window(paged_handler):
+    """Test that the read-ahead window must be positive."""
+    search = Search(request_handler=paged_handler(pages=1))
+
+    with pytest.raises(ValueError):
+        async for _ in search.iter_transactions(max_pages_in_flight=0):
+            pass
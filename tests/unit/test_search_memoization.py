@@ -0,0 +1,100 @@
+"""Unit tests for reusing a search's fetched results."""
+
+import asyncio
+import json
+
+import pytest
+
+from pro_sports_transactions.search import Search
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_views_share_one_fetch(paged_handler):
+    """Test that the DataFrame, dict, and JSON views fetch the page once."""
+    handler = paged_handler(pages=1, last_page_rows=5)
+    search = Search(request_handler=handler)
+
+    df = await search.get_dataframe()
+    data = await search.get_dict()
+    as_json = await search.get_json()
+
+    assert len(handler.urls) == 1
+    assert data["transactions"] == df.to_dict(orient="records")
+    assert json.loads(as_json) == data
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_all_pages_are_fetched_once(paged_handler):
+    """Test that repeated full-result calls reuse every page."""
+    handler = paged_handler(pages=3, last_page_rows=5)
+    search = Search(request_handler=handler)
+
+    await search.get_all_dataframe()
+    await search.get_all_json()
+    await search.get_dataframe()
+
+    assert len(handler.urls) == 3
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_concurrent_calls_share_one_fetch(paged_handler):
+    """Test that concurrent first calls wait for the same fetch."""
+    handler = paged_handler(pages=1, last_page_rows=5, delay=0.01)
+    search = Search(request_handler=handler)
+
+    await asyncio.gather(search.get_dataframe(), search.get_dict())
+
+    assert len(handler.urls) == 1
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_callers_cannot_alter_held_results(paged_handler):
+    """Test that each call returns its own copy."""
+    search = Search(request_handler=paged_handler(pages=1, last_page_rows=5))
+
+    first = await search.get_dataframe()
+    first.loc[0, "Notes"] = "changed"
+    first.attrs["pages"] = 99
+
+    second = await search.get_dataframe()
+    assert second.loc[0, "Notes"] == "row 0"
+    assert second.attrs["pages"] == 1
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_failed_results_are_not_held(paged_handler):
+    """Test that a page that failed to parse is fetched again."""
+
+    class FlakyHandler(paged_handler):
+        async def get(self, url, headers):
+            page = await super().get(url, headers)
+            return None if len(self.urls) == 1 else page
+
+    handler = FlakyHandler(pages=1, last_page_rows=5)
+    search = Search(request_handler=handler)
+
+    assert "errors" in (await search.get_dataframe()).attrs
+    assert "errors" not in (await search.get_dataframe()).attrs
+    await search.get_dataframe()
+    assert len(handler.urls) == 2
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_refresh_refetches(paged_handler):
+    """Test that refresh() discards held results and fetches again."""
+    handler = paged_handler(pages=2, last_page_rows=5)
+    search = Search(request_handler=handler)
+    await search.get_all_dataframe()
+
+    await search.refresh()
+    df = await search.get_dataframe()
+    await search.get_all_dataframe()
+
+    assert len(df) == 25
+    assert len(handler.urls) == 2 + 1 + 1
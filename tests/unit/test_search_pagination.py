@@ -0,0 +1,128 @@
+"""Unit tests for fetching every page of a search."""
+
+import json
+import warnings
+
+import pytest
+
+from pro_sports_transactions.search import League, Search
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_get_all_dataframe_fetches_every_page_in_order(paged_handler):
+    """Test that every page is fetched and reassembled in page order."""
+    handler = paged_handler(pages=4, last_page_rows=10, delay=0.01)
+
+    df = await Search(league=League.NBA, request_handler=handler).get_all_dataframe(
+        max_concurrency=3
+    )
+
+    assert len(df) == 3 * 25 + 10
+    assert list(df["Notes"]) == [f"row {i}" for i in range(85)]
+    assert df.attrs["pages"] == 4
+    assert "errors" not in df.attrs
+    assert sorted(handler.starting_row(url) for url in handler.urls) == [
+        0,
+        25,
+        50,
+        75,
+    ]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_get_all_dataframe_respects_max_concurrency(paged_handler):
+    """Test that no more than max_concurrency pages are fetched at once."""
+    handler = paged_handler(pages=10, delay=0.01)
+
+    await Search(request_handler=handler).get_all_dataframe(max_concurrency=2)
+
+    assert handler.max_in_flight == 2
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_get_all_dataframe_starts_at_starting_row(paged_handler):
+    """Test that pages before starting_row are not fetched."""
+    handler = paged_handler(pages=3)
+
+    df = await Search(starting_row=25, request_handler=handler).get_all_dataframe()
+
+    assert list(df["Notes"]) == [f"row {i}" for i in range(25, 75)]
+    assert sorted(handler.starting_row(url) for url in handler.urls) == [25, 50]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_get_all_dataframe_single_page(paged_handler):
+    """Test that a single-page search makes exactly one request."""
+    handler = paged_handler(pages=1, last_page_rows=3)
+
+    df = await Search(request_handler=handler).get_all_dataframe()
+
+    assert len(df) == 3
+    assert len(handler.urls) == 1
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_get_all_dataframe_collects_page_errors(paged_handler):
+    """Test that errors from any page are reported on the combined result."""
+
+    class FlakyHandler(paged_handler):
+        async def get(self, url, headers):
+            if self.starting_row(url) == 25:
+                return None
+            return await super().get(url, headers)
+
+    df = await Search(request_handler=FlakyHandler(pages=3)).get_all_dataframe()
+
+    assert len(df) == 50
+    assert df.attrs["pages"] == 3
+    assert df.attrs["errors"] == ("TypeError(\"cannot parse from 'NoneType'\")",)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_get_all_dict_and_json(paged_handler):
+    """Test the dict and JSON forms of the full result."""
+    search = Search(request_handler=paged_handler(pages=2, last_page_rows=1))
+
+    data = await search.get_all_dict()
+    as_json = await search.get_all_json()
+
+    assert data["pages"] == 2
+    assert len(data["transactions"]) == 26
+    assert json.loads(as_json) == data
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_get_all_dataframe_rejects_invalid_concurrency(paged_handler):
+    """Test that max_concurrency must be positive."""
+    with pytest.raises(ValueError):
+        await Search(request_handler=paged_handler(pages=1)).get_all_dataframe(
+            max_concurrency=0
+        )
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_multi_page_calls_without_handler_share_one(paged_handler, mocker):
+    """Test that each multi-page call opens one handler instead of Http.get."""
+    handlers = []
+
+    def direct_handler():
+        handlers.append(paged_handler(pages=4))
+        return handlers[-1]
+
+    mocker.patch("pro_sports_transactions.search.DirectRequestHandler", direct_handler)
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", DeprecationWarning)
+        df = await Search().get_all_dataframe()
+        rows = [row async for row in Search().iter_transactions()]
+
+    assert len(df) == len(rows) == 100
+    assert [len(handler.urls) for handler in handlers] == [4, 4]
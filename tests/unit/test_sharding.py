@@ -0,0 +1,190 @@
+"""Unit tests for date-range sharded searches."""
+
+from datetime import date, timedelta
+from urllib import parse
+
+import pytest
+
+from pro_sports_transactions.handlers import RequestHandler
+from pro_sports_transactions.search import ROWS_PER_PAGE
+from pro_sports_transactions.sharding import (
+    DateWindow,
+    Granularity,
+    ShardedSearch,
+    plan_windows,
+)
+
+
+class DatedRequestHandler(RequestHandler):
+    """Serves ``rows_per_day`` transactions for every day of the searched range."""
+
+    def __init__(self, build_page, rows_per_day=1):
+        self.build_page = build_page
+        self.rows_per_day = rows_per_day
+        self.urls = []
+
+    async def get(self, url, headers):
+        self.urls.append(url)
+        query = parse.parse_qs(parse.urlparse(url).query)
+        day = date.fromisoformat(query["BeginDate"][0])
+        end = date.fromisoformat(query["EndDate"][0])
+        rows = []
+        while day <= end:
+            rows += [
+                (day.isoformat(), "Lakers", "• LeBron James", "", f"#{i}")
+                for i in range(self.rows_per_day)
+            ]
+            day += timedelta(days=1)
+        start = int(query["start"][0])
+        pages = max(1, -(-len(rows) // ROWS_PER_PAGE))
+        return self.build_page(rows[start : start + ROWS_PER_PAGE], pages)
+
+
+@pytest.mark.unit
+def test_plan_windows_by_month():
+    """Test that months are clipped to the requested range."""
+    windows = plan_windows(date(2023, 1, 15), date(2023, 3, 10))
+
+    assert windows == [
+        DateWindow(date(2023, 1, 15), date(2023, 1, 31)),
+        DateWindow(date(2023, 2, 1), date(2023, 2, 28)),
+        DateWindow(date(2023, 3, 1), date(2023, 3, 10)),
+    ]
+
+
+@pytest.mark.unit
+def test_plan_windows_by_week():
+    """Test that weeks run Monday to Sunday."""
+    windows = plan_windows(date(2023, 1, 4), date(2023, 1, 18), Granularity.WEEK)
+
+    assert windows == [
+        DateWindow(date(2023, 1, 4), date(2023, 1, 8)),
+        DateWindow(date(2023, 1, 9), date(2023, 1, 15)),
+        DateWindow(date(2023, 1, 16), date(2023, 1, 18)),
+    ]
+
+
+@pytest.mark.unit
+def test_plan_windows_rejects_reversed_range():
+    """Test that the end date may not precede the start date."""
+    with pytest.raises(ValueError):
+        plan_windows(date(2023, 2, 1), date(2023, 1, 1))
+
+
+@pytest.mark.unit
+def test_date_window_split():
+    """Test that splitting covers the window without overlap."""
+    first, second = DateWindow(date(2023, 1, 1), date(2023, 1, 31)).split()
+
+    assert first == DateWindow(date(2023, 1, 1), date(2023, 1, 15))
+    assert second == DateWindow(date(2023, 1, 16), date(2023, 1, 31))
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_sharded_search_returns_every_row_in_date_order(results_page):
+    """Test that shards are merged into one chronological result."""
+    handler = DatedRequestHandler(results_page, rows_per_day=2)
+
+    df = await ShardedSearch(
+        start_date=date(2023, 1, 20),
+        end_date=date(2023, 3, 5),
+        request_handler=handler,
+    ).get_dataframe()
+
+    days = (date(2023, 3, 5) - date(2023, 1, 20)).days + 1
+    assert len(df) == days * 2
+    assert list(df["Date"]) == sorted(df["Date"])
+    assert df.attrs["shards"] == 3
+    assert "errors" not in df.attrs
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_sharded_search_subdivides_deep_windows(results_page):
+    """Test that windows reporting too many pages are split into shallow shards."""
+    handler = DatedRequestHandler(results_page, rows_per_day=10)
+
+    df = await ShardedSearch(
+        start_date=date(2023, 1, 1),
+        end_date=date(2023, 1, 31),
+        request_handler=handler,
+        max_pages_per_shard=2,
+    ).get_dataframe()
+
+    assert len(df) == 310
+    assert df.attrs["shards"] > 1
+    # No shard needed more than two pages
+    starting_rows = [
+        int(parse.parse_qs(parse.urlparse(url).query)["start"][0])
+        for url in handler.urls
+    ]
+    assert max(starting_rows) < 50
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_sharded_search_drops_duplicate_rows(paged_handler):
+    """Test that rows repeated across pages are only returned once."""
+
+    class ShiftingHandler(paged_handler):
+        async def get(self, url, headers):
+            # The second page repeats the first page's last row, as happens
+            # when a row is inserted on the site mid-crawl
+            page = await super().get(url, headers)
+            if self.starting_row(url) == 25:
+                page = page.replace("row 49<", "row 24<")
+            return page
+
+    df = await ShardedSearch(
+        start_date=date(2023, 1, 1),
+        end_date=date(2023, 1, 1),
+        request_handler=ShiftingHandler(pages=3),
+    ).get_dataframe()
+
+    assert len(df) == 74
+    assert df["Notes"].is_unique
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_sharded_search_get_dict(results_page):
+    """Test the dictionary form of a sharded search."""
+    data = await ShardedSearch(
+        start_date=date(2023, 1, 30),
+        end_date=date(2023, 2, 2),
+        request_handler=DatedRequestHandler(results_page),
+    ).get_dict()
+
+    assert len(data["transactions"]) == 4
+    assert data["shards"] == 2
+    assert data["pages"] == 2
+
+
+@pytest.mark.unit
+def test_sharded_search_rejects_invalid_limits():
+    """Test that shard depth and concurrency limits must be positive."""
+    with pytest.raises(ValueError):
+        ShardedSearch(max_pages_per_shard=0)
+    with pytest.raises(ValueError):
+        ShardedSearch(max_concurrency=0)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_sharded_search_without_handler_opens_one(results_page, mocker):
+    """Test that every shard shares one handler when none is given."""
+    handlers = []
+
+    def direct_handler():
+        handlers.append(DatedRequestHandler(results_page))
+        return handlers[-1]
+
+    mocker.patch("pro_sports_transactions.search.DirectRequestHandler", direct_handler)
+
+    df = await ShardedSearch(
+        start_date=date(2023, 1, 20), end_date=date(2023, 3, 5)
+    ).get_dataframe()
+
+    assert len(df) == (date(2023, 3, 5) - date(2023, 1, 20)).days + 1
+    assert len(handlers) == 1